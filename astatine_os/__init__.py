@@ -3,7 +3,28 @@
 
 """Public package API for astatine_os."""
 
-from astatine_os.api import AnalysisResult, analyze_microclimate
+from astatine_os.api import (
+    AnalysisResult,
+    BatchAnalysisResult,
+    TimeSeriesResult,
+    analyze_many,
+    analyze_microclimate,
+    analyze_time_series,
+    split_time_range,
+    start_nowcast,
+)
+from astatine_os.nowcast import NowcastSession
 from astatine_os.version import __version__
 
-__all__ = ["AnalysisResult", "__version__", "analyze_microclimate"]
+__all__ = [
+    "AnalysisResult",
+    "BatchAnalysisResult",
+    "NowcastSession",
+    "TimeSeriesResult",
+    "__version__",
+    "analyze_many",
+    "analyze_microclimate",
+    "analyze_time_series",
+    "split_time_range",
+    "start_nowcast",
+]
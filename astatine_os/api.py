@@ -5,45 +5,133 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import random
-from dataclasses import asdict, dataclass
-from datetime import date
+import re
+import time
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Any, Protocol
 
 import dask
 import numpy as np
-from shapely.geometry import mapping
+import pyarrow as pa
+import shapely
+from shapely.ops import unary_union
 
-from astatine_os.config import get_runtime_config
+from astatine_os.config import RuntimeConfig, get_runtime_config
 from astatine_os.data.aoi import AOI, NominatimGeocoder, resolve_place
-from astatine_os.data.cache import CacheStore
-from astatine_os.data.io_raster import write_optional_cog
-from astatine_os.data.io_vector import write_geojson, write_geoparquet
+from astatine_os.data.cache import CacheStore, shared_cache_store
+from astatine_os.data.grid import RasterGrid
+from astatine_os.data.io_raster import write_blocks_cog, write_raster_zarr
+from astatine_os.data.io_summary import write_run_summary
+from astatine_os.data.io_tiles import VectorTilePyramid, write_pmtiles
+from astatine_os.data.io_vector import (
+    GeoJSONStreamWriter,
+    GeoParquetStreamWriter,
+    encode_geometries,
+    hilbert_order,
+)
+from astatine_os.data.io_zarr import TileZarrWriter, append_time_slices, write_tile_cube
 from astatine_os.data.providers import (
-    ERA5LandProvider,
-    KartaViewProvider,
-    LandsatThermalProvider,
     MapillaryProvider,
-    OpenBuildingsProvider,
-    OSMBuildingsProvider,
+    ProviderSet,
+    Reduction,
     Sentinel2Provider,
     TimeRange,
+    worker_provider_set,
+)
+from astatine_os.data.shared_arrays import SharedArrayHandle, SharedArrayRegistry, shared_dask_array
+from astatine_os.execution import (
+    array_scheduler,
+    compute_tasks,
+    iter_completed,
+    shares_host_memory,
+)
+from astatine_os.features.sky_view import raster_canyon_metrics_by_tile
+from astatine_os.features.spectral_indices import (
+    SPECTRAL_INDICES,
+    compute_ndbi,
+    compute_ndvi,
+    spectral_index_block,
+    spectral_summary,
 )
-from astatine_os.features.spectral_indices import compute_albedo_proxy, compute_ndbi, compute_ndvi
-from astatine_os.features.street_scene import summarize_street_scene
-from astatine_os.features.tiling import Tile, tile_aoi
-from astatine_os.features.urban_morphology import morphology_features
+from astatine_os.features.street_canyon import canyon_geometry_by_tile
+from astatine_os.features.street_scene import summarize_street_scene_array
+from astatine_os.features.tiling import (
+    Tile,
+    batch_aoi,
+    snapped_tiles,
+    spatial_batches,
+    tile_aoi,
+)
+from astatine_os.features.urban_morphology import morphology_features_by_tile
+from astatine_os.features.zonal import tile_label_raster_dask, zone_means
 from astatine_os.graph.build_graph import build_airflow_graph
-from astatine_os.graph.physics_proxies import compute_physics_proxies
-from astatine_os.graph.schemas import TileFeature
+from astatine_os.graph.physics_proxies import compute_physics_proxies_array
+from astatine_os.graph.schemas import TILE_FEATURE_COLUMNS, GraphPrediction, TileFeatureTable
 from astatine_os.logging import configure_logging, get_logger
-from astatine_os.models.inference import InferenceEngine
+from astatine_os.models.inference import MODEL_VERSION, InferenceEngine
+from astatine_os.models.raster_inference import (
+    broadcast_tile_values,
+    graph_degree,
+    microclimate_rasters,
+)
+from astatine_os.nowcast import NowcastSession
+from astatine_os.pipeline import Stage, StagePipeline, StageRecord
 from astatine_os.reporting.report_md import write_markdown_report
+from astatine_os.run_cache import RunCache
+from astatine_os.version import __version__
 
 LOGGER = get_logger(__name__)
 
+# Every artifact an analysis may write into ``out_dir``.
+_RUN_ARTIFACTS = (
+    "temperature_anomaly.geojson",
+    "ventilation_score.geojson",
+    "cool_refuges.geojson",
+    "tiles.geojson",
+    "predictions.geojson",
+    "predictions.geoparquet",
+    "intermediate_tiles.zarr",
+    "temperature_anomaly.cog.tif",
+    "microclimate_maps.zarr",
+    "temperature_anomaly_map.cog.tif",
+    "report.md",
+    "predictions_summary.json",
+    "summary_tiles.arrow",
+    "provider_metadata.parquet",
+    "predictions.pmtiles",
+)
+
+# Bump when an artifact's on-disk format changes, so cached runs are not restored.
+_OUTPUT_FORMAT_VERSION = "7"
+
+# Settings read only by artifact writers, so they do not invalidate data stages.
+_WRITER_FIELDS = (
+    "raster_native",
+    "raster_chunk_px",
+    "geojson_layout",
+    "geojson_precision",
+    "prediction_raster_resolution_m",
+    "vector_tiles",
+    "vector_tile_min_zoom",
+    "vector_tile_max_zoom",
+)
+
+# Vector tiles encoded per task by the ``vector_tiles`` writer.
+_VECTOR_TILE_BATCH = 256
+
+_ASSUMPTIONS = [
+    "Deterministic fallback features are used when live providers are unavailable.",
+    "Thermal labels use Landsat-style synthetic priors when no clear-sky thermal scene is retrieved.",
+    "Tree planting recommendations are heuristic and should be validated with local planners.",
+]
+
 
 class GeocoderProtocol(Protocol):
     """Protocol for pluggable geocoder implementations."""
@@ -62,6 +150,34 @@ class AnalysisResult:
     cool_refuges_geojson: Path
     report_markdown: Path
     optional_temperature_cog: Path | None
+    raster_maps: Path | None = None
+    vector_tiles: Path | None = None
+    stages: list[StageRecord] = field(default_factory=list)
+
+
+@dataclass
+class BatchAnalysisResult:
+    """Per-AOI outputs and aggregate throughput of an ``analyze_many`` run."""
+
+    results: dict[str, AnalysisResult]
+    requested_tiles: int
+    unique_tiles: int
+    elapsed_s: float
+
+    @property
+    def tiles_per_second(self) -> float:
+        """AOI tiles delivered per second of wall time, shared tiles counted per AOI."""
+        return self.requested_tiles / self.elapsed_s if self.elapsed_s > 0 else float("inf")
+
+
+@dataclass
+class TimeSeriesResult:
+    """Tile by time cube written by ``analyze_time_series``."""
+
+    output_dir: Path
+    cube_zarr: Path
+    windows: list[TimeRange]
+    tile_ids: list[str]
 
 
 def _seed_everything(seed: int, deterministic: bool) -> None:
@@ -79,87 +195,1122 @@ def _seed_everything(seed: int, deterministic: bool) -> None:
             pass
 
 
-def _tile_payload(
-    tile: Tile,
+def _fetch_sentinel(
+    provider: Sentinel2Provider,
+    aoi: AOI,
     time_range: TimeRange,
     resolution_m: int,
-    sentinel_provider: Sentinel2Provider,
-    landsat_provider: LandsatThermalProvider,
-    meteo_provider: ERA5LandProvider,
-    buildings_provider: OpenBuildingsProvider,
-    buildings_fallback_provider: OSMBuildingsProvider,
-    street_provider: KartaViewProvider,
-) -> tuple[TileFeature, dict[str, Any]]:
-    aoi = AOI(name=tile.tile_id, geometry=tile.geometry)
+    composite: bool,
+) -> Any:
+    """Fetch the three spectral bands, as a cloud-masked median composite if requested."""
+    bands = ["B04", "B08", "B11"]
+    if composite:
+        return provider.composite(aoi, time_range, resolution=resolution_m, bands=bands)
+    return provider.fetch(aoi, time_range, resolution=resolution_m, bands=bands)
+
+
+@dataclass(frozen=True)
+class _SurfaceMosaics:
+    """AOI-wide Sentinel-2 and Landsat mosaics that tile tasks reduce over their own window.
+
+    Bands are :class:`SharedArrayHandle` objects when tasks run on this host,
+    so each task maps the published pages instead of receiving a copy, and
+    plain arrays for workers of an external scheduler.
+    """
+
+    sentinel_bounds: tuple[float, float, float, float]
+    sentinel: dict[str, SharedArrayHandle | np.ndarray]
+    thermal_bounds: tuple[float, float, float, float]
+    thermal: SharedArrayHandle | np.ndarray
+    sentinel_metadata: dict[str, Any]
+    landsat_metadata: dict[str, Any]
+
 
-    sat = sentinel_provider.fetch(
-        aoi, time_range, resolution=resolution_m, bands=["B04", "B08", "B11"]
+def _attach(array: SharedArrayHandle | np.ndarray) -> np.ndarray:
+    return array.attach() if isinstance(array, SharedArrayHandle) else array
+
+
+def _mosaic_window(
+    array: np.ndarray,
+    bounds: tuple[float, float, float, float],
+    extent: tuple[float, float, float, float],
+) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+    """The part of a mosaic covering ``bounds`` that holds every pixel centred in ``extent``."""
+    grid = RasterGrid(*bounds, width=array.shape[1], height=array.shape[0])
+    window = grid.window_for_bounds(extent)
+    if window is None:
+        return array, bounds
+    rows, cols = window
+    return array[rows, cols], grid.window(rows, cols).bounds
+
+
+def _mosaic_surface_inputs(
+    tiles: list[Tile],
+    sentinel_bounds: tuple[float, float, float, float],
+    sentinel: dict[str, np.ndarray],
+    thermal_bounds: tuple[float, float, float, float],
+    thermal: np.ndarray,
+    spectral_backend: str,
+) -> list[dict[str, float]]:
+    """Per-tile spectral and thermal means of Sentinel-2 and Landsat mosaics.
+
+    Only the window of each mosaic around the tiles is read, so a batch
+    reduces just its part of an AOI-wide mosaic.
+    """
+    extent = batch_aoi(tiles).bounds
+    geometries = [tile.geometry for tile in tiles]
+    red, bounds = _mosaic_window(sentinel["B04"], sentinel_bounds, extent)
+    nir, _ = _mosaic_window(sentinel["B08"], sentinel_bounds, extent)
+    swir, _ = _mosaic_window(sentinel["B11"], sentinel_bounds, extent)
+    spectral = spectral_summary(
+        red=red, nir=nir, swir=swir, keep_arrays=SPECTRAL_INDICES, backend=spectral_backend
     )
-    thermal = landsat_provider.fetch(aoi, time_range, resolution=30, bands=["surface_temp_k"])
-    meteo = meteo_provider.fetch(
-        aoi, time_range, resolution=1, bands=["air_temp_c", "wind_speed_m_s"]
+    means = zone_means(spectral.arrays, geometries, bounds)
+    thermal_window, bounds = _mosaic_window(thermal, thermal_bounds, extent)
+    means.update(zone_means({"thermal_mean_k": thermal_window}, geometries, bounds))
+    return [
+        {name: float(values[idx]) for name, values in means.items()} for idx in range(len(tiles))
+    ]
+
+
+def _dynamic_tile_inputs(
+    tiles: list[Tile],
+    time_range: TimeRange,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+    mosaics: _SurfaceMosaics | None = None,
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Fetch the time-varying inputs of a batch of tiles: Sentinel-2, Landsat and ERA5.
+
+    Sentinel-2, Landsat and ERA5 are requested once for the bounding box of
+    the batch, and the rasters are reduced to per-tile means with one
+    spectral pass and one :func:`zone_means` over the batch mosaic. With
+    ``mosaics`` the batch window of the AOI mosaics is reduced instead and
+    the raster fetches are skipped. With ``provider_summaries`` the raster
+    providers return one mean per request, so Sentinel-2 and Landsat are
+    then requested per tile.
+    """
+    resolution_m = cfg.resolution_m
+    extent = batch_aoi(tiles)
+    surfaces: list[dict[str, Any]]
+    if mosaics is not None:
+        means = _mosaic_surface_inputs(
+            tiles,
+            mosaics.sentinel_bounds,
+            {band: _attach(array) for band, array in mosaics.sentinel.items()},
+            mosaics.thermal_bounds,
+            _attach(mosaics.thermal),
+            cfg.spectral_backend,
+        )
+        surfaces = [
+            {
+                **tile_means,
+                "sentinel_metadata": mosaics.sentinel_metadata,
+                "landsat_metadata": mosaics.landsat_metadata,
+            }
+            for tile_means in means
+        ]
+    else:
+        if cfg.provider_summaries and not cfg.sentinel_composite:
+            surfaces = [_summary_surface_inputs(tile, time_range, providers, cfg) for tile in tiles]
+        else:
+            sat = _fetch_sentinel(
+                providers.sentinel, extent, time_range, resolution_m, cfg.sentinel_composite
+            )
+            thermal = providers.landsat.fetch(
+                extent, time_range, resolution=30, bands=["surface_temp_k"]
+            )
+            means = _mosaic_surface_inputs(
+                tiles,
+                extent.bounds,
+                sat.arrays,
+                extent.bounds,
+                thermal.arrays["surface_temp_k"],
+                cfg.spectral_backend,
+            )
+            surfaces = [
+                {
+                    **tile_means,
+                    "sentinel_metadata": sat.metadata,
+                    "landsat_metadata": thermal.metadata,
+                }
+                for tile_means in means
+            ]
+    meteo_bands = ["air_temp_c", "wind_speed_m_s"]
+    if cfg.provider_summaries:
+        meteo = providers.meteo.fetch_summary(extent, time_range, resolution=1, bands=meteo_bands)
+        meteo_means = {name: meteo.summaries[name]["mean"] for name in meteo_bands}
+    else:
+        meteo = providers.meteo.fetch(extent, time_range, resolution=1, bands=meteo_bands)
+        meteo_means = {name: float(np.mean(meteo.arrays[name])) for name in meteo_bands}
+    outputs = []
+    for surface in surfaces:
+        inputs = {
+            "ndvi": surface["ndvi"],
+            "ndbi": surface["ndbi"],
+            "albedo": surface["albedo"],
+            "meteo_air_temp_c": meteo_means["air_temp_c"],
+            "meteo_wind_m_s": meteo_means["wind_speed_m_s"],
+        }
+        meta = {
+            "thermal_mean_k": surface["thermal_mean_k"],
+            "provider_metadata": {
+                "sentinel": surface["sentinel_metadata"],
+                "landsat": surface["landsat_metadata"],
+                "meteo": meteo.metadata,
+            },
+        }
+        outputs.append((inputs, meta))
+    return outputs
+
+
+def _summary_surface_inputs(
+    tile: Tile, time_range: TimeRange, providers: ProviderSet, cfg: RuntimeConfig
+) -> dict[str, Any]:
+    """Spectral and thermal means of one tile from the providers' reduced fetches."""
+    aoi = AOI(name=tile.tile_id, geometry=tile.geometry)
+    sat = providers.sentinel.fetch_summary(
+        aoi,
+        time_range,
+        resolution=cfg.resolution_m,
+        bands=["B04", "B08", "B11"],
+        reduction=Reduction(transform=spectral_index_block),
+    )
+    thermal = providers.landsat.fetch_summary(
+        aoi, time_range, resolution=30, bands=["surface_temp_k"]
     )
-    buildings = buildings_provider.fetch(aoi, time_range, resolution=resolution_m, bands=None)
-    if not buildings.vectors:
-        buildings = buildings_fallback_provider.fetch(
-            aoi, time_range, resolution=resolution_m, bands=None
+    return {
+        **{name: sat.summaries[name]["mean"] for name in SPECTRAL_INDICES},
+        "thermal_mean_k": thermal.summaries["surface_temp_k"]["mean"],
+        "sentinel_metadata": sat.metadata,
+        "landsat_metadata": thermal.metadata,
+    }
+
+
+def _unique_features(groups: Iterable[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Concatenate vector features, keeping one copy of features fetched by several tiles."""
+    seen: set[str] = set()
+    unique: list[dict[str, Any]] = []
+    for features in groups:
+        for feature in features:
+            key = json.dumps(feature.get("geometry"), sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                unique.append(feature)
+    return unique
+
+
+def _static_tile_inputs(
+    tiles: list[Tile],
+    time_range: TimeRange,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Fetch the slow-changing inputs of a batch of tiles: buildings, morphology and street scenes.
+
+    Footprints and street scenes are fetched per tile, since building
+    providers cap or synthesize a fixed number of footprints per request.
+    The deduplicated footprints of the whole batch then go through one
+    morphology pass, one street canyon pass that also uses the street
+    centrelines, and, with ``raster_sky_view``, one height raster over the
+    batch extent, so buildings facing each other across a tile boundary are
+    paired.
+    """
+    resolution_m = cfg.resolution_m
+    fetched = []
+    for tile in tiles:
+        aoi = AOI(name=tile.tile_id, geometry=tile.geometry)
+        buildings = providers.buildings.fetch(aoi, time_range, resolution=resolution_m, bands=None)
+        if not buildings.vectors:
+            buildings = providers.buildings_fallback.fetch(
+                aoi, time_range, resolution=resolution_m, bands=None
+            )
+        street = providers.street.fetch(aoi, time_range, resolution=resolution_m, bands=None)
+        fetched.append((buildings, street))
+    geometries = [tile.geometry for tile in tiles]
+    footprints = _unique_features(buildings.vectors for buildings, _ in fetched)
+    morphs = morphology_features_by_tile(geometries, footprints)
+    canyons = canyon_geometry_by_tile(
+        geometries, footprints, _unique_features(street.vectors for _, street in fetched)
+    )
+    raster_metrics: list[dict[str, float]] = [{} for _ in tiles]
+    if cfg.raster_sky_view:
+        raster_metrics = raster_canyon_metrics_by_tile(
+            geometries,
+            footprints,
+            batch_aoi(tiles).bounds,
+            resolution_m=resolution_m,
+            n_azimuths=cfg.sky_view_azimuths,
+            max_radius_m=cfg.sky_view_radius_m,
+            scheduler=array_scheduler(cfg),
+            workers=cfg.dask_workers,
         )
-    street = street_provider.fetch(aoi, time_range, resolution=resolution_m, bands=None)
-
-    red = sat.arrays["B04"]
-    nir = sat.arrays["B08"]
-    swir = sat.arrays["B11"]
-    ndvi = compute_ndvi(nir, red)
-    ndbi = compute_ndbi(swir, nir)
-    albedo = compute_albedo_proxy(red, nir, swir)
-
-    morph = morphology_features(aoi, buildings.vectors)
-    street_summary = summarize_street_scene(
-        green_view_ratio=street.arrays["green_view_ratio"],
-        sky_view_ratio=street.arrays["sky_view_ratio"],
-        facade_ratio=street.arrays["facade_ratio"],
+
+    outputs = []
+    for tile, (buildings, street), morph, canyon, metrics in zip(
+        tiles, fetched, morphs, canyons, raster_metrics, strict=True
+    ):
+        centroid_x, centroid_y = tile.centroid_xy
+        inputs: dict[str, Any] = {
+            "tile_id": tile.tile_id,
+            "lon": centroid_x,
+            "lat": centroid_y,
+            "building_density": morph["building_density"],
+            "mean_building_height_m": morph["mean_building_height_m"],
+            "orientation_deg": morph["street_orientation_deg"],
+            "street_width_m": canyon.street_width_m,
+            "sky_view_factor": metrics.get("sky_view_factor", float("nan")),
+            "street_arrays": {
+                "green_view_ratio": street.arrays["green_view_ratio"],
+                "sky_view_ratio": street.arrays["sky_view_ratio"],
+                "facade_ratio": street.arrays["facade_ratio"],
+            },
+        }
+        meta = {
+            "tile_id": tile.tile_id,
+            "street_width_m": canyon.street_width_m,
+            **metrics,
+            "provider_metadata": {
+                "buildings": buildings.metadata,
+                "street": street.metadata,
+            },
+        }
+        outputs.append((inputs, meta))
+    return outputs
+
+
+def _merge_tile_inputs(
+    static: tuple[dict[str, Any], dict[str, Any]],
+    dynamic: tuple[dict[str, Any], dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Combine static and time-varying parts into one tile's inputs and metadata."""
+    static_inputs, static_meta = static
+    dynamic_inputs, dynamic_meta = dynamic
+    meta = {
+        "tile_id": static_meta["tile_id"],
+        **{key: value for key, value in dynamic_meta.items() if key != "provider_metadata"},
+        **{key: value for key, value in static_meta.items() if key != "provider_metadata"},
+        "provider_metadata": {
+            **dynamic_meta["provider_metadata"],
+            **static_meta["provider_metadata"],
+        },
+    }
+    return {**static_inputs, **dynamic_inputs}, meta
+
+
+def _cache_store(cfg: RuntimeConfig) -> CacheStore:
+    """Cache for ``cfg``; with ``memory_cache_mb`` the process-wide one with a memory layer."""
+    if cfg.memory_cache_mb:
+        return shared_cache_store(cfg.cache_dir, cfg.memory_cache_mb * 1024 * 1024)
+    return CacheStore(cfg.cache_dir)
+
+
+def _tile_checkpoint_key(
+    tile: Tile,
+    batch: list[Tile],
+    time_range: TimeRange,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+    aoi: AOI,
+) -> str:
+    """Cache key of one tile's payload under the inputs that determine it."""
+    return CacheStore.make_key(
+        {
+            "kind": "tile_payload",
+            "package_version": __version__,
+            "tile_id": tile.tile_id,
+            "geometry": tile.geometry.wkt,
+            # Canyon gaps are measured over the footprints of the whole batch.
+            "batch": [member.tile_id for member in batch],
+            "time_range": time_range.iso_interval(),
+            "providers": providers.fingerprint(),
+            "config": cfg.output_fingerprint(exclude=_WRITER_FIELDS),
+            # Zonal surface inputs are aggregated from AOI-wide mosaics.
+            "aoi_bounds": list(aoi.bounds) if cfg.zonal_aggregation else None,
+        }
     )
-    vegetation_fraction = float(
-        np.clip(float(np.mean(ndvi) * 0.6 + street_summary["green_view_ratio"] * 0.4), 0.0, 1.0)
+
+
+def _encode_tile_output(output: tuple[dict[str, Any], dict[str, Any]]) -> dict[str, Any]:
+    inputs, meta = output
+    street = {
+        name: {"dtype": str(values.dtype), "shape": list(values.shape), "values": values.tolist()}
+        for name, values in inputs["street_arrays"].items()
+    }
+    return {"inputs": {**inputs, "street_arrays": street}, "meta": meta}
+
+
+def _decode_tile_output(payload: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    inputs = {
+        # JSON has no NaN; missing optional metrics come back as null.
+        name: float("nan") if value is None else value
+        for name, value in payload["inputs"].items()
+    }
+    inputs["street_arrays"] = {
+        name: np.asarray(item["values"], dtype=item["dtype"]).reshape(item["shape"])
+        for name, item in payload["inputs"]["street_arrays"].items()
+    }
+    return inputs, payload["meta"]
+
+
+def _tile_payload_batch(
+    tiles: list[Tile],
+    time_range: TimeRange,
+    providers: ProviderSet | None,
+    cfg: RuntimeConfig,
+    mosaics: _SurfaceMosaics | None = None,
+    checkpoint_keys: list[str] | None = None,
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Fetch provider data for a batch of tiles and reduce it to scalar feature inputs.
+
+    Static and time-varying inputs are each derived for the whole batch at
+    once; see :func:`_static_tile_inputs` and :func:`_dynamic_tile_inputs`,
+    the latter also for how ``mosaics`` and ``provider_summaries`` change
+    the raster fetches. Without ``providers`` the worker-local provider set
+    for ``cfg`` is used. With ``checkpoint_keys`` every tile of the batch is
+    written to the cache once the batch completes. Proxies that combine
+    several inputs are computed for all tiles at once by
+    ``_assemble_tile_features``.
+    """
+    providers = providers or worker_provider_set(cfg)
+    static = _static_tile_inputs(tiles, time_range, providers, cfg)
+    dynamic = _dynamic_tile_inputs(tiles, time_range, providers, cfg, mosaics)
+    outputs = [_merge_tile_inputs(*parts) for parts in zip(static, dynamic, strict=True)]
+    if checkpoint_keys is not None:
+        cache = _cache_store(cfg)
+        for key, output in zip(checkpoint_keys, outputs, strict=True):
+            cache.save_json(key, _encode_tile_output(output))
+    return outputs
+
+
+def _static_tile_batch(
+    tiles: list[Tile], time_range: TimeRange, cfg: RuntimeConfig
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Static inputs for a batch of tiles, using the worker-local providers."""
+    return _static_tile_inputs(tiles, time_range, worker_provider_set(cfg), cfg)
+
+
+def _dynamic_tile_batch(
+    tiles: list[Tile],
+    time_range: TimeRange,
+    cfg: RuntimeConfig,
+    mosaics: _SurfaceMosaics | None,
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Time-varying inputs for a batch of tiles in one window, using the worker-local providers."""
+    return _dynamic_tile_inputs(tiles, time_range, worker_provider_set(cfg), cfg, mosaics)
+
+
+def _surface_mosaics(
+    aoi: AOI,
+    time_range: TimeRange,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+    registry: SharedArrayRegistry | None,
+) -> _SurfaceMosaics:
+    """Fetch the AOI Sentinel-2 and Landsat mosaics once, published to ``registry`` if given."""
+    sat = _fetch_sentinel(
+        providers.sentinel, aoi, time_range, cfg.resolution_m, cfg.sentinel_composite
+    )
+    thermal = providers.landsat.fetch(aoi, time_range, resolution=30, bands=["surface_temp_k"])
+
+    def share(name: str, array: np.ndarray) -> SharedArrayHandle | np.ndarray:
+        if registry is None:
+            return array
+        return registry.publish(f"{time_range.iso_interval()}/{name}", array)
+
+    return _SurfaceMosaics(
+        sentinel_bounds=aoi.bounds,
+        sentinel={band: share(band, sat.arrays[band]) for band in ("B04", "B08", "B11")},
+        thermal_bounds=aoi.bounds,
+        thermal=share("surface_temp_k", thermal.arrays["surface_temp_k"]),
+        sentinel_metadata=sat.metadata,
+        landsat_metadata=thermal.metadata,
+    )
+
+
+def _assemble_tile_features(tile_inputs: list[dict[str, Any]]) -> TileFeatureTable:
+    """Combine per-tile inputs into a feature table with vectorized proxies."""
+
+    def column(name: str) -> np.ndarray:
+        return np.fromiter((item[name] for item in tile_inputs), "float64", len(tile_inputs))
+
+    # Tiles may carry different numbers of street samples, so each is reduced first.
+    street = summarize_street_scene_array(
+        **{
+            name: np.fromiter(
+                (
+                    np.asarray(item["street_arrays"][name], dtype="float64").mean()
+                    for item in tile_inputs
+                ),
+                "float64",
+                len(tile_inputs),
+            )
+            for name in ("green_view_ratio", "sky_view_ratio", "facade_ratio")
+        }
     )
-    physics = compute_physics_proxies(
-        building_density=morph["building_density"],
-        mean_building_height_m=morph["mean_building_height_m"],
-        street_width_m=18.0,
-        street_orientation_deg=morph["street_orientation_deg"],
+    ndvi = column("ndvi")
+    vegetation_fraction = np.clip(ndvi * 0.6 + street["green_view_ratio"] * 0.4, 0.0, 1.0)
+    physics = compute_physics_proxies_array(
+        building_density=column("building_density"),
+        mean_building_height_m=column("mean_building_height_m"),
+        street_width_m=column("street_width_m"),
+        street_orientation_deg=column("orientation_deg"),
         vegetation_fraction=vegetation_fraction,
-        green_view_ratio=street_summary["green_view_ratio"],
+        green_view_ratio=street["green_view_ratio"],
+        sky_view_factor=column("sky_view_factor"),
     )
-    centroid_x, centroid_y = tile.centroid_xy
-    feature = TileFeature(
-        tile_id=tile.tile_id,
-        lon=centroid_x,
-        lat=centroid_y,
-        ndvi=float(np.mean(ndvi)),
-        ndbi=float(np.mean(ndbi)),
-        albedo=float(np.mean(albedo)),
-        building_density=morph["building_density"],
-        mean_building_height_m=morph["mean_building_height_m"],
-        green_view_ratio=street_summary["green_view_ratio"],
-        street_sky_ratio=street_summary["street_sky_ratio"],
-        roughness_proxy=physics["roughness_proxy"],
-        canyon_aspect_ratio=physics["canyon_aspect_ratio"],
-        orientation_deg=morph["street_orientation_deg"],
-        meteo_air_temp_c=float(np.mean(meteo.arrays["air_temp_c"])),
-        meteo_wind_m_s=float(np.mean(meteo.arrays["wind_speed_m_s"])),
+    columns = {
+        name: column(name)
+        for name in (
+            "lon",
+            "lat",
+            "ndvi",
+            "ndbi",
+            "albedo",
+            "building_density",
+            "mean_building_height_m",
+            "orientation_deg",
+            "meteo_air_temp_c",
+            "meteo_wind_m_s",
+        )
+    }
+    columns["green_view_ratio"] = street["green_view_ratio"]
+    columns["street_sky_ratio"] = street["street_sky_ratio"]
+    columns["roughness_proxy"] = physics["roughness_proxy"]
+    columns["canyon_aspect_ratio"] = physics["canyon_aspect_ratio"]
+    return TileFeatureTable(
+        tile_id=np.asarray([item["tile_id"] for item in tile_inputs], dtype=str),
+        columns=columns,
     )
-    meta = {
-        "tile_id": tile.tile_id,
-        "thermal_mean_k": float(np.mean(thermal.arrays["surface_temp_k"])),
-        "provider_metadata": {
-            "sentinel": sat.metadata,
-            "landsat": thermal.metadata,
-            "meteo": meteo.metadata,
-            "buildings": buildings.metadata,
-            "street": street.metadata,
+
+
+def _write_raster_maps(
+    out_dir: Path,
+    aoi: AOI,
+    time_range: TimeRange,
+    resolution_m: int,
+    chunk_px: int,
+    tiles: list[Tile],
+    table: TileFeatureTable,
+    graph: Any,
+    sentinel_provider: Sentinel2Provider,
+    sentinel_composite: bool = False,
+) -> Path:
+    """Evaluate the baseline formulas pixel-wise over the AOI mosaic and stream to Zarr.
+
+    The bands are published to shared memory once and every block task reads
+    its window from there, so no task carries a copy of the mosaic.
+    """
+    import dask.array as da
+
+    sat = _fetch_sentinel(sentinel_provider, aoi, time_range, resolution_m, sentinel_composite)
+    height, width = sat.arrays["B04"].shape
+    minx, miny, maxx, maxy = aoi.bounds
+    grid = RasterGrid(minx, miny, maxx, maxy, width=width, height=height)
+    with SharedArrayRegistry() as registry:
+        red, nir, swir = (
+            shared_dask_array(registry.publish(band, sat.arrays[band]), chunk_px)
+            for band in ("B04", "B08", "B11")
+        )
+        ndvi = da.map_blocks(compute_ndvi, nir, red, dtype="float32")
+        ndbi = da.map_blocks(compute_ndbi, swir, nir, dtype="float32")
+        labels = tile_label_raster_dask([tile.geometry for tile in tiles], grid, chunk_px)
+        layers = microclimate_rasters(
+            ndvi, ndbi, labels, table, graph_degree(graph, table.tile_id.tolist())
+        )
+        maps_path = write_raster_zarr(out_dir / "microclimate_maps.zarr", layers, grid)
+        write_blocks_cog(
+            out_dir / "temperature_anomaly_map.cog.tif", layers["temperature_anomaly_c"], grid
+        )
+    return maps_path
+
+
+def _write_vector_tiles(
+    out_dir: Path, tiles: list[Tile], predictions: list[GraphPrediction], cfg: RuntimeConfig
+) -> Path:
+    """Encode the prediction layer as a PMTiles archive of Mapbox Vector Tiles.
+
+    Tiles of all zoom levels are encoded in batches of ``_VECTOR_TILE_BATCH``
+    on the configured Dask backend; the pyramid enters the graph once.
+    """
+    by_id = {tile.tile_id: tile for tile in tiles}
+    pyramid = VectorTilePyramid(
+        [by_id[pred.tile_id].geometry for pred in predictions],
+        [pred.tile_id for pred in predictions],
+        {
+            "temperature_anomaly_c": np.asarray([p.temperature_anomaly_c for p in predictions]),
+            "ventilation_score": np.asarray([p.ventilation_score for p in predictions]),
+        },
+        min_zoom=cfg.vector_tile_min_zoom,
+        max_zoom=cfg.vector_tile_max_zoom,
+    )
+    coords = pyramid.tile_coords()
+    batches = [
+        coords[start : start + _VECTOR_TILE_BATCH]
+        for start in range(0, len(coords), _VECTOR_TILE_BATCH)
+    ]
+
+    def batch_tasks(shared: Any) -> list[Any]:
+        return [dask.delayed(VectorTilePyramid.encode_batch)(shared, batch) for batch in batches]
+
+    encoded = compute_tasks(batch_tasks, [pyramid], cfg)
+    return write_pmtiles(
+        out_dir / "predictions.pmtiles",
+        (item for batch in encoded for item in batch),
+        min_zoom=pyramid.min_zoom,
+        max_zoom=pyramid.max_zoom,
+        bounds=pyramid.lonlat_bounds,
+        metadata=pyramid.metadata(),
+    )
+
+
+def _prediction_raster(
+    geometries: Sequence[Any], values: np.ndarray, resolution_m: float, chunk_px: int
+) -> tuple[Any, RasterGrid]:
+    """Lazy raster of per-tile ``values`` on a WGS84 grid covering ``geometries``.
+
+    Pixels take the value of the tile containing their centre and are NaN
+    outside every tile. Blocks of ``chunk_px`` are rasterized on demand.
+    """
+    minx, miny, maxx, maxy = map(float, shapely.total_bounds(np.asarray(geometries, dtype=object)))
+    grid = RasterGrid.from_bounds((minx, miny, maxx, maxy), resolution_m)
+    labels = tile_label_raster_dask(geometries, grid, chunk_px)
+    return broadcast_tile_values(labels, values), grid
+
+
+def _run_key(
+    place: str,
+    start: str,
+    end: str,
+    aoi: AOI,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+) -> str:
+    return CacheStore.make_key(
+        {
+            "kind": "analysis_run",
+            "package_version": __version__,
+            "model_version": MODEL_VERSION,
+            "output_format": _OUTPUT_FORMAT_VERSION,
+            "place": place,
+            "start": start,
+            "end": end,
+            "aoi": aoi.geometry.wkt,
+            "providers": providers.fingerprint(),
+            "config": cfg.output_fingerprint(),
+        }
+    )
+
+
+def _result_from_manifest(out_dir: Path, manifest: dict[str, Any], key: str) -> AnalysisResult:
+    artifacts = manifest["result"]
+
+    def optional(name: str) -> Path | None:
+        artifact = artifacts.get(name)
+        return out_dir / artifact if artifact is not None else None
+
+    return AnalysisResult(
+        output_dir=out_dir,
+        temperature_geojson=out_dir / artifacts["temperature_geojson"],
+        ventilation_geojson=out_dir / artifacts["ventilation_geojson"],
+        cool_refuges_geojson=out_dir / artifacts["cool_refuges_geojson"],
+        report_markdown=out_dir / artifacts["report_markdown"],
+        optional_temperature_cog=optional("optional_temperature_cog"),
+        raster_maps=optional("raster_maps"),
+        vector_tiles=optional("vector_tiles"),
+        stages=[StageRecord("run_cache", "hit", key)],
+    )
+
+
+def _compute_tile_outputs(
+    tiles: list[Tile],
+    aoi: AOI,
+    time_range: TimeRange,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+    cache: CacheStore,
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Return per-tile inputs and metadata, computing only batches with missing checkpoints.
+
+    Batches are formed over all tiles, so a resumed run recomputes a batch
+    with the same members, and every tile of it, as the interrupted one.
+    """
+    all_batches = spatial_batches(tiles, cfg.tile_batch_size)
+    checkpoint_keys: list[str] = [""] * len(tiles)
+    for batch in all_batches:
+        members = [tiles[idx] for idx in batch]
+        for idx in batch:
+            checkpoint_keys[idx] = _tile_checkpoint_key(
+                tiles[idx], members, time_range, providers, cfg, aoi
+            )
+    by_index: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+    if cfg.tile_checkpoints:
+        restored = cache.load_many(checkpoint_keys)
+        by_index = {
+            idx: _decode_tile_output(restored[key])
+            for idx, key in enumerate(checkpoint_keys)
+            if key in restored
+        }
+    batches = [batch for batch in all_batches if any(idx not in by_index for idx in batch)]
+    pending = [idx for batch in batches for idx in batch]
+    if by_index:
+        LOGGER.info(
+            "Resuming from tile checkpoints",
+            extra={"context": {"restored": len(tiles) - len(pending), "pending": len(pending)}},
+        )
+
+    def batch_tasks(shared_cfg: Any, shared_mosaics: Any = None) -> list[Any]:
+        # Only the config and mosaics are shared; each worker builds its own providers.
+        return [
+            dask.delayed(_tile_payload_batch)(
+                [tiles[idx] for idx in batch],
+                time_range,
+                None,
+                shared_cfg,
+                shared_mosaics,
+                [checkpoint_keys[idx] for idx in batch] if cfg.tile_checkpoints else None,
+            )
+            for batch in batches
+        ]
+
+    if batches:
+        with ExitStack() as stack:
+            shared: list[Any] = [cfg]
+            if cfg.zonal_aggregation:
+                registry = (
+                    stack.enter_context(SharedArrayRegistry()) if shares_host_memory(cfg) else None
+                )
+                shared.append(_surface_mosaics(aoi, time_range, providers, cfg, registry))
+            # Fold batches in completion order; distributed futures are released as they land.
+            for position, outputs in iter_completed(batch_tasks, shared, cfg):
+                by_index.update(zip(batches[position], outputs, strict=True))
+    return [by_index[idx] for idx in range(len(tiles))]
+
+
+def _encode_tiles(tiles: list[Tile]) -> list[dict[str, str]]:
+    return [{"tile_id": tile.tile_id, "wkb": tile.geometry.wkb_hex} for tile in tiles]
+
+
+def _decode_tiles(value: list[dict[str, str]]) -> list[Tile]:
+    return [Tile(tile_id=item["tile_id"], geometry=shapely.from_wkb(item["wkb"])) for item in value]
+
+
+def _encode_features(value: tuple[TileFeatureTable, list[dict[str, Any]]]) -> dict[str, Any]:
+    table, metadata = value
+    return {
+        "tile_id": table.tile_id.tolist(),
+        "columns": {name: column.tolist() for name, column in table.columns.items()},
+        "metadata": metadata,
+    }
+
+
+def _decode_features(value: dict[str, Any]) -> tuple[TileFeatureTable, list[dict[str, Any]]]:
+    # The cache stores NaN as null; float64 conversion turns it back into NaN.
+    table = TileFeatureTable.from_columns(
+        value["tile_id"],
+        {
+            name: [np.nan if v is None else v for v in column]
+            for name, column in value["columns"].items()
         },
+    )
+    return table, value["metadata"]
+
+
+def _encode_graph(graph: Any) -> dict[str, Any]:
+    return {
+        "nodes": list(graph.nodes),
+        "edges": [[u, v, data["weight"]] for u, v, data in graph.edges(data=True)],
+    }
+
+
+def _decode_graph(value: dict[str, Any]) -> Any:
+    """Rebuild the airflow graph topology; per-node feature attributes are not cached."""
+    import networkx as nx
+
+    graph = nx.Graph()
+    graph.add_nodes_from(value["nodes"])
+    graph.add_weighted_edges_from(value["edges"])
+    return graph
+
+
+def _encode_predictions(predictions: list[GraphPrediction]) -> list[dict[str, Any]]:
+    return [asdict(pred) for pred in predictions]
+
+
+def _decode_predictions(value: list[dict[str, Any]]) -> list[GraphPrediction]:
+    return [GraphPrediction(**item) for item in value]
+
+
+_TILE_ZARR_VARIABLES = ("temperature_anomaly_c", "ventilation_score", "ndvi", "ndbi")
+
+_PREDICTION_SCHEMA = pa.schema(
+    [
+        ("tile_id", pa.string()),
+        ("temperature_anomaly_c", pa.float64()),
+        ("ventilation_score", pa.float64()),
+        ("ndvi", pa.float64()),
+        ("ndbi", pa.float64()),
+    ]
+)
+
+
+def _write_vector_outputs(
+    out_dir: Path,
+    tiles: list[Tile],
+    table: TileFeatureTable,
+    predictions: list[GraphPrediction],
+    time_range: TimeRange,
+    batch_size: int = 4096,
+    layout: str = "layers",
+    precision: int | None = None,
+    raster_resolution_m: float = 10.0,
+    chunk_px: int = 512,
+) -> dict[str, Any]:
+    """Stream the GeoJSON layers, GeoParquet table, Zarr tiles and optional COG.
+
+    Tiles are written in batches of ``batch_size``: each GeoJSON feature is
+    serialized as soon as it is built, Parquet rows are flushed per row group
+    and Zarr regions are appended, so memory does not grow with the AOI.
+    GeoParquet rows follow a Hilbert curve, so each row group covers a
+    compact area and bbox filters prune most of them.
+
+    Each tile geometry is encoded once per batch, rounded to ``precision``
+    decimals, and reused by every GeoJSON layer. ``layout`` selects
+    ``layers`` (one layer per attribute, each with geometry), ``shared``
+    (``tiles.geojson`` holds the geometry and the attribute layers have
+    none) or ``combined`` (one ``predictions.geojson`` with all attributes).
+    The temperature COG is rasterized on the tile grid at
+    ``raster_resolution_m`` and written in windows of ``chunk_px``. The Zarr
+    store holds one ``(time, tile)`` step stamped with ``time_range``.
+    """
+    tile_geoms = {tile.tile_id: tile.geometry for tile in tiles}
+    geometries = [tile_geoms[pred.tile_id] for pred in predictions]
+    row_of = {tile_id: idx for idx, tile_id in enumerate(table.tile_id.tolist())}
+    ndvi = table["ndvi"]
+    ndbi = table["ndbi"]
+
+    with ExitStack() as stack:
+        refuges = stack.enter_context(GeoJSONStreamWriter(out_dir / "cool_refuges.geojson"))
+        if layout == "combined":
+            combined = stack.enter_context(GeoJSONStreamWriter(out_dir / "predictions.geojson"))
+            temperature = ventilation = combined
+        else:
+            temperature = stack.enter_context(
+                GeoJSONStreamWriter(out_dir / "temperature_anomaly.geojson")
+            )
+            ventilation = stack.enter_context(
+                GeoJSONStreamWriter(out_dir / "ventilation_score.geojson")
+            )
+        shared = (
+            stack.enter_context(GeoJSONStreamWriter(out_dir / "tiles.geojson"))
+            if layout == "shared"
+            else None
+        )
+        all_rows = [row_of[pred.tile_id] for pred in predictions]
+        zarr_writer = stack.enter_context(
+            TileZarrWriter(
+                out_dir / "intermediate_tiles.zarr",
+                [pred.tile_id for pred in predictions],
+                _TILE_ZARR_VARIABLES,
+                time=time_range.start,
+                time_end=time_range.end,
+                coords={"lon": table["lon"][all_rows], "lat": table["lat"][all_rows]},
+                tile_chunk=batch_size,
+            )
+        )
+        for offset in range(0, len(predictions), batch_size):
+            batch = predictions[offset : offset + batch_size]
+            rows = [row_of[pred.tile_id] for pred in batch]
+            encoded = encode_geometries(geometries[offset : offset + batch_size], precision)
+            for pred, row, geometry in zip(batch, rows, encoded, strict=True):
+                rank = None
+                if (
+                    pred.temperature_anomaly_c < 0.5
+                    and pred.ventilation_score > 0.6
+                    and ndvi[row] > 0.2
+                ):
+                    rank = round(
+                        0.5 * (1.0 - pred.temperature_anomaly_c) + 0.5 * pred.ventilation_score,
+                        3,
+                    )
+                    refuges.write_encoded(
+                        geometry, {"tile_id": pred.tile_id, "cool_refuge_rank": rank}
+                    )
+                if layout == "combined":
+                    combined.write_encoded(
+                        geometry,
+                        {
+                            "tile_id": pred.tile_id,
+                            "temperature_anomaly_c": pred.temperature_anomaly_c,
+                            "ventilation_score": pred.ventilation_score,
+                            "cool_refuge_rank": rank,
+                        },
+                    )
+                    continue
+                if shared is not None:
+                    shared.write_encoded(geometry, {"tile_id": pred.tile_id})
+                layer_geometry = None if shared is not None else geometry
+                temperature.write_encoded(
+                    layer_geometry,
+                    {"tile_id": pred.tile_id, "temperature_anomaly_c": pred.temperature_anomaly_c},
+                )
+                ventilation.write_encoded(
+                    layer_geometry,
+                    {"tile_id": pred.tile_id, "ventilation_score": pred.ventilation_score},
+                )
+            zarr_writer.append(
+                [pred.tile_id for pred in batch],
+                {
+                    "temperature_anomaly_c": np.array([p.temperature_anomaly_c for p in batch]),
+                    "ventilation_score": np.array([p.ventilation_score for p in batch]),
+                    "ndvi": ndvi[rows],
+                    "ndbi": ndbi[rows],
+                },
+            )
+
+    with GeoParquetStreamWriter(
+        out_dir / "predictions.geoparquet", _PREDICTION_SCHEMA, row_group_size=batch_size
+    ) as parquet:
+        order = hilbert_order(geometries)
+        for offset in range(0, len(order), batch_size):
+            batch_order = order[offset : offset + batch_size]
+            batch = [predictions[idx] for idx in batch_order]
+            rows = [row_of[pred.tile_id] for pred in batch]
+            parquet.write_batch(
+                [geometries[idx] for idx in batch_order],
+                {
+                    "tile_id": [pred.tile_id for pred in batch],
+                    "temperature_anomaly_c": [pred.temperature_anomaly_c for pred in batch],
+                    "ventilation_score": [pred.ventilation_score for pred in batch],
+                    "ndvi": ndvi[rows],
+                    "ndbi": ndbi[rows],
+                },
+            )
+
+    written = [parquet.path]
+    if shared is not None:
+        written.append(shared.path)
+    written.append(zarr_writer.path)
+
+    raster, grid = _prediction_raster(
+        geometries,
+        np.array([pred.temperature_anomaly_c for pred in predictions]),
+        raster_resolution_m,
+        chunk_px,
+    )
+    return {
+        "temperature_geojson": temperature.path,
+        "ventilation_geojson": ventilation.path,
+        "cool_refuges_geojson": refuges.path,
+        "optional_temperature_cog": (
+            write_blocks_cog(out_dir / "temperature_anomaly.cog.tif", raster, grid)
+            if predictions
+            else None
+        ),
+        "written": written,
     }
-    return feature, meta
+
+
+def _analysis_stages(
+    place: str,
+    start: str,
+    end: str,
+    aoi: AOI,
+    time_range: TimeRange,
+    providers: ProviderSet,
+    cfg: RuntimeConfig,
+    cache: CacheStore,
+    planned: tuple[list[Tile], list[tuple[dict[str, Any], dict[str, Any]]]] | None = None,
+) -> list[Stage]:
+    """Describe one analysis as a stage graph.
+
+    Data stages are memoized in ``cache``; stages that write artifacts into
+    ``cfg.out_dir`` always run so the output directory is complete. With
+    ``planned`` tiles and tile outputs, as computed once for many AOIs by
+    :func:`analyze_many`, the tiling and feature stages become sources.
+    """
+
+    def tiles(inputs: dict[str, Any]) -> list[Tile]:
+        result = tile_aoi(inputs["aoi"], tile_size_m=cfg.tile_size_m)
+        if not result:
+            raise ValueError(f"No tiles generated for AOI {inputs['aoi'].name}")
+        return result
+
+    def features(inputs: dict[str, Any]) -> tuple[TileFeatureTable, list[dict[str, Any]]]:
+        outputs = _compute_tile_outputs(
+            inputs["tiles"], inputs["aoi"], time_range, providers, cfg, cache
+        )
+        table = _assemble_tile_features([item[0] for item in outputs])
+        return table, [item[1] for item in outputs]
+
+    def predict(inputs: dict[str, Any]) -> list[GraphPrediction]:
+        return InferenceEngine(deterministic=cfg.deterministic).predict(
+            inputs["graph"], inputs["tile_features"][0].to_features()
+        )
+
+    def vector_outputs(inputs: dict[str, Any]) -> dict[str, Any]:
+        return _write_vector_outputs(
+            cfg.out_dir,
+            inputs["tiles"],
+            inputs["tile_features"][0],
+            inputs["predictions"],
+            time_range,
+            cfg.output_batch_size,
+            layout=cfg.geojson_layout,
+            precision=cfg.geojson_precision,
+            raster_resolution_m=cfg.prediction_raster_resolution_m or cfg.resolution_m,
+            chunk_px=cfg.raster_chunk_px,
+        )
+
+    def raster_maps(inputs: dict[str, Any]) -> Path:
+        return _write_raster_maps(
+            cfg.out_dir,
+            inputs["aoi"],
+            time_range,
+            cfg.resolution_m,
+            cfg.raster_chunk_px,
+            inputs["tiles"],
+            inputs["tile_features"][0],
+            inputs["graph"],
+            providers.sentinel,
+            cfg.sentinel_composite,
+        )
+
+    def report(inputs: dict[str, Any]) -> Path:
+        return write_markdown_report(
+            path=cfg.out_dir / "report.md",
+            place=place,
+            start_date=start,
+            end_date=end,
+            tile_features=inputs["tile_features"][0].to_features(),
+            predictions=inputs["predictions"],
+            assumptions=_ASSUMPTIONS,
+        )
+
+    def summary(inputs: dict[str, Any]) -> list[Path]:
+        table, per_tile_metadata = inputs["tile_features"]
+        manifest = {
+            "place": place,
+            "aoi_bounds": inputs["aoi"].bounds,
+            "time_range": {"start": start, "end": end},
+            "assumptions": _ASSUMPTIONS,
+            "attribution": {
+                "sentinel2": providers.sentinel.attribution(),
+                "landsat": providers.landsat.attribution(),
+                "era5_land": providers.meteo.attribution(),
+                "open_buildings": providers.buildings.attribution(),
+                "osm_fallback": providers.buildings_fallback.attribution(),
+                "kartaview": providers.street.attribution(),
+                "mapillary_optional": MapillaryProvider(cfg.mapillary_access_token).attribution(),
+            },
+        }
+        return write_run_summary(
+            cfg.out_dir, manifest, table, inputs["predictions"], per_tile_metadata
+        )
+
+    stages = [
+        Stage(
+            "aoi",
+            lambda inputs: aoi,
+            memoize=False,
+            encode=lambda value: {"name": value.name, "wkb": value.geometry.wkb_hex},
+        ),
+        Stage(
+            "tiles",
+            tiles,
+            deps=("aoi",),
+            params={"tile_size_m": cfg.tile_size_m},
+            encode=_encode_tiles,
+            decode=_decode_tiles,
+        ),
+        Stage(
+            "tile_features",
+            features,
+            deps=("aoi", "tiles"),
+            params={
+                "time_range": [start, end],
+                "providers": providers.fingerprint(),
+                "config": cfg.output_fingerprint(exclude=_WRITER_FIELDS),
+            },
+            encode=_encode_features,
+            decode=_decode_features,
+        ),
+        Stage(
+            "graph",
+            lambda inputs: build_airflow_graph(inputs["tile_features"][0].to_features()),
+            deps=("tile_features",),
+            encode=_encode_graph,
+            decode=_decode_graph,
+        ),
+        Stage(
+            "predictions",
+            predict,
+            deps=("graph", "tile_features"),
+            params={"model_version": MODEL_VERSION, "deterministic": cfg.deterministic},
+            encode=_encode_predictions,
+            decode=_decode_predictions,
+        ),
+        Stage(
+            "vector_outputs",
+            vector_outputs,
+            deps=("tiles", "tile_features", "predictions"),
+            memoize=False,
+        ),
+        Stage("report", report, deps=("tile_features", "predictions"), memoize=False),
+        Stage("summary", summary, deps=("aoi", "tile_features", "predictions"), memoize=False),
+    ]
+    if planned is not None:
+        planned_tiles, planned_outputs = planned
+        stages[1] = Stage(
+            "tiles", lambda inputs: planned_tiles, memoize=False, encode=_encode_tiles
+        )
+        stages[2] = Stage(
+            "tile_features",
+            lambda inputs: (
+                _assemble_tile_features([item[0] for item in planned_outputs]),
+                [item[1] for item in planned_outputs],
+            ),
+            memoize=False,
+            encode=_encode_features,
+        )
+    if cfg.raster_native:
+        stages.append(
+            Stage(
+                "raster_maps",
+                raster_maps,
+                deps=("aoi", "tiles", "tile_features", "graph"),
+                memoize=False,
+            )
+        )
+    if cfg.vector_tiles:
+        stages.append(
+            Stage(
+                "vector_tiles",
+                lambda inputs: _write_vector_tiles(
+                    cfg.out_dir, inputs["tiles"], inputs["predictions"], cfg
+                ),
+                deps=("tiles", "predictions"),
+                memoize=False,
+            )
+        )
+    return stages
+
+
+def _analysis_result(
+    out_dir: Path, outputs: dict[str, Any], records: list[StageRecord]
+) -> AnalysisResult:
+    vector = outputs["vector_outputs"]
+    return AnalysisResult(
+        output_dir=out_dir,
+        temperature_geojson=vector["temperature_geojson"],
+        ventilation_geojson=vector["ventilation_geojson"],
+        cool_refuges_geojson=vector["cool_refuges_geojson"],
+        report_markdown=outputs["report"],
+        optional_temperature_cog=vector["optional_temperature_cog"],
+        raster_maps=outputs.get("raster_maps"),
+        vector_tiles=outputs.get("vector_tiles"),
+        stages=records,
+    )
 
 
 def analyze_microclimate(
@@ -169,8 +1320,18 @@ def analyze_microclimate(
     out_dir: str | Path = "./out",
     geocoder: GeocoderProtocol | None = None,
     config_overrides: dict[str, Any] | None = None,
+    force: bool = False,
 ) -> AnalysisResult:
-    """Analyze neighborhood micro heat islands and ventilation barriers."""
+    """Analyze neighborhood micro heat islands and ventilation barriers.
+
+    Identical requests are served from the run cache by linking the previous
+    artifacts into ``out_dir``. ``force=True`` skips only that whole-run
+    lookup. The analysis then runs as a stage graph in which unchanged stages
+    and tile checkpoints are still read from the cache, so a forced run
+    rewrites the artifacts without recomputing cached data; use a fresh
+    ``cache_dir`` to recompute everything. ``AnalysisResult.stages`` records
+    which stages were hits.
+    """
     configure_logging()
     overrides = dict(config_overrides or {})
     overrides["out_dir"] = Path(out_dir)
@@ -178,7 +1339,7 @@ def analyze_microclimate(
     _seed_everything(cfg.seed, cfg.deterministic)
     cfg.cache_dir.mkdir(parents=True, exist_ok=True)
     cfg.out_dir.mkdir(parents=True, exist_ok=True)
-    cache = CacheStore(cfg.cache_dir)
+    cache = _cache_store(cfg)
 
     start_date = date.fromisoformat(start)
     end_date = date.fromisoformat(end)
@@ -187,225 +1348,353 @@ def analyze_microclimate(
     geocoder_impl = geocoder or NominatimGeocoder(user_agent=cfg.geocoder_user_agent)
     aoi = resolve_place(place, geocoder_impl)  # type: ignore[arg-type]
 
-    tiles = tile_aoi(aoi, tile_size_m=cfg.tile_size_m)
-    if not tiles:
-        raise ValueError(f"No tiles generated for AOI {aoi.name}")
+    providers = ProviderSet.from_config(cfg)
+    run_cache = RunCache(cache)
+    run_key = _run_key(place, start, end, aoi, providers, cfg)
+    if not force:
+        manifest = run_cache.restore(run_key, cfg.out_dir)
+        if manifest is not None:
+            LOGGER.info(
+                "Restored analysis from run cache",
+                extra={"context": {"place": place, "cache_key": run_key}},
+            )
+            if cfg.tile_zarr_store is not None:
+                append_time_slices(cfg.tile_zarr_store, cfg.out_dir / "intermediate_tiles.zarr")
+            return _result_from_manifest(cfg.out_dir, manifest, run_key)
+    RunCache.detach(cfg.out_dir, list(_RUN_ARTIFACTS))
 
-    sentinel = Sentinel2Provider(use_live_stac=cfg.enable_optional_live_calls)
-    landsat = LandsatThermalProvider(use_live_stac=cfg.enable_optional_live_calls)
-    meteo = ERA5LandProvider(cfg.era5_cds_url, cfg.era5_cds_key)
-    buildings = OpenBuildingsProvider()
-    buildings_fallback = OSMBuildingsProvider()
-    street = KartaViewProvider()
-
-    delayed_tasks = [
-        dask.delayed(_tile_payload)(
-            tile=tile,
-            time_range=time_range,
-            resolution_m=cfg.resolution_m,
-            sentinel_provider=sentinel,
-            landsat_provider=landsat,
-            meteo_provider=meteo,
-            buildings_provider=buildings,
-            buildings_fallback_provider=buildings_fallback,
-            street_provider=street,
+    outputs, records = StagePipeline(
+        _analysis_stages(place, start, end, aoi, time_range, providers, cfg, cache), cache
+    ).run()
+    result = _analysis_result(cfg.out_dir, outputs, records)
+    vector = outputs["vector_outputs"]
+    result_artifacts = {
+        name: (value.relative_to(cfg.out_dir).as_posix() if value is not None else None)
+        for name, value in vars(result).items()
+        if name not in ("output_dir", "stages")
+    }
+    written = [path.relative_to(cfg.out_dir).as_posix() for path in vector["written"]]
+    written.extend(path.relative_to(cfg.out_dir).as_posix() for path in outputs["summary"])
+    written.extend(name for name in result_artifacts.values() if name is not None)
+    if result.raster_maps is not None:
+        written.extend(
+            name for name in ("temperature_anomaly_map.cog.tif",) if (cfg.out_dir / name).exists()
         )
-        for tile in tiles
+    run_cache.store(run_key, cfg.out_dir, sorted(set(written)), result_artifacts)
+    if cfg.tile_zarr_store is not None:
+        append_time_slices(cfg.tile_zarr_store, cfg.out_dir / "intermediate_tiles.zarr")
+
+    LOGGER.info(
+        "Completed analysis",
+        extra={
+            "context": {
+                "place": place,
+                "tiles": len(outputs["tiles"]),
+                "out_dir": str(cfg.out_dir),
+                "cache_key": run_key,
+                "stage_hits": sum(record.status == "hit" for record in records),
+            }
+        },
+    )
+    return result
+
+
+def start_nowcast(
+    place: str,
+    start: str = "2025-07-01",
+    end: str = "2025-07-31",
+    geocoder: GeocoderProtocol | None = None,
+    config_overrides: dict[str, Any] | None = None,
+) -> NowcastSession:
+    """Prepare a :class:`NowcastSession` for ``place`` from the surface period ``start``-``end``.
+
+    Tiles, features and the airflow graph come from the memoized analysis
+    stages, so a place that was analyzed before starts from the cache.
+    """
+    configure_logging()
+    cfg = get_runtime_config(**dict(config_overrides or {}))
+    _seed_everything(cfg.seed, cfg.deterministic)
+    cfg.cache_dir.mkdir(parents=True, exist_ok=True)
+    cache = _cache_store(cfg)
+    time_range = TimeRange(start=date.fromisoformat(start), end=date.fromisoformat(end))
+    geocoder_impl = geocoder or NominatimGeocoder(user_agent=cfg.geocoder_user_agent)
+    aoi = resolve_place(place, geocoder_impl)  # type: ignore[arg-type]
+    providers = ProviderSet.from_config(cfg)
+    stages = [
+        stage
+        for stage in _analysis_stages(place, start, end, aoi, time_range, providers, cfg, cache)
+        if stage.name in ("aoi", "tiles", "tile_features", "graph")
     ]
+    outputs, _ = StagePipeline(stages, cache).run()
+    return NowcastSession(
+        outputs["tiles"],
+        outputs["tile_features"][0],
+        outputs["graph"],
+        providers.meteo,
+        batch_size=cfg.tile_batch_size,
+    )
 
-    tile_outputs: list[tuple[TileFeature, dict[str, Any]]]
-    if cfg.use_dask_distributed:
-        try:
-            from dask.distributed import Client, LocalCluster
-        except Exception:
-            tile_outputs = list(dask.compute(*delayed_tasks))
-        else:
-            cluster = LocalCluster(
-                n_workers=cfg.dask_workers,
-                threads_per_worker=cfg.dask_threads_per_worker,
-                processes=False,
-                dashboard_address=None,
-                silence_logs=50,
-            )
-            client = Client(cluster)
-            try:
-                tile_outputs = list(client.gather(client.compute(delayed_tasks)))
-            finally:
-                client.close()
-                cluster.close()
-    else:
-        tile_outputs = list(dask.compute(*delayed_tasks))
 
-    tile_features = [item[0] for item in tile_outputs]
-    per_tile_metadata = [item[1] for item in tile_outputs]
+def split_time_range(time_range: TimeRange, days: int) -> list[TimeRange]:
+    """Cut ``time_range`` into consecutive windows of ``days``; the last may be shorter."""
+    if days < 1:
+        raise ValueError("Window length must be at least one day.")
+    windows: list[TimeRange] = []
+    start = time_range.start
+    while start <= time_range.end:
+        end = min(start + timedelta(days=days - 1), time_range.end)
+        windows.append(TimeRange(start=start, end=end))
+        start = end + timedelta(days=1)
+    return windows
+
 
-    airflow_graph = build_airflow_graph(tile_features)
-    predictions = InferenceEngine(deterministic=cfg.deterministic).predict(
-        airflow_graph, tile_features
+def analyze_time_series(
+    place: str,
+    windows: Sequence[TimeRange],
+    out_dir: str | Path = "./out",
+    geocoder: GeocoderProtocol | None = None,
+    config_overrides: dict[str, Any] | None = None,
+) -> TimeSeriesResult:
+    """Analyze one AOI over several time windows in a single job.
+
+    Buildings, morphology, canyon and street-scene inputs and the airflow
+    graph do not change between windows, so they are computed once over the
+    span of all windows. Only Sentinel-2, Landsat and ERA5 are fetched per
+    window. Features and predictions are written as a ``(time, tile)`` cube
+    to ``time_series.zarr``.
+    """
+    configure_logging()
+    if not windows:
+        raise ValueError("analyze_time_series needs at least one time window.")
+    overrides = dict(config_overrides or {})
+    overrides["out_dir"] = Path(out_dir)
+    cfg = get_runtime_config(**overrides)
+    _seed_everything(cfg.seed, cfg.deterministic)
+    cfg.out_dir.mkdir(parents=True, exist_ok=True)
+    windows = list(windows)
+    span = TimeRange(
+        start=min(window.start for window in windows),
+        end=max(window.end for window in windows),
     )
 
-    tile_geoms = {tile.tile_id: tile.geometry for tile in tiles}
-    temp_features: list[dict[str, Any]] = []
-    vent_features: list[dict[str, Any]] = []
-    refuge_features: list[dict[str, Any]] = []
-    prediction_map = {pred.tile_id: pred for pred in predictions}
-    feature_map = {feature.tile_id: feature for feature in tile_features}
-
-    for tile_id, pred in prediction_map.items():
-        tile_feature = feature_map[tile_id]
-        geom = tile_geoms[tile_id]
-        temp_feature = {
-            "type": "Feature",
-            "geometry": mapping(geom),
-            "properties": {
-                "tile_id": tile_id,
-                "temperature_anomaly_c": pred.temperature_anomaly_c,
-            },
-        }
-        vent_feature = {
-            "type": "Feature",
-            "geometry": mapping(geom),
-            "properties": {
-                "tile_id": tile_id,
-                "ventilation_score": pred.ventilation_score,
-            },
-        }
-        temp_features.append(temp_feature)
-        vent_features.append(vent_feature)
-
-        if (
-            pred.temperature_anomaly_c < 0.5
-            and pred.ventilation_score > 0.6
-            and tile_feature.ndvi > 0.2
-        ):
-            refuge_features.append(
-                {
-                    "type": "Feature",
-                    "geometry": mapping(geom),
-                    "properties": {
-                        "tile_id": tile_id,
-                        "cool_refuge_rank": round(
-                            0.5 * (1.0 - pred.temperature_anomaly_c) + 0.5 * pred.ventilation_score,
-                            3,
-                        ),
-                    },
-                }
+    geocoder_impl = geocoder or NominatimGeocoder(user_agent=cfg.geocoder_user_agent)
+    aoi = resolve_place(place, geocoder_impl)  # type: ignore[arg-type]
+    tiles = tile_aoi(aoi, tile_size_m=cfg.tile_size_m)
+    if not tiles:
+        raise ValueError(f"No tiles generated for AOI {aoi.name}")
+    providers = ProviderSet.from_config(cfg)
+    batches = spatial_batches(tiles, cfg.tile_batch_size)
+
+    def series_tasks(shared_cfg: Any, *shared_mosaics: Any) -> list[Any]:
+        static = [
+            dask.delayed(_static_tile_batch)([tiles[idx] for idx in batch], span, shared_cfg)
+            for batch in batches
+        ]
+        dynamic = [
+            dask.delayed(_dynamic_tile_batch)(
+                [tiles[idx] for idx in batch],
+                window,
+                shared_cfg,
+                shared_mosaics[w] if shared_mosaics else None,
             )
+            for w, window in enumerate(windows)
+            for batch in batches
+        ]
+        return static + dynamic
 
-    temperature_geojson = write_geojson(cfg.out_dir / "temperature_anomaly.geojson", temp_features)
-    ventilation_geojson = write_geojson(cfg.out_dir / "ventilation_score.geojson", vent_features)
-    refuges_geojson = write_geojson(cfg.out_dir / "cool_refuges.geojson", refuge_features)
+    static_inputs: list[Any] = [None] * len(tiles)
+    dynamic_inputs: list[list[Any]] = [[None] * len(tiles) for _ in windows]
+    with ExitStack() as stack:
+        shared: list[Any] = [cfg]
+        if cfg.zonal_aggregation:
+            # Each window's AOI mosaics are fetched once and published for its batches.
+            registry = (
+                stack.enter_context(SharedArrayRegistry()) if shares_host_memory(cfg) else None
+            )
+            shared.extend(
+                _surface_mosaics(aoi, window, providers, cfg, registry) for window in windows
+            )
+        for position, outputs in iter_completed(series_tasks, shared, cfg):
+            if position < len(batches):
+                target, batch = static_inputs, batches[position]
+            else:
+                w, b = divmod(position - len(batches), len(batches))
+                target, batch = dynamic_inputs[w], batches[b]
+            for idx, output in zip(batch, outputs, strict=True):
+                target[idx] = output
 
-    geoparquet_records = []
-    for pred in predictions:
-        geom_wkt = tile_geoms[pred.tile_id].wkt
-        feature = feature_map[pred.tile_id]
-        geoparquet_records.append(
-            {
-                "tile_id": pred.tile_id,
-                "geometry": geom_wkt,
-                "temperature_anomaly_c": pred.temperature_anomaly_c,
-                "ventilation_score": pred.ventilation_score,
-                "ndvi": feature.ndvi,
-                "ndbi": feature.ndbi,
-            }
+    tables = [
+        _assemble_tile_features(
+            [
+                _merge_tile_inputs(static, dynamic)[0]
+                for static, dynamic in zip(static_inputs, window_inputs, strict=True)
+            ]
         )
-    write_geoparquet(cfg.out_dir / "predictions.geoparquet", geoparquet_records)
+        for window_inputs in dynamic_inputs
+    ]
+    # Tile centroids are static, so one airflow graph serves every window.
+    graph = build_airflow_graph(tables[0].to_features())
+    engine = InferenceEngine(deterministic=cfg.deterministic)
+    predictions = [engine.predict(graph, table.to_features()) for table in tables]
 
-    try:
-        import xarray as xr
+    import xarray as xr
 
-        ds = xr.Dataset(
-            {
-                "temperature_anomaly_c": (
-                    "tile",
-                    np.array([p.temperature_anomaly_c for p in predictions]),
-                ),
-                "ventilation_score": ("tile", np.array([p.ventilation_score for p in predictions])),
-                "ndvi": ("tile", np.array([feature_map[p.tile_id].ndvi for p in predictions])),
-                "ndbi": ("tile", np.array([feature_map[p.tile_id].ndbi for p in predictions])),
-            },
-            coords={"tile": np.array([p.tile_id for p in predictions])},
-        )
-        ds.to_zarr(cfg.out_dir / "intermediate_tiles.zarr", mode="w")
-    except Exception as exc:
-        LOGGER.warning(
-            "Failed to write Zarr intermediate output.",
-            extra={"context": {"error": str(exc)}},
+    tile_ids = tables[0].tile_id.tolist()
+    variables: dict[str, Any] = {
+        name: (("time", "tile"), np.stack([table[name] for table in tables]))
+        for name in TILE_FEATURE_COLUMNS
+        if name not in ("lon", "lat")
+    }
+    for name in ("temperature_anomaly_c", "ventilation_score"):
+        variables[name] = (
+            ("time", "tile"),
+            np.array([[getattr(pred, name) for pred in window] for window in predictions]),
         )
-
-    square = int(np.ceil(np.sqrt(len(predictions))))
-    raster = np.zeros((square, square), dtype="float32")
-    for idx, pred in enumerate(predictions):
-        y = idx // square
-        x = idx % square
-        raster[y, x] = pred.temperature_anomaly_c
-    cog_path = write_optional_cog(cfg.out_dir / "temperature_anomaly.cog.tif", raster)
-
-    assumptions = [
-        "Deterministic fallback features are used when live providers are unavailable.",
-        "Thermal labels use Landsat-style synthetic priors when no clear-sky thermal scene is retrieved.",
-        "Tree planting recommendations are heuristic and should be validated with local planners.",
-    ]
-    report_path = write_markdown_report(
-        path=cfg.out_dir / "report.md",
-        place=place,
-        start_date=start,
-        end_date=end,
-        tile_features=tile_features,
-        predictions=predictions,
-        assumptions=assumptions,
+    cube = xr.Dataset(
+        variables,
+        coords={
+            "time": np.array([window.start for window in windows], dtype="datetime64[ns]"),
+            "time_end": ("time", np.array([w.end for w in windows], dtype="datetime64[ns]")),
+            "tile": np.asarray(tile_ids, dtype=object),
+            "lon": ("tile", tables[0]["lon"]),
+            "lat": ("tile", tables[0]["lat"]),
+        },
+        attrs={"place": place, "model_version": MODEL_VERSION},
+    )
+    cube_path = write_tile_cube(
+        cfg.out_dir / "time_series.zarr", cube, tile_chunk=cfg.output_batch_size
+    )
+    if cfg.tile_zarr_store is not None:
+        append_time_slices(cfg.tile_zarr_store, cube_path)
+    LOGGER.info(
+        "Completed time-series analysis",
+        extra={"context": {"place": place, "tiles": len(tiles), "windows": len(windows)}},
+    )
+    return TimeSeriesResult(
+        output_dir=cfg.out_dir, cube_zarr=cube_path, windows=windows, tile_ids=tile_ids
     )
 
-    summary = {
-        "place": place,
-        "aoi_bounds": aoi.bounds,
-        "time_range": {"start": start, "end": end},
-        "tile_features": [asdict(item) for item in tile_features],
-        "predictions": [asdict(item) for item in predictions],
-        "assumptions": assumptions,
-        "provider_details": per_tile_metadata,
-        "attribution": {
-            "sentinel2": sentinel.attribution(),
-            "landsat": landsat.attribution(),
-            "era5_land": meteo.attribution(),
-            "open_buildings": buildings.attribution(),
-            "osm_fallback": buildings_fallback.attribution(),
-            "kartaview": street.attribution(),
-            "mapillary_optional": MapillaryProvider(cfg.mapillary_access_token).attribution(),
-        },
+
+def _output_slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "aoi"
+
+
+def _output_slugs(names: Sequence[str]) -> dict[str, str]:
+    """Directory name per AOI; names whose slugs collide get a short hash suffix."""
+    slugs = {name: _output_slug(name) for name in names}
+    counts: dict[str, int] = {}
+    for slug in slugs.values():
+        # Compare case-insensitively, since output directories may be too.
+        counts[slug.lower()] = counts.get(slug.lower(), 0) + 1
+    return {
+        name: (
+            f"{slug}-{hashlib.sha256(name.encode('utf-8')).hexdigest()[:8]}"
+            if counts[slug.lower()] > 1
+            else slug
+        )
+        for name, slug in slugs.items()
     }
-    summary_path = cfg.out_dir / "predictions_summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
 
-    cache_key = cache.make_key(
-        {
-            "place": place,
-            "start": start,
-            "end": end,
-            "tile_count": len(tile_features),
-            "seed": cfg.seed,
-        }
-    )
-    cache.save_json(cache_key, summary)
 
+def analyze_many(
+    places: Sequence[str | AOI],
+    start: str = "2025-07-01",
+    end: str = "2025-07-31",
+    out_dir: str | Path = "./out",
+    geocoder: GeocoderProtocol | None = None,
+    config_overrides: dict[str, Any] | None = None,
+) -> BatchAnalysisResult:
+    """Analyze many places or AOIs as one planned batch.
+
+    Every AOI is tiled on the global snapped lattice (:func:`snapped_tiles`),
+    so tiles shared by neighbouring AOIs are fetched and featurized once,
+    with one provider set and one Dask graph for the whole batch. Outputs
+    are then written per AOI into ``out_dir/<name>``, where ``<name>`` is
+    the AOI name with unsafe characters replaced by ``_``. Names that would
+    share a directory get an eight-character hash suffix.
+    """
+    configure_logging()
+    started = time.perf_counter()
+    overrides = dict(config_overrides or {})
+    overrides["out_dir"] = Path(out_dir)
+    cfg = get_runtime_config(**overrides)
+    _seed_everything(cfg.seed, cfg.deterministic)
+    cfg.cache_dir.mkdir(parents=True, exist_ok=True)
+    cache = _cache_store(cfg)
+    time_range = TimeRange(start=date.fromisoformat(start), end=date.fromisoformat(end))
+
+    geocoder_impl = geocoder or NominatimGeocoder(user_agent=cfg.geocoder_user_agent)
+    aois: dict[str, AOI] = {}
+    for item in places:
+        name = item.name if isinstance(item, AOI) else item
+        if name not in aois:
+            aois[name] = (
+                item if isinstance(item, AOI) else resolve_place(item, geocoder_impl)  # type: ignore[arg-type]
+            )
+    if not aois:
+        raise ValueError("analyze_many needs at least one place or AOI.")
+
+    unique: dict[str, Tile] = {}
+    tile_ids: dict[str, list[str]] = {}
+    for name, aoi in aois.items():
+        tiles = snapped_tiles(aoi, cfg.tile_size_m)
+        if not tiles:
+            raise ValueError(f"No tiles generated for AOI {name}")
+        tile_ids[name] = [tile.tile_id for tile in tiles]
+        for tile in tiles:
+            unique.setdefault(tile.tile_id, tile)
+    requested = sum(len(ids) for ids in tile_ids.values())
     LOGGER.info(
-        "Completed analysis",
+        "Planned batch analysis",
         extra={
             "context": {
-                "place": place,
-                "tiles": len(tiles),
-                "out_dir": str(cfg.out_dir),
-                "cache_key": cache_key,
+                "aois": len(aois),
+                "requested_tiles": requested,
+                "unique_tiles": len(unique),
             }
         },
     )
 
-    return AnalysisResult(
-        output_dir=cfg.out_dir,
-        temperature_geojson=temperature_geojson,
-        ventilation_geojson=ventilation_geojson,
-        cool_refuges_geojson=refuges_geojson,
-        report_markdown=report_path,
-        optional_temperature_cog=cog_path,
+    providers = ProviderSet.from_config(cfg)
+    plan_tiles = list(unique.values())
+    extent = AOI(name="analyze_many", geometry=unary_union([aoi.geometry for aoi in aois.values()]))
+    plan_outputs = _compute_tile_outputs(plan_tiles, extent, time_range, providers, cfg, cache)
+    by_id = {
+        tile.tile_id: (tile, output) for tile, output in zip(plan_tiles, plan_outputs, strict=True)
+    }
+
+    slugs = _output_slugs(list(aois))
+    results: dict[str, AnalysisResult] = {}
+    for name, aoi in aois.items():
+        aoi_cfg = cfg.model_copy(update={"out_dir": cfg.out_dir / slugs[name]})
+        aoi_cfg.out_dir.mkdir(parents=True, exist_ok=True)
+        RunCache.detach(aoi_cfg.out_dir, list(_RUN_ARTIFACTS))
+        planned = (
+            [by_id[tile_id][0] for tile_id in tile_ids[name]],
+            [by_id[tile_id][1] for tile_id in tile_ids[name]],
+        )
+        stages = _analysis_stages(
+            name, start, end, aoi, time_range, providers, aoi_cfg, cache, planned=planned
+        )
+        outputs, records = StagePipeline(stages, cache).run()
+        results[name] = _analysis_result(aoi_cfg.out_dir, outputs, records)
+
+    batch = BatchAnalysisResult(
+        results=results,
+        requested_tiles=requested,
+        unique_tiles=len(unique),
+        elapsed_s=time.perf_counter() - started,
+    )
+    LOGGER.info(
+        "Completed batch analysis",
+        extra={
+            "context": {
+                "aois": len(results),
+                "requested_tiles": requested,
+                "unique_tiles": len(unique),
+                "elapsed_s": round(batch.elapsed_s, 3),
+                "tiles_per_second": round(batch.tiles_per_second, 2),
+            }
+        },
     )
+    return batch
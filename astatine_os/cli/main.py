@@ -7,12 +7,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from datetime import date
 from pathlib import Path
 
-from astatine_os.api import analyze_microclimate
+from astatine_os.api import (
+    analyze_many,
+    analyze_microclimate,
+    analyze_time_series,
+    split_time_range,
+    start_nowcast,
+)
 from astatine_os.config import get_runtime_config
 from astatine_os.data.aoi import NominatimGeocoder, resolve_place
+from astatine_os.data.io_summary import read_run_summary, summary_rows
 from astatine_os.data.providers import (
     ERA5LandProvider,
     KartaViewProvider,
@@ -26,6 +34,21 @@ from astatine_os.training.eval import evaluate_checkpoint
 from astatine_os.training.train import TrainConfig, run_training
 
 
+def _add_execution_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--scheduler",
+        choices=["distributed", "threads", "processes", "sync"],
+        default="distributed",
+        help="Dask backend; 'distributed' uses a local cluster kept alive for the process.",
+    )
+    parser.add_argument(
+        "--scheduler-address",
+        default=None,
+        help="Connect to an existing Dask scheduler instead of starting a local cluster.",
+    )
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="astatine-os")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -35,7 +58,73 @@ def _build_parser() -> argparse.ArgumentParser:
     analyze.add_argument("--start", required=True)
     analyze.add_argument("--end", required=True)
     analyze.add_argument("--out", required=True)
-    analyze.add_argument("--workers", type=int, default=2)
+    _add_execution_arguments(analyze)
+    analyze.add_argument(
+        "--raster-native",
+        action="store_true",
+        help="Also write pixel-resolution maps streamed block by block to Zarr.",
+    )
+    analyze.add_argument(
+        "--vector-tiles",
+        action="store_true",
+        help="Also write predictions.pmtiles with vector tiles for web maps.",
+    )
+    analyze.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Skip the whole-run cache and rewrite the artifacts; cached stages "
+            "and tile checkpoints are still reused."
+        ),
+    )
+    analyze.add_argument(
+        "--explain",
+        action="store_true",
+        help="Print which pipeline stages were served from the cache.",
+    )
+
+    many = sub.add_parser(
+        "analyze-many", help="Analyze many places as one batch with shared tiles."
+    )
+    places = many.add_mutually_exclusive_group(required=True)
+    places.add_argument("--places", nargs="+")
+    places.add_argument("--places-file", help="Text file with one place per line.")
+    many.add_argument("--start", required=True)
+    many.add_argument("--end", required=True)
+    many.add_argument("--out", required=True)
+    _add_execution_arguments(many)
+
+    series = sub.add_parser(
+        "analyze-series", help="Analyze one place over consecutive time windows."
+    )
+    series.add_argument("--place", required=True)
+    series.add_argument("--start", required=True)
+    series.add_argument("--end", required=True)
+    series.add_argument("--window-days", type=int, default=7)
+    series.add_argument("--out", required=True)
+    _add_execution_arguments(series)
+
+    nowcast = sub.add_parser(
+        "nowcast",
+        help="Keep surface scores resident and re-score meteorology slices read from stdin.",
+    )
+    nowcast.add_argument("--place", required=True)
+    nowcast.add_argument("--start", required=True, help="Start of the surface data period.")
+    nowcast.add_argument("--end", required=True, help="End of the surface data period.")
+    nowcast.add_argument("--out", required=True)
+
+    serve = sub.add_parser(
+        "serve",
+        help="Run a local HTTP service that queues analysis jobs on warm workers.",
+    )
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--socket", default=None, help="Listen on a Unix socket instead.")
+    serve.add_argument("--out", required=True)
+    serve.add_argument("--jobs", type=int, default=2, help="Analysis jobs run concurrently.")
+    serve.add_argument("--queue-size", type=int, default=64)
+    serve.add_argument("--memory-cache-mb", type=int, default=256)
+    _add_execution_arguments(serve)
 
     data = sub.add_parser("data", help="Data operations.")
     data_sub = data.add_subparsers(dest="data_command", required=True)
@@ -98,18 +187,8 @@ def _handle_data_fetch(args: argparse.Namespace) -> int:
 
 def _handle_report(args: argparse.Namespace) -> int:
     out_dir = Path(args.out).expanduser().resolve()
-    preds_file = out_dir / "predictions_summary.json"
-    if not preds_file.exists():
-        raise FileNotFoundError(f"Expected predictions summary at {preds_file}")
-    payload = json.loads(preds_file.read_text(encoding="utf-8"))
-    features = []
-    predictions = []
-    from astatine_os.graph.schemas import GraphPrediction, TileFeature
-
-    for item in payload["tile_features"]:
-        features.append(TileFeature(**item))
-    for item in payload["predictions"]:
-        predictions.append(GraphPrediction(**item))
+    manifest, tiles = read_run_summary(out_dir)
+    features, predictions = summary_rows(tiles)
     write_markdown_report(
         path=out_dir / "report.md",
         place=args.place,
@@ -117,12 +196,82 @@ def _handle_report(args: argparse.Namespace) -> int:
         end_date=args.end,
         tile_features=features,
         predictions=predictions,
-        assumptions=payload.get("assumptions", []),
+        assumptions=manifest.get("assumptions", []),
     )
     print(f"Wrote report to {out_dir / 'report.md'}")
     return 0
 
 
+def _execution_overrides(args: argparse.Namespace) -> dict[str, object]:
+    distributed = args.scheduler == "distributed" or args.scheduler_address is not None
+    overrides: dict[str, object] = {
+        "dask_workers": args.workers,
+        "use_dask_distributed": distributed,
+        "dask_scheduler_address": args.scheduler_address,
+        "reuse_dask_cluster": True,
+    }
+    if not distributed:
+        overrides["dask_scheduler"] = args.scheduler
+    return overrides
+
+
+def _run_nowcast(args: argparse.Namespace) -> int:
+    """Serve meteorology updates until stdin closes.
+
+    Each line is either ``<air_temp_c> <wind_m_s>`` for a forecast slice or
+    ``<start> <end>`` ISO dates for an ERA5 window.
+    """
+    session = start_nowcast(args.place, start=args.start, end=args.end)
+    out_dir = Path(args.out)
+    print(f"Nowcast ready for {len(session.tile_ids)} tiles.", flush=True)
+    for line in sys.stdin:
+        fields = line.split()
+        if not fields:
+            continue
+        try:
+            if len(fields) != 2:
+                raise ValueError("expected two values")
+            if "-" in fields[0][1:]:
+                update = session.refresh(
+                    TimeRange(
+                        start=date.fromisoformat(fields[0]), end=date.fromisoformat(fields[1])
+                    )
+                )
+            else:
+                update = session.update(float(fields[0]), float(fields[1]))
+        except ValueError as exc:
+            print(f"Ignoring line {line.strip()!r}: {exc}", flush=True)
+            continue
+        path = session.write(update, out_dir)
+        print(f"Updated {path} in {update.elapsed_s * 1000:.1f} ms", flush=True)
+    return 0
+
+
+def _run_service(args: argparse.Namespace) -> int:
+    """Serve analysis jobs until interrupted."""
+    from astatine_os.service import AnalysisService, make_server
+
+    service = AnalysisService(
+        Path(args.out),
+        config_overrides={
+            **_execution_overrides(args),
+            "memory_cache_mb": args.memory_cache_mb,
+        },
+        workers=args.jobs,
+        queue_size=args.queue_size,
+    )
+    server = make_server(service, host=args.host, port=args.port, unix_socket=args.socket)
+    print(f"Serving analysis jobs on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """Run CLI."""
     configure_logging()
@@ -135,10 +284,57 @@ def main(argv: list[str] | None = None) -> int:
             start=args.start,
             end=args.end,
             out_dir=Path(args.out),
-            config_overrides={"dask_workers": args.workers},
+            config_overrides={
+                **_execution_overrides(args),
+                "raster_native": args.raster_native,
+                "vector_tiles": args.vector_tiles,
+            },
+            force=args.force,
         )
+        if args.explain:
+            for record in result.stages:
+                print(f"{record.name:<16} {record.status:<5} {record.key[:12]}")
         print(f"Analysis complete. Outputs in {result.output_dir}")
         return 0
+    if args.command == "analyze-many":
+        places = args.places or [
+            line.strip()
+            for line in Path(args.places_file).read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        batch = analyze_many(
+            places,
+            start=args.start,
+            end=args.end,
+            out_dir=Path(args.out),
+            config_overrides=_execution_overrides(args),
+        )
+        print(
+            f"Analyzed {len(batch.results)} AOIs: {batch.unique_tiles} unique tiles "
+            f"({batch.requested_tiles} requested) in {batch.elapsed_s:.1f} s, "
+            f"{batch.tiles_per_second:.1f} tiles/s. Outputs in {Path(args.out)}"
+        )
+        return 0
+    if args.command == "analyze-series":
+        windows = split_time_range(
+            TimeRange(start=date.fromisoformat(args.start), end=date.fromisoformat(args.end)),
+            args.window_days,
+        )
+        series_result = analyze_time_series(
+            args.place,
+            windows,
+            out_dir=Path(args.out),
+            config_overrides=_execution_overrides(args),
+        )
+        print(
+            f"Analyzed {len(series_result.tile_ids)} tiles over {len(windows)} windows. "
+            f"Cube in {series_result.cube_zarr}"
+        )
+        return 0
+    if args.command == "nowcast":
+        return _run_nowcast(args)
+    if args.command == "serve":
+        return _run_service(args)
     if args.command == "data":
         if args.data_command == "list-providers":
             providers = [
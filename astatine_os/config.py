@@ -5,14 +5,36 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "astatine_os"
 
+# Settings that change how a run executes or where it writes, but not its results.
+EXECUTION_FIELDS: frozenset[str] = frozenset(
+    {
+        "cache_dir",
+        "out_dir",
+        "dask_workers",
+        "dask_threads_per_worker",
+        "use_dask_distributed",
+        "dask_processes",
+        "dask_scheduler",
+        "dask_scheduler_address",
+        "reuse_dask_cluster",
+        "tile_checkpoints",
+        "output_batch_size",
+        "memory_cache_mb",
+        "tile_zarr_store",
+        "geocoder_user_agent",
+        "mapillary_access_token",
+    }
+)
+
 
 class RuntimeConfig(BaseSettings):
     """Runtime configuration for analysis and training."""
@@ -32,18 +54,63 @@ class RuntimeConfig(BaseSettings):
     resolution_m: int = Field(default=10, ge=1, le=250)
     dask_workers: int = Field(default=2, ge=1, le=64)
     dask_threads_per_worker: int = Field(default=1, ge=1, le=8)
+    tile_batch_size: int = Field(default=16, ge=1, le=4096)
+    tile_checkpoints: bool = Field(default=True)
+    output_batch_size: int = Field(default=4096, ge=1, le=1_000_000)
+    memory_cache_mb: int = Field(default=0, ge=0)
+    tile_zarr_store: Path | None = Field(default=None)
     use_dask_distributed: bool = Field(default=True)
+    dask_processes: bool = Field(default=False)
+    dask_scheduler: Literal["threads", "processes", "sync"] = Field(default="threads")
+    dask_scheduler_address: str | None = Field(default=None)
+    reuse_dask_cluster: bool = Field(default=False)
     geocoder_user_agent: str = Field(default="astatine-os/0.1.0")
     era5_cds_url: str = Field(default="https://cds.climate.copernicus.eu/api")
     era5_cds_key: str | None = Field(default=None)
     mapillary_access_token: str | None = Field(default=None)
     enable_optional_live_calls: bool = Field(default=False)
+    raster_sky_view: bool = Field(default=False)
+    sky_view_azimuths: int = Field(default=16, ge=4, le=72)
+    sky_view_radius_m: float = Field(default=100.0, gt=0.0, le=500.0)
+    zonal_aggregation: bool = Field(default=False)
+    raster_native: bool = Field(default=False)
+    raster_chunk_px: int = Field(default=512, ge=16, le=8192)
+    geojson_layout: Literal["layers", "shared", "combined"] = Field(default="layers")
+    geojson_precision: int | None = Field(default=7, ge=0, le=15)
+    prediction_raster_resolution_m: float | None = Field(default=None, gt=0)
+    vector_tiles: bool = Field(default=False)
+    vector_tile_min_zoom: int = Field(default=10, ge=0, le=22)
+    vector_tile_max_zoom: int = Field(default=16, ge=0, le=22)
+    sentinel_composite: bool = Field(default=False)
+    provider_summaries: bool = Field(default=False)
+    spectral_backend: Literal["numpy", "numexpr", "numba"] = Field(default="numpy")
 
     @field_validator("cache_dir", "out_dir")
     @classmethod
     def _expand_path(cls, value: Path) -> Path:
         return value.expanduser().resolve()
 
+    @field_validator("tile_zarr_store")
+    @classmethod
+    def _expand_optional_path(cls, value: Path | None) -> Path | None:
+        return value.expanduser().resolve() if value is not None else None
+
+    @model_validator(mode="after")
+    def _check_vector_tile_zooms(self) -> RuntimeConfig:
+        if self.vector_tile_min_zoom > self.vector_tile_max_zoom:
+            raise ValueError(
+                f"vector_tile_min_zoom {self.vector_tile_min_zoom} is above "
+                f"vector_tile_max_zoom {self.vector_tile_max_zoom}."
+            )
+        return self
+
+    def output_fingerprint(self, exclude: Iterable[str] = ()) -> dict[str, Any]:
+        """JSON-serializable settings that can change analysis outputs, for cache keys.
+
+        Fields in ``exclude`` are dropped as well, for stages that never read them.
+        """
+        return self.model_dump(mode="json", exclude=set(EXECUTION_FIELDS) | set(exclude))
+
 
 def get_runtime_config(**overrides: Any) -> RuntimeConfig:
     """Build runtime config from environment variables and direct overrides."""
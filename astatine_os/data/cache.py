@@ -7,6 +7,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -14,11 +17,40 @@ import orjson
 
 
 class CacheStore:
-    """Filesystem cache with SHA256 content keys."""
+    """Filesystem cache with SHA256 content keys.
 
-    def __init__(self, root_dir: Path) -> None:
+    With ``memory_bytes`` the serialized entries most recently read or
+    written are also kept in an in-process LRU up to that size, so a
+    long-running process serves hot entries without touching the disk.
+    """
+
+    def __init__(self, root_dir: Path, memory_bytes: int = 0) -> None:
         self.root_dir = root_dir
         self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_bytes = memory_bytes
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_used = 0
+        self._memory_lock = threading.Lock()
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.memory_bytes:
+            return
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_used -= len(previous)
+            self._memory[key] = data
+            self._memory_used += len(data)
+            while self._memory_used > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_used -= len(evicted)
+
+    def _recall(self, key: str) -> bytes | None:
+        with self._memory_lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            return data
 
     def _key_to_path(self, key: str, suffix: str) -> Path:
         prefix = key[:2]
@@ -33,14 +65,54 @@ class CacheStore:
         return hashlib.sha256(encoded).hexdigest()
 
     def save_json(self, key: str, payload: dict[str, Any]) -> Path:
-        """Persist JSON payload under key."""
+        """Persist JSON payload under key.
+
+        The file is written beside its target and renamed into place, so a
+        crash mid-write never leaves a truncated entry behind.
+        """
         path = self._key_to_path(key, ".json")
-        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        if self.memory_bytes:
+            self._remember(key, data)
         return path
 
     def load_json(self, key: str) -> dict[str, Any] | None:
         """Load JSON payload by key if available."""
+        if self.memory_bytes:
+            data = self._recall(key)
+            if data is not None:
+                return orjson.loads(data)
         path = self._key_to_path(key, ".json")
         if not path.exists():
             return None
-        return orjson.loads(path.read_bytes())
+        data = path.read_bytes()
+        if self.memory_bytes:
+            self._remember(key, data)
+        return orjson.loads(data)
+
+    def load_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Load every available payload among ``keys``; missing keys are omitted."""
+        found: dict[str, dict[str, Any]] = {}
+        for key in keys:
+            payload = self.load_json(key)
+            if payload is not None:
+                found[key] = payload
+        return found
+
+
+_SHARED_STORES: dict[tuple[Path, int], CacheStore] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_cache_store(root_dir: Path, memory_bytes: int) -> CacheStore:
+    """Return the process-wide store for ``root_dir`` so its memory layer persists."""
+    key = (root_dir.expanduser().resolve(), memory_bytes)
+    with _SHARED_LOCK:
+        store = _SHARED_STORES.get(key)
+        if store is None:
+            store = CacheStore(root_dir, memory_bytes=memory_bytes)
+            _SHARED_STORES[key] = store
+        return store
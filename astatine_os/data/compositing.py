@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Cloud-masked temporal compositing with memory bounded by chunk size."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from astatine_os.data.grid import chunk_windows
+
+# Sentinel-2 scene classification classes excluded from composites: no data,
+# saturated, cloud shadow, cloud medium and high probability, cirrus, snow.
+SCL_INVALID_CLASSES: tuple[int, ...] = (0, 1, 3, 8, 9, 10, 11)
+
+WindowReader = Callable[[Any, Sequence[str], slice, slice], dict[str, np.ndarray]]
+
+
+class HistogramAccumulator:
+    """Per-pixel fixed-bin histograms over a stream of scenes for one chunk.
+
+    Memory is ``n_bins * pixels`` 16-bit counters regardless of how many
+    scenes are added. Percentiles are read back by interpolating inside the
+    bin holding the requested rank, so they are within half a bin width of
+    the exact value.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        n_bins: int = 256,
+        value_range: tuple[float, float] = (0.0, 1.0),
+    ) -> None:
+        self.shape = shape
+        self.n_bins = n_bins
+        self.low, self.high = value_range
+        self.bin_width = (self.high - self.low) / n_bins
+        pixels = shape[0] * shape[1]
+        self.counts = np.zeros((n_bins, pixels), dtype=np.uint16)
+        self.valid = np.zeros(pixels, dtype=np.uint16)
+        self._pixel_idx = np.arange(pixels)
+
+    def add(self, values: np.ndarray, valid: np.ndarray) -> None:
+        """Add one scene window; pixels where ``valid`` is False are skipped."""
+        mask = np.asarray(valid, dtype=bool).reshape(-1) & np.isfinite(values).reshape(-1)
+        kept = np.asarray(values, dtype="float64").reshape(-1)[mask]
+        bins = ((kept - self.low) / self.bin_width).astype(np.int64)
+        np.clip(bins, 0, self.n_bins - 1, out=bins)
+        # Each pixel contributes at most once per scene, so the fancy-indexed
+        # increment never sees duplicate (bin, pixel) pairs.
+        self.counts[bins, self._pixel_idx[mask]] += 1
+        self.valid[mask] += 1
+
+    def percentiles(self, percentiles: Sequence[float]) -> np.ndarray:
+        """Return ``(len(percentiles), rows, cols)`` float32; ``NaN`` where no scene was valid."""
+        total = self.valid.astype("float64")
+        targets = np.clip(
+            np.asarray(percentiles, dtype="float64")[:, np.newaxis] / 100.0 * total,
+            0.5,
+            np.maximum(total - 0.5, 0.5),
+        )
+        bin_idx = np.zeros(targets.shape, dtype=np.int64)
+        before = np.zeros(targets.shape, dtype="float64")
+        found = np.zeros(targets.shape, dtype=bool)
+        running = np.zeros_like(total)
+        # Scan bins with a running count instead of materializing a cumulative
+        # histogram; empty bins cannot hold a rank and are skipped.
+        for bin_no in range(self.n_bins):
+            counts = self.counts[bin_no]
+            if not counts.any():
+                continue
+            reached = running + counts
+            hit = (reached > targets) & ~found
+            bin_idx[hit] = bin_no
+            before[hit] = np.broadcast_to(running, targets.shape)[hit]
+            found |= hit
+            running = reached
+        in_bin = self.counts[bin_idx, self._pixel_idx].astype("float64")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = self.low + self.bin_width * (bin_idx + (targets - before) / in_bin)
+        values[:, total == 0] = np.nan
+        return values.astype("float32").reshape((len(percentiles), *self.shape))
+
+
+def composite_scenes(
+    read_window: WindowReader,
+    scenes: Sequence[Any],
+    shape: tuple[int, int],
+    bands: Sequence[str],
+    percentiles: Sequence[float] = (50.0,),
+    chunk_size: int = 256,
+    n_bins: int = 256,
+    value_range: tuple[float, float] = (0.0, 1.0),
+    scl_band: str = "SCL",
+    invalid_classes: Sequence[int] = SCL_INVALID_CLASSES,
+    fill_scene: Any | None = None,
+) -> dict[str, np.ndarray]:
+    """Composite a scene stack into per-pixel percentiles one chunk at a time.
+
+    ``read_window(scene, bands, rows, cols)`` returns the requested bands plus
+    ``scl_band`` for a pixel window of one scene. For every chunk and band the
+    scenes are read one by one into a :class:`HistogramAccumulator`, so peak
+    memory depends on ``chunk_size`` and ``n_bins`` but not on the number of
+    scenes. Outputs are keyed ``<band>_p<q>`` plus ``valid_count``.
+
+    Pixels without any valid observation are ``NaN`` unless ``fill_scene`` is
+    given, in which case they take that scene's value regardless of its mask.
+    ``valid_count`` stays 0 for them.
+    """
+    outputs = {
+        f"{band}_p{q:g}": np.full(shape, np.nan, dtype="float32")
+        for band in bands
+        for q in percentiles
+    }
+    valid_count = np.zeros(shape, dtype=np.uint16)
+    invalid = np.asarray(invalid_classes)
+    for rows, cols in chunk_windows(shape, chunk_size):
+        window_shape = (rows.stop - rows.start, cols.stop - cols.start)
+        for band in bands:
+            acc = HistogramAccumulator(window_shape, n_bins, value_range)
+            for scene in scenes:
+                window = read_window(scene, [band, scl_band], rows, cols)
+                acc.add(window[band], ~np.isin(window[scl_band], invalid))
+            empty = acc.valid.reshape(window_shape) == 0
+            fill = None
+            if fill_scene is not None and empty.any():
+                fill = np.asarray(read_window(fill_scene, [band], rows, cols)[band])
+            for q, values in zip(percentiles, acc.percentiles(percentiles), strict=True):
+                if fill is not None:
+                    values[empty] = fill[empty]
+                outputs[f"{band}_p{q:g}"][rows, cols] = values
+            valid_count[rows, cols] = acc.valid.reshape(window_shape)
+    outputs["valid_count"] = valid_count
+    return outputs
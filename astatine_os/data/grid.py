@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Regular WGS84 raster grids and polygon rasterization."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import shapely
+
+_METERS_PER_DEGREE = 111_320.0
+
+
+@dataclass(frozen=True)
+class RasterGrid:
+    """North-up pixel grid covering a WGS84 bounding box."""
+
+    minx: float
+    miny: float
+    maxx: float
+    maxy: float
+    width: int
+    height: int
+    crs: str = "EPSG:4326"
+
+    @classmethod
+    def from_bounds(
+        cls, bounds: tuple[float, float, float, float], resolution_m: float
+    ) -> RasterGrid:
+        """Build a grid with approximately ``resolution_m`` square pixels."""
+        minx, miny, maxx, maxy = bounds
+        center_lat = (miny + maxy) / 2.0
+        width_m = (maxx - minx) * _METERS_PER_DEGREE * max(math.cos(math.radians(center_lat)), 0.2)
+        height_m = (maxy - miny) * _METERS_PER_DEGREE
+        return cls(
+            minx=minx,
+            miny=miny,
+            maxx=maxx,
+            maxy=maxy,
+            width=max(1, math.ceil(width_m / resolution_m)),
+            height=max(1, math.ceil(height_m / resolution_m)),
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return ``(height, width)`` in pixels."""
+        return (self.height, self.width)
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Return minx, miny, maxx, maxy."""
+        return (self.minx, self.miny, self.maxx, self.maxy)
+
+    @property
+    def res_x(self) -> float:
+        """Pixel width in degrees."""
+        return (self.maxx - self.minx) / self.width
+
+    @property
+    def res_y(self) -> float:
+        """Pixel height in degrees."""
+        return (self.maxy - self.miny) / self.height
+
+    @property
+    def pixel_size_m(self) -> tuple[float, float]:
+        """Approximate pixel ``(width, height)`` in meters at the grid center."""
+        center_lat = (self.miny + self.maxy) / 2.0
+        scale_x = _METERS_PER_DEGREE * max(math.cos(math.radians(center_lat)), 0.2)
+        return (self.res_x * scale_x, self.res_y * _METERS_PER_DEGREE)
+
+    @property
+    def transform(self) -> tuple[float, float, float, float, float, float]:
+        """Affine coefficients ``(a, b, c, d, e, f)`` as used by rasterio."""
+        return (self.res_x, 0.0, self.minx, 0.0, -self.res_y, self.maxy)
+
+    def window(self, rows: slice, cols: slice) -> RasterGrid:
+        """Return the sub-grid covering a ``(rows, cols)`` pixel window."""
+        row0, row1, _ = rows.indices(self.height)
+        col0, col1, _ = cols.indices(self.width)
+        return RasterGrid(
+            minx=self.minx + col0 * self.res_x,
+            miny=self.maxy - row1 * self.res_y,
+            maxx=self.minx + col1 * self.res_x,
+            maxy=self.maxy - row0 * self.res_y,
+            width=col1 - col0,
+            height=row1 - row0,
+            crs=self.crs,
+        )
+
+    def pixel_centers(
+        self, rows: slice = slice(None), cols: slice = slice(None)
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return 1-D x and y center coordinates for a row/column window."""
+        col_idx = np.arange(self.width)[cols]
+        row_idx = np.arange(self.height)[rows]
+        xs = self.minx + (col_idx + 0.5) * self.res_x
+        ys = self.maxy - (row_idx + 0.5) * self.res_y
+        return xs, ys
+
+    def window_for_bounds(
+        self, bounds: tuple[float, float, float, float]
+    ) -> tuple[slice, slice] | None:
+        """Return ``(rows, cols)`` slices of pixels whose centers may fall in ``bounds``."""
+        minx, miny, maxx, maxy = bounds
+        col0 = max(0, math.floor((minx - self.minx) / self.res_x - 0.5))
+        col1 = min(self.width, math.ceil((maxx - self.minx) / self.res_x + 0.5))
+        row0 = max(0, math.floor((self.maxy - maxy) / self.res_y - 0.5))
+        row1 = min(self.height, math.ceil((self.maxy - miny) / self.res_y + 0.5))
+        if col0 >= col1 or row0 >= row1:
+            return None
+        return slice(row0, row1), slice(col0, col1)
+
+
+def chunk_windows(shape: tuple[int, int], chunk_size: int) -> Iterator[tuple[slice, slice]]:
+    """Yield ``(rows, cols)`` slices tiling ``shape`` in row-major order."""
+    height, width = shape
+    for row0 in range(0, height, chunk_size):
+        for col0 in range(0, width, chunk_size):
+            yield (
+                slice(row0, min(row0 + chunk_size, height)),
+                slice(col0, min(col0 + chunk_size, width)),
+            )
+
+
+def hilbert_index(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounds: tuple[float, float, float, float],
+    order: int = 16,
+) -> np.ndarray:
+    """Position of points along a Hilbert curve of ``2**order`` cells per side over ``bounds``.
+
+    Sorting by this index keeps spatially close points close in sequence.
+    """
+    minx, miny, maxx, maxy = bounds
+    side = 1 << order
+    span_x = max(maxx - minx, 1e-12)
+    span_y = max(maxy - miny, 1e-12)
+    cx = np.clip(((np.asarray(x) - minx) / span_x * side).astype(np.int64), 0, side - 1)
+    cy = np.clip(((np.asarray(y) - miny) / span_y * side).astype(np.int64), 0, side - 1)
+    index = np.zeros(cx.shape, dtype=np.int64)
+    step = side >> 1
+    while step > 0:
+        rx = (cx & step) > 0
+        ry = (cy & step) > 0
+        index += step * step * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the sub-curve connects to its neighbours.
+        flip = ~ry & rx
+        cx = np.where(flip, side - 1 - cx, cx)
+        cy = np.where(flip, side - 1 - cy, cy)
+        swap = ~ry
+        cx, cy = np.where(swap, cy, cx), np.where(swap, cx, cy)
+        step >>= 1
+    return index
+
+
+def rasterize_polygons(
+    geometries: Sequence[Any],
+    values: Sequence[float] | np.ndarray,
+    grid: RasterGrid,
+    fill: float = 0.0,
+    dtype: str = "float32",
+) -> np.ndarray:
+    """Burn polygon values onto ``grid`` by pixel-center containment.
+
+    Each polygon only tests the pixels inside its own bounding window, so the
+    cost scales with covered area rather than polygons times grid size. Later
+    polygons overwrite earlier ones where they overlap.
+    """
+    out = np.full(grid.shape, fill, dtype=dtype)
+    values_arr = np.asarray(values)
+    for geom, value in zip(geometries, values_arr, strict=True):
+        if geom is None or geom.is_empty:
+            continue
+        window = grid.window_for_bounds(geom.bounds)
+        if window is None:
+            continue
+        rows, cols = window
+        xs, ys = grid.pixel_centers(rows, cols)
+        inside = shapely.contains_xy(geom, xs[np.newaxis, :], ys[:, np.newaxis])
+        out[rows, cols][inside] = value
+    return out
@@ -6,9 +6,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
+from astatine_os.data.grid import RasterGrid
+from astatine_os.data.io_zarr import consolidate_store
 from astatine_os.logging import get_logger
 
 LOGGER = get_logger(__name__)
@@ -47,3 +50,85 @@ def write_optional_cog(path: Path, raster: np.ndarray) -> Path | None:
     rio_copy(tmp, path, driver="COG")
     tmp.unlink(missing_ok=True)
     return path
+
+
+def write_raster_zarr(path: Path, layers: dict[str, Any], grid: RasterGrid) -> Path:
+    """Stream lazily computed rasters on ``grid`` into a Zarr store block by block.
+
+    ``layers`` map variable names to 2-D Dask arrays; each chunk is computed and
+    written independently, so memory is bounded by chunk size times workers.
+    Metadata is consolidated once all blocks are written.
+    """
+    import xarray as xr
+
+    xs, ys = grid.pixel_centers()
+    ds = xr.Dataset(
+        {name: (("y", "x"), array) for name, array in layers.items()},
+        coords={"y": ys, "x": xs},
+        attrs={"crs": grid.crs, "transform": list(grid.transform)},
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ds.to_zarr(path, mode="w", compute=True, consolidated=False)
+    consolidate_store(path)
+    return path
+
+
+def overview_factors(shape: tuple[int, int], min_size: int = 256) -> list[int]:
+    """Power-of-two overview factors down to roughly one ``min_size`` block."""
+    factors = []
+    factor = 2
+    while max(shape) / factor >= min_size / 2:
+        factors.append(factor)
+        factor *= 2
+    return factors
+
+
+def write_blocks_cog(path: Path, array: Any, grid: RasterGrid) -> Path | None:
+    """Write a 2-D Dask array as a georeferenced COG using windowed block writes.
+
+    Only one chunk is held in memory at a time. Overviews are built once after
+    the last window, with levels matched to the raster size.
+    """
+    try:
+        import rasterio
+        from rasterio.enums import Resampling
+        from rasterio.shutil import copy as rio_copy
+        from rasterio.transform import Affine
+        from rasterio.windows import Window
+    except Exception:
+        LOGGER.warning("rasterio is unavailable; skipping COG export.")
+        return None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp.tif")
+    profile = {
+        "driver": "GTiff",
+        "height": grid.height,
+        "width": grid.width,
+        "count": 1,
+        "dtype": str(array.dtype),
+        "crs": grid.crs,
+        "transform": Affine(*grid.transform),
+        "nodata": np.nan,
+        "compress": "DEFLATE",
+        "tiled": True,
+        "blockxsize": 256,
+        "blockysize": 256,
+    }
+    row_offsets = np.cumsum((0,) + array.chunks[0])
+    col_offsets = np.cumsum((0,) + array.chunks[1])
+    with rasterio.open(tmp, "w", **profile) as dst:
+        for i in range(len(array.chunks[0])):
+            for j in range(len(array.chunks[1])):
+                block = np.asarray(array.blocks[i, j].compute())
+                window = Window(
+                    int(col_offsets[j]), int(row_offsets[i]), block.shape[1], block.shape[0]
+                )
+                dst.write(block, 1, window=window)
+        factors = overview_factors(grid.shape)
+        if factors:
+            dst.build_overviews(factors, Resampling.average)
+        dst.update_tags(ns="rio_overview", resampling="average")
+    rio_copy(tmp, path, driver="COG")
+    tmp.unlink(missing_ok=True)
+    return path
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Columnar run summary: a small JSON manifest beside Arrow and Parquet tables."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from astatine_os.graph.schemas import (
+    TILE_FEATURE_COLUMNS,
+    GraphPrediction,
+    TileFeature,
+    TileFeatureTable,
+)
+
+SUMMARY_MANIFEST = "predictions_summary.json"
+SUMMARY_TILES = "summary_tiles.arrow"
+PROVIDER_METADATA = "provider_metadata.parquet"
+
+PREDICTION_COLUMNS = ("temperature_anomaly_c", "ventilation_score")
+
+
+PER_TILE_METADATA_FIELDS = frozenset({"seed", "shape"})
+
+
+def _metadata_id(provider: str, encoded: str) -> str:
+    return hashlib.sha256(f"{provider}\n{encoded}".encode()).hexdigest()[:16]
+
+
+def _is_per_tile_field(name: str) -> bool:
+    return name in PER_TILE_METADATA_FIELDS or name.endswith("_count")
+
+
+def _tile_column(values: list[Any]) -> pa.Array:
+    present = [value for value in values if value is not None]
+    if present and all(
+        isinstance(value, int) and not isinstance(value, bool) and value >= 0 for value in present
+    ):
+        return pa.array(values, pa.uint64())
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        encoded = [None if value is None else json.dumps(value, default=str) for value in values]
+        return pa.array(encoded, pa.string())
+
+
+def normalize_provider_metadata(
+    per_tile_metadata: Sequence[dict[str, Any]],
+) -> tuple[dict[str, pa.Array], pa.Table]:
+    """Split per-tile metadata into tile columns and a deduplicated provider table.
+
+    Scalar entries such as ``thermal_mean_k`` become one float column each.
+    Fields of ``provider_metadata[provider]`` that differ per tile by nature
+    (``seed``, ``shape`` and ``*_count``) become ``<provider>_<field>``
+    columns. The rest of each provider dict is stored once in the returned
+    table under a content hash, and tiles refer to it through a
+    ``<provider>_metadata_id`` column, so a run has about one side row per
+    provider and source.
+    """
+    scalar_names = sorted(
+        {key for meta in per_tile_metadata for key in meta} - {"tile_id", "provider_metadata"}
+    )
+    providers = sorted(
+        {name for meta in per_tile_metadata for name in meta.get("provider_metadata", {})}
+    )
+    tile_fields = {
+        provider: sorted(
+            {
+                name
+                for meta in per_tile_metadata
+                for name in meta.get("provider_metadata", {}).get(provider, {})
+                if _is_per_tile_field(name)
+            }
+        )
+        for provider in providers
+    }
+    values: dict[str, list[Any]] = {name: [] for name in scalar_names}
+    for provider in providers:
+        values[f"{provider}_metadata_id"] = []
+        values.update({f"{provider}_{name}": [] for name in tile_fields[provider]})
+    side: dict[str, tuple[str, str]] = {}
+    for meta in per_tile_metadata:
+        for name in scalar_names:
+            values[name].append(float(meta.get(name, np.nan)))
+        provider_metadata = meta.get("provider_metadata", {})
+        for provider in providers:
+            entry = provider_metadata.get(provider)
+            for name in tile_fields[provider]:
+                values[f"{provider}_{name}"].append(None if entry is None else entry.get(name))
+            if entry is None:
+                values[f"{provider}_metadata_id"].append(None)
+                continue
+            shared = {key: value for key, value in entry.items() if not _is_per_tile_field(key)}
+            encoded = json.dumps(shared, sort_keys=True, default=str)
+            metadata_id = _metadata_id(provider, encoded)
+            side.setdefault(metadata_id, (provider, encoded))
+            values[f"{provider}_metadata_id"].append(metadata_id)
+    columns: dict[str, pa.Array] = {}
+    for name, column in values.items():
+        if name in scalar_names:
+            columns[name] = pa.array(column, pa.float64())
+        elif name.endswith("_metadata_id"):
+            columns[name] = pa.array(column, pa.string())
+        else:
+            columns[name] = _tile_column(column)
+    table = pa.table(
+        {
+            "metadata_id": pa.array(list(side), pa.string()),
+            "provider": pa.array([provider for provider, _ in side.values()], pa.string()),
+            "metadata": pa.array([encoded for _, encoded in side.values()], pa.string()),
+        }
+    )
+    return columns, table
+
+
+def write_run_summary(
+    out_dir: Path,
+    manifest: dict[str, Any],
+    table: TileFeatureTable,
+    predictions: Sequence[GraphPrediction],
+    per_tile_metadata: Sequence[dict[str, Any]],
+) -> list[Path]:
+    """Write tile features, predictions and provider metadata as a columnar summary.
+
+    ``summary_tiles.arrow`` is an uncompressed Arrow IPC file with one row per
+    tile, so readers can memory-map it, including the per-tile provider
+    fields such as seeds. ``provider_metadata.parquet`` holds each distinct
+    remainder of a provider metadata dict once. ``predictions_summary.json``
+    keeps ``manifest`` plus the file names and row counts. Returns the three
+    paths, manifest first.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    by_tile = {item.tile_id: item for item in predictions}
+    tile_ids = table.tile_id.tolist()
+    ordered = [by_tile[tile_id] for tile_id in tile_ids]
+    metadata_by_tile = {meta["tile_id"]: meta for meta in per_tile_metadata}
+    detail_columns, provider_table = normalize_provider_metadata(
+        [metadata_by_tile.get(tile_id, {"tile_id": tile_id}) for tile_id in tile_ids]
+    )
+    arrays: dict[str, pa.Array] = {"tile_id": pa.array(tile_ids, pa.string())}
+    arrays.update({name: pa.array(table[name]) for name in TILE_FEATURE_COLUMNS})
+    arrays.update(
+        {
+            name: pa.array(np.fromiter((getattr(item, name) for item in ordered), "float64"))
+            for name in PREDICTION_COLUMNS
+        }
+    )
+    arrays.update(detail_columns)
+    tiles = pa.table(arrays)
+
+    tiles_path = out_dir / SUMMARY_TILES
+    with pa.OSFile(str(tiles_path), "wb") as sink, pa.ipc.new_file(sink, tiles.schema) as writer:
+        writer.write_table(tiles)
+    metadata_path = out_dir / PROVIDER_METADATA
+    pq.write_table(provider_table, metadata_path, compression="zstd")
+
+    manifest_path = out_dir / SUMMARY_MANIFEST
+    payload = {
+        **manifest,
+        "tiles": {"path": SUMMARY_TILES, "rows": tiles.num_rows, "columns": tiles.column_names},
+        "provider_metadata": {"path": PROVIDER_METADATA, "rows": provider_table.num_rows},
+    }
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    return [manifest_path, tiles_path, metadata_path]
+
+
+def read_run_summary(out_dir: Path) -> tuple[dict[str, Any], pa.Table]:
+    """Return the manifest and the memory-mapped per-tile table of a run."""
+    manifest_path = out_dir / SUMMARY_MANIFEST
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Expected predictions summary at {manifest_path}")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    source = pa.memory_map(str(out_dir / manifest["tiles"]["path"]), "r")
+    return manifest, pa.ipc.open_file(source).read_all()
+
+
+def read_provider_metadata(out_dir: Path) -> dict[str, dict[str, Any]]:
+    """Return the provider metadata dicts of a run keyed by ``metadata_id``."""
+    table = pq.read_table(out_dir / PROVIDER_METADATA).to_pydict()
+    return {
+        metadata_id: json.loads(encoded)
+        for metadata_id, encoded in zip(table["metadata_id"], table["metadata"], strict=True)
+    }
+
+
+def summary_rows(tiles: pa.Table) -> tuple[list[TileFeature], list[GraphPrediction]]:
+    """Convert a summary table back into feature and prediction rows."""
+    tile_ids = tiles.column("tile_id").to_pylist()
+    features = TileFeatureTable.from_columns(
+        tile_ids,
+        {name: tiles.column(name).to_numpy() for name in TILE_FEATURE_COLUMNS},
+    ).to_features()
+    columns = {name: tiles.column(name).to_pylist() for name in PREDICTION_COLUMNS}
+    predictions = [
+        GraphPrediction(tile_id=tile_id, **{name: columns[name][idx] for name in columns})
+        for idx, tile_id in enumerate(tile_ids)
+    ]
+    return features, predictions
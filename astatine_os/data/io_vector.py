@@ -6,27 +6,257 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
+import numpy as np
+import orjson
 import pyarrow as pa
 import pyarrow.parquet as pq
+import shapely
+from shapely.geometry import mapping
+from shapely.geometry.base import BaseGeometry
+
+from astatine_os.data.grid import hilbert_index
 
 
 def write_geojson(path: Path, features: list[dict[str, Any]]) -> Path:
     """Write a feature collection to GeoJSON."""
     path.parent.mkdir(parents=True, exist_ok=True)
     collection = {"type": "FeatureCollection", "features": features}
-    path.write_text(json.dumps(collection, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(collection, option=orjson.OPT_SERIALIZE_NUMPY))
     return path
 
 
-def write_geoparquet(path: Path, records: list[dict[str, Any]]) -> Path:
-    """Write records to GeoParquet-style table with WKT geometries."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if records:
-        table = pa.Table.from_pylist(records)
-    else:
-        table = pa.table({"tile_id": pa.array([], type=pa.string())})
-    pq.write_table(table, path)
+def encode_geometries(
+    geometries: Sequence[BaseGeometry], precision: int | None = None
+) -> list[bytes]:
+    """Serialize geometries to GeoJSON once, rounding coordinates to ``precision`` decimals.
+
+    The encoded bytes can be passed to :meth:`GeoJSONStreamWriter.write_encoded`
+    for every layer that shares the geometries.
+    """
+    geoms = np.asarray(geometries, dtype=object)
+    if precision is not None:
+        geoms = shapely.transform(geoms, lambda coords: np.round(coords, precision))
+    return [orjson.dumps(mapping(geom)) for geom in geoms]
+
+
+def hilbert_order(geometries: Sequence[BaseGeometry]) -> np.ndarray:
+    """Row order that sorts ``geometries`` along a Hilbert curve through their bbox centres."""
+    if not len(geometries):
+        return np.zeros(0, dtype=np.int64)
+    bounds = shapely.bounds(np.asarray(geometries, dtype=object))
+    cx = (bounds[:, 0] + bounds[:, 2]) / 2.0
+    cy = (bounds[:, 1] + bounds[:, 3]) / 2.0
+    extent = (float(cx.min()), float(cy.min()), float(cx.max()), float(cy.max()))
+    return np.argsort(hilbert_index(cx, cy, extent), kind="stable")
+
+
+def write_geoparquet(
+    path: Path,
+    geometries: Sequence[BaseGeometry],
+    columns: dict[str, Any],
+    row_group_size: int = 4096,
+    compression: str = "zstd",
+) -> Path:
+    """Write a GeoParquet 1.1 file with rows sorted along a Hilbert curve.
+
+    ``columns`` maps attribute names to arrays with one value per geometry.
+    """
+    order = hilbert_order(geometries)
+    sorted_columns = {name: np.asarray(values)[order] for name, values in columns.items()}
+    schema = pa.table(sorted_columns).schema if sorted_columns else pa.schema([])
+    with GeoParquetStreamWriter(
+        path, schema, row_group_size=row_group_size, compression=compression
+    ) as writer:
+        writer.write_batch(np.asarray(geometries, dtype=object)[order], sorted_columns)
     return path
+
+
+class GeoJSONStreamWriter:
+    """Write GeoJSON features incrementally without holding the collection.
+
+    By default the file is a standard ``FeatureCollection`` whose features
+    are appended one per line; with ``newline_delimited`` each line is a bare
+    feature (GeoJSONSeq / NDJSON). The collection is closed by :meth:`close`.
+    Features are serialized with orjson into a buffered binary handle.
+    """
+
+    def __init__(self, path: Path, newline_delimited: bool = False) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.newline_delimited = newline_delimited
+        self.count = 0
+        self._handle = path.open("wb", buffering=1 << 20)
+        if not newline_delimited:
+            self._handle.write(b'{"type":"FeatureCollection","features":[\n')
+
+    def _write_raw(self, feature: bytes) -> None:
+        if self.count and not self.newline_delimited:
+            self._handle.write(b",\n")
+        self._handle.write(feature)
+        if self.newline_delimited:
+            self._handle.write(b"\n")
+        self.count += 1
+
+    def write(self, feature: dict[str, Any]) -> None:
+        """Append one feature."""
+        self._write_raw(orjson.dumps(feature, option=orjson.OPT_SERIALIZE_NUMPY))
+
+    def write_encoded(self, geometry: bytes | None, properties: dict[str, Any]) -> None:
+        """Append one feature whose geometry was serialized by :func:`encode_geometries`.
+
+        ``None`` writes a feature without geometry, for attribute-only layers.
+        """
+        self._write_raw(
+            b'{"type":"Feature","geometry":'
+            + (geometry if geometry is not None else b"null")
+            + b',"properties":'
+            + orjson.dumps(properties, option=orjson.OPT_SERIALIZE_NUMPY)
+            + b"}"
+        )
+
+    def close(self) -> Path:
+        """Finish the file and return its path."""
+        if not self._handle.closed:
+            if not self.newline_delimited:
+                self._handle.write(b"\n]}\n")
+            self._handle.close()
+        return self.path
+
+    def __enter__(self) -> GeoJSONStreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+_BBOX_TYPE = pa.struct(
+    [
+        ("xmin", pa.float64()),
+        ("ymin", pa.float64()),
+        ("xmax", pa.float64()),
+        ("ymax", pa.float64()),
+    ]
+)
+
+_GEOMETRY_TYPES = {
+    0: "Point",
+    1: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+
+class GeoParquetStreamWriter:
+    """Write a GeoParquet 1.1 file in row-group batches.
+
+    ``schema`` lists the attribute columns. Each batch is built column by
+    column: geometries are encoded as WKB in ``geometry`` and their extents
+    in a ``bbox`` struct column, declared as the bbox covering, so readers
+    can skip row groups using Parquet statistics. Batches are buffered until
+    ``row_group_size`` rows are available, and the ``geo`` metadata with the
+    geometry types and overall bbox is added when the file is closed. Rows
+    are written in the order given; sort them (see :func:`hilbert_order`)
+    for effective pruning.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        schema: pa.Schema,
+        row_group_size: int = 4096,
+        compression: str = "zstd",
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.attributes = schema
+        self.schema = schema.append(pa.field("geometry", pa.binary())).append(
+            pa.field("bbox", _BBOX_TYPE)
+        )
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._pending: list[pa.Table] = []
+        self._pending_rows = 0
+        self._types: set[str] = set()
+        self._extent = np.array([np.inf, np.inf, -np.inf, -np.inf])
+        self._writer = pq.ParquetWriter(
+            path, self.schema, compression=compression, store_schema=False
+        )
+        self._closed = False
+
+    def write_batch(self, geometries: Sequence[BaseGeometry], columns: dict[str, Any]) -> None:
+        """Buffer one batch of rows; ``columns`` holds one array per attribute column."""
+        geoms = np.asarray(geometries, dtype=object)
+        if not len(geoms):
+            return
+        bounds = shapely.bounds(geoms)
+        self._extent[:2] = np.minimum(self._extent[:2], np.nanmin(bounds[:, :2], axis=0))
+        self._extent[2:] = np.maximum(self._extent[2:], np.nanmax(bounds[:, 2:], axis=0))
+        self._types.update(_GEOMETRY_TYPES[int(t)] for t in np.unique(shapely.get_type_id(geoms)))
+        arrays = [pa.array(columns[field.name], type=field.type) for field in self.attributes]
+        arrays.append(pa.array(shapely.to_wkb(geoms), type=pa.binary()))
+        arrays.append(
+            pa.StructArray.from_arrays(
+                [pa.array(bounds[:, idx]) for idx in range(4)], fields=list(_BBOX_TYPE)
+            )
+        )
+        self._pending.append(pa.Table.from_arrays(arrays, schema=self.schema))
+        self._pending_rows += len(geoms)
+        self.count += len(geoms)
+        while self._pending_rows >= self.row_group_size:
+            self._flush(self.row_group_size)
+
+    def _flush(self, rows: int) -> None:
+        table = pa.concat_tables(self._pending)
+        self._writer.write_table(table.slice(0, rows), row_group_size=rows)
+        rest = table.slice(rows)
+        self._pending = [rest] if rest.num_rows else []
+        self._pending_rows = rest.num_rows
+
+    def flush(self) -> None:
+        """Write all buffered rows as one row group."""
+        if self._pending_rows:
+            self._flush(self._pending_rows)
+
+    def geo_metadata(self) -> dict[str, Any]:
+        """GeoParquet ``geo`` metadata for the rows written so far."""
+        column: dict[str, Any] = {
+            "encoding": "WKB",
+            "geometry_types": sorted(self._types),
+            "covering": {"bbox": {key: ["bbox", key] for key in ("xmin", "ymin", "xmax", "ymax")}},
+        }
+        if self.count:
+            column["bbox"] = [float(value) for value in self._extent]
+        return {"version": "1.1.0", "primary_column": "geometry", "columns": {"geometry": column}}
+
+    def close(self) -> Path:
+        """Flush remaining rows, add the ``geo`` metadata and finish the file."""
+        if not self._closed:
+            self.flush()
+            self._writer.add_key_value_metadata({"geo": json.dumps(self.geo_metadata())})
+            self._writer.close()
+            self._closed = True
+        return self.path
+
+    def __enter__(self) -> GeoParquetStreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Chunked ``(time, tile)`` Zarr stores for per-tile tables."""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+DIMS = ("time", "tile")
+
+# Group metadata files of Zarr format 3 and format 2 stores.
+_GROUP_FILES = ("zarr.json", ".zgroup")
+
+
+def _zarr_major() -> int:
+    import zarr
+
+    return int(zarr.__version__.split(".")[0])
+
+
+def tile_cube_encoding(ds: Any, tile_chunk: int, clevel: int = 3) -> dict[str, dict[str, Any]]:
+    """Chunking and Blosc/Zstd codecs for every ``(time, tile)`` variable of ``ds``.
+
+    One chunk holds one time step of ``tile_chunk`` tiles, so appending a time
+    step writes new chunks only and a time slice reads whole chunks. The codec
+    is spelled for the installed zarr: ``compressors`` with zarr 3 and
+    ``compressor`` with zarr 2.
+    """
+    codec: dict[str, Any]
+    if _zarr_major() >= 3:
+        from zarr.codecs import BloscCodec
+
+        codec = {"compressors": [BloscCodec(cname="zstd", clevel=clevel, shuffle="shuffle")]}
+    else:
+        from numcodecs import Blosc
+
+        codec = {"compressor": Blosc(cname="zstd", clevel=clevel, shuffle=Blosc.SHUFFLE)}
+    return {
+        name: {"chunks": (1, tile_chunk), **codec}
+        for name, variable in ds.data_vars.items()
+        if variable.dims == DIMS
+    }
+
+
+def consolidate_store(path: Path) -> None:
+    """Consolidate the metadata of the Zarr store at ``path`` into one document."""
+    import zarr
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Consolidated metadata", category=UserWarning)
+        zarr.consolidate_metadata(str(path))
+
+
+def write_tile_cube(path: Path, ds: Any, tile_chunk: int = 4096) -> Path:
+    """Write a complete ``(time, tile)`` dataset with cube chunking and consolidated metadata."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ds.to_zarr(
+        path,
+        mode="w",
+        encoding=tile_cube_encoding(ds, min(tile_chunk, max(ds.sizes["tile"], 1))),
+        consolidated=False,
+    )
+    consolidate_store(path)
+    return path
+
+
+class TileZarrWriter:
+    """Stream per-tile variables into one time step of a ``(time, tile)`` Zarr store.
+
+    The store layout (all tiles, every variable, the ``time`` and ``time_end``
+    coordinates and per-tile ``coords``) is created up front without data.
+    Each :meth:`append` then writes the next contiguous run of tiles as a
+    region, so only the current batch is held in memory. Batches should be
+    multiples of ``tile_chunk`` so that no chunk is written twice. Metadata is
+    consolidated by :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        tile_ids: Sequence[str],
+        variables: Sequence[str],
+        time: date,
+        time_end: date | None = None,
+        coords: dict[str, Any] | None = None,
+        tile_chunk: int = 4096,
+    ) -> None:
+        import dask.array as da
+        import xarray as xr
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.tile_ids = list(tile_ids)
+        self.count = 0
+        size = len(self.tile_ids)
+        chunk = min(tile_chunk, max(size, 1))
+        template = xr.Dataset(
+            {
+                name: (DIMS, da.full((1, size), np.nan, chunks=(1, chunk), dtype="float64"))
+                for name in variables
+            },
+            coords={
+                "time": np.array([time], dtype="datetime64[ns]"),
+                "time_end": ("time", np.array([time_end or time], dtype="datetime64[ns]")),
+                "tile": np.asarray(self.tile_ids, dtype=object),
+                **{name: ("tile", np.asarray(values)) for name, values in (coords or {}).items()},
+            },
+        )
+        template.to_zarr(
+            path,
+            mode="w",
+            compute=False,
+            encoding=tile_cube_encoding(template, chunk),
+            consolidated=False,
+        )
+
+    def append(self, tile_ids: Sequence[str], variables: dict[str, Any]) -> None:
+        """Write the next batch of tiles; every variable has one value per tile id."""
+        if not tile_ids:
+            return
+        import xarray as xr
+
+        end = self.count + len(tile_ids)
+        if list(tile_ids) != self.tile_ids[self.count : end]:
+            raise ValueError("Tile batches must follow the tile order given at creation.")
+        batch = xr.Dataset(
+            {
+                name: (DIMS, np.asarray(values, dtype="float64")[None, :])
+                for name, values in variables.items()
+            }
+        )
+        batch.to_zarr(
+            self.path,
+            region={"time": slice(0, 1), "tile": slice(self.count, end)},
+            consolidated=False,
+        )
+        self.count = end
+
+    def close(self) -> Path:
+        """Consolidate the store metadata and return its path."""
+        consolidate_store(self.path)
+        return self.path
+
+    def __enter__(self) -> TileZarrWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+
+def append_time_slices(store: Path, source: Path) -> Path:
+    """Add the time steps of the ``(time, tile)`` store ``source`` to ``store``.
+
+    ``store`` is created from ``source`` when missing. Time steps already in
+    ``store`` are overwritten in place and new ones are appended along
+    ``time``, so re-running a window is idempotent. A time step is identified
+    by its start and ``time_end``; a step that shares its start with a stored
+    one but ends on another day raises ``ValueError``. Both stores must hold
+    the same tiles in the same order.
+    """
+    import xarray as xr
+
+    src = xr.open_zarr(source)
+    if not any((store / name).exists() for name in _GROUP_FILES):
+        tile_chunk = next(
+            (var.encoding["chunks"][1] for var in src.data_vars.values() if var.dims == DIMS),
+            src.sizes["tile"],
+        )
+        return write_tile_cube(store, src, tile_chunk)
+
+    dst = xr.open_zarr(store)
+    if not np.array_equal(dst["tile"].values, src["tile"].values):
+        raise ValueError(
+            f"{store} holds a different tile set than {source}; use one store per AOI."
+        )
+    stored_ends = dst["time_end"].values if "time_end" in dst.coords else dst["time"].values
+    src_ends = src["time_end"].values if "time_end" in src.coords else src["time"].values
+    ends = dict(zip(dst["time"].values, stored_ends, strict=True))
+    for value, end in zip(src["time"].values, src_ends, strict=True):
+        if value in ends and ends[value] != end:
+            raise ValueError(
+                f"{store} already holds the time step starting {np.datetime_as_string(value, 'D')} "
+                f"with another end date; write windows with different ends to separate stores."
+            )
+    per_time = src.drop_vars([name for name in src.variables if "time" not in src[name].dims])
+    existing = {value: idx for idx, value in enumerate(dst["time"].values)}
+    for idx, value in enumerate(src["time"].values):
+        step = per_time.isel(time=slice(idx, idx + 1))
+        if value in existing:
+            position = existing[value]
+            step.to_zarr(store, region={"time": slice(position, position + 1)}, consolidated=False)
+        else:
+            step.to_zarr(store, append_dim="time", consolidated=False)
+            existing[value] = len(existing)
+    consolidate_store(store)
+    return store
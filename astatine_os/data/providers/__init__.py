@@ -8,9 +8,11 @@ from astatine_os.data.providers.buildings_open_buildings import OpenBuildingsPro
 from astatine_os.data.providers.buildings_osm import OSMBuildingsProvider
 from astatine_os.data.providers.era5_land import ERA5LandProvider
 from astatine_os.data.providers.landsat import LandsatThermalProvider
+from astatine_os.data.providers.provider_set import ProviderSet, worker_provider_set
 from astatine_os.data.providers.sentinel2 import Sentinel2Provider
 from astatine_os.data.providers.street_kartaview import KartaViewProvider
 from astatine_os.data.providers.street_mapillary import MapillaryProvider
+from astatine_os.data.reductions import Reduction
 
 __all__ = [
     "ERA5LandProvider",
@@ -21,6 +23,9 @@ __all__ = [
     "OSMBuildingsProvider",
     "Provider",
     "ProviderPayload",
+    "ProviderSet",
+    "Reduction",
     "Sentinel2Provider",
     "TimeRange",
+    "worker_provider_set",
 ]
@@ -6,11 +6,12 @@
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
 from astatine_os.data.aoi import AOI
+from astatine_os.data.reductions import Reduction
 
 
 @dataclass(frozen=True)
@@ -33,10 +34,17 @@ class ProviderPayload:
     arrays: dict[str, Any]
     vectors: list[dict[str, Any]]
     metadata: dict[str, Any]
+    summaries: dict[str, dict[str, float]] = field(default_factory=dict)
 
 
 class Provider(abc.ABC):
-    """Abstract provider contract."""
+    """Abstract provider contract.
+
+    ``version`` identifies the data a provider returns for given inputs and
+    must be bumped whenever that changes, since cached results are keyed on it.
+    """
+
+    version: str = "1"
 
     @abc.abstractmethod
     def authenticate(self) -> None:
@@ -52,6 +60,29 @@ class Provider(abc.ABC):
     ) -> ProviderPayload:
         """Fetch arrays and vectors for an AOI and time range."""
 
+    def fetch_summary(
+        self,
+        aoi: AOI,
+        time_range: TimeRange,
+        resolution: int,
+        bands: list[str] | None = None,
+        reduction: Reduction | None = None,
+    ) -> ProviderPayload:
+        """Fetch statistics of each array instead of the arrays themselves.
+
+        The default fetches and reduces in memory. Providers that can read in
+        blocks override it so full arrays are never materialized.
+        """
+        reduction = reduction or Reduction()
+        payload = self.fetch(aoi, time_range, resolution, bands)
+        return ProviderPayload(
+            source=payload.source,
+            arrays={},
+            vectors=payload.vectors,
+            metadata={**payload.metadata, "reduction": reduction.describe()},
+            summaries=reduction.reduce(payload.arrays),
+        )
+
     @abc.abstractmethod
     def attribution(self) -> str:
         """Return provider attribution string."""
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Bundle of the providers used by one analysis run."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from astatine_os.config import RuntimeConfig
+from astatine_os.data.providers.buildings_open_buildings import OpenBuildingsProvider
+from astatine_os.data.providers.buildings_osm import OSMBuildingsProvider
+from astatine_os.data.providers.era5_land import ERA5LandProvider
+from astatine_os.data.providers.landsat import LandsatThermalProvider
+from astatine_os.data.providers.sentinel2 import Sentinel2Provider
+from astatine_os.data.providers.street_kartaview import KartaViewProvider
+
+_WORKER_PROVIDERS: dict[tuple[Any, ...], ProviderSet] = {}
+
+
+@dataclass(frozen=True)
+class ProviderSet:
+    """Providers shared by every tile task of an analysis.
+
+    The set is passed to the task graph as a single object so workers receive
+    it once rather than once per task.
+    """
+
+    sentinel: Sentinel2Provider
+    landsat: LandsatThermalProvider
+    meteo: ERA5LandProvider
+    buildings: OpenBuildingsProvider
+    buildings_fallback: OSMBuildingsProvider
+    street: KartaViewProvider
+
+    def fingerprint(self) -> dict[str, str]:
+        """Provider class and version per role, for cache keys."""
+        return {
+            role: f"{type(provider).__name__}/{provider.version}"
+            for role, provider in vars(self).items()
+        }
+
+    @classmethod
+    def from_config(cls, cfg: RuntimeConfig) -> ProviderSet:
+        """Build the default providers from a ``RuntimeConfig``."""
+        return cls(
+            sentinel=Sentinel2Provider(use_live_stac=cfg.enable_optional_live_calls),
+            landsat=LandsatThermalProvider(use_live_stac=cfg.enable_optional_live_calls),
+            meteo=ERA5LandProvider(cfg.era5_cds_url, cfg.era5_cds_key),
+            buildings=OpenBuildingsProvider(),
+            buildings_fallback=OSMBuildingsProvider(),
+            street=KartaViewProvider(),
+        )
+
+
+def worker_provider_set(cfg: RuntimeConfig) -> ProviderSet:
+    """Return this process's provider set for ``cfg``, building it on first use.
+
+    Tasks that only carry the config never serialize provider objects, and
+    each worker process keeps one set for its lifetime.
+    """
+    key = (cfg.enable_optional_live_calls, cfg.era5_cds_url, cfg.era5_cds_key)
+    providers = _WORKER_PROVIDERS.get(key)
+    if providers is None:
+        providers = _WORKER_PROVIDERS.setdefault(key, ProviderSet.from_config(cfg))
+    return providers
@@ -6,21 +6,64 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterator, Sequence
+from datetime import datetime, time, timedelta
 from typing import Any
 
 import numpy as np
 
 from astatine_os.data.aoi import AOI
+from astatine_os.data.compositing import composite_scenes
 from astatine_os.data.providers.base import Provider, ProviderPayload, TimeRange
+from astatine_os.data.reductions import Reduction, reduce_blocks
 from astatine_os.data.stac import query_stac_items
 from astatine_os.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+REVISIT_DAYS = 5
+# Reflectance assigned to cloudy pixels so unmasked composites are visibly biased.
+_CLOUD_REFLECTANCE = 0.85
+
+
+def _seed(material: str) -> int:
+    return int(hashlib.sha256(material.encode("utf-8")).hexdigest()[:16], 16)
+
+
+def _window_uniform(
+    seed: int,
+    full_width: int,
+    rows: slice,
+    cols: slice,
+    low: float,
+    high: float,
+    stream_offset: int = 0,
+) -> np.ndarray:
+    """Read a window of ``default_rng(seed).uniform(low, high, (H, W))`` without the full array.
+
+    The PCG64 stream is advanced past skipped pixels, so any window equals the
+    matching slice of the full draw. ``stream_offset`` skips draws consumed by
+    earlier arrays from the same generator.
+    """
+    n_rows = rows.stop - rows.start
+    n_cols = cols.stop - cols.start
+    bit_generator = np.random.PCG64(seed)
+    bit_generator.advance(stream_offset + rows.start * full_width + cols.start)
+    rng = np.random.Generator(bit_generator)
+    if n_cols == full_width:
+        return rng.uniform(low, high, size=(n_rows, n_cols)).astype("float32")
+    out = np.empty((n_rows, n_cols), dtype="float32")
+    for row in range(n_rows):
+        out[row] = rng.uniform(low, high, size=n_cols)
+        bit_generator.advance(full_width - n_cols)
+    return out
+
 
 class Sentinel2Provider(Provider):
     """Default Sentinel-2 L2A provider."""
 
+    version = "2"
+
     def __init__(
         self,
         stac_url: str = "https://planetarycomputer.microsoft.com/api/stac/v1",
@@ -32,6 +75,25 @@ class Sentinel2Provider(Provider):
     def authenticate(self) -> None:
         return None
 
+    def _stac_item_ids(self, aoi: AOI, time_range: TimeRange) -> list[str]:
+        if not self.use_live_stac:
+            return []
+        try:
+            items = query_stac_items(
+                stac_url=self.stac_url,
+                collection="sentinel-2-l2a",
+                bbox=aoi.bounds,
+                datetime_range=time_range.iso_interval(),
+                limit=3,
+            )
+        except Exception as exc:
+            LOGGER.warning(
+                "Live STAC query failed; using deterministic arrays only.",
+                extra={"context": {"error": str(exc)}},
+            )
+            return []
+        return [item.get("id", "unknown") for item in items]
+
     def fetch(
         self,
         aoi: AOI,
@@ -40,16 +102,88 @@ class Sentinel2Provider(Provider):
         bands: list[str] | None = None,
     ) -> ProviderPayload:
         wanted_bands = bands or ["B04", "B08", "B11"]
-        shape = (max(16, int(600 / resolution)), max(16, int(600 / resolution)))
+        shape = self.array_shape(resolution)
         seed_material = f"{aoi.bounds}-{time_range.iso_interval()}-{resolution}-{wanted_bands}"
-        seed = int(hashlib.sha256(seed_material.encode("utf-8")).hexdigest()[:16], 16)
+        seed = _seed(seed_material)
         rng = np.random.default_rng(seed)
 
         arrays = {
             band: rng.uniform(0.05, 0.7, size=shape).astype("float32") for band in wanted_bands
         }
-        metadata: dict[str, Any] = {"bands": wanted_bands, "shape": shape, "seed": seed}
+        metadata: dict[str, Any] = {
+            "bands": wanted_bands,
+            "shape": shape,
+            "seed": seed,
+            "stac_item_ids": self._stac_item_ids(aoi, time_range),
+        }
+
+        return ProviderPayload(
+            source="sentinel2_l2a",
+            arrays=arrays,
+            vectors=[],
+            metadata=metadata,
+        )
+
+    def fetch_summary(
+        self,
+        aoi: AOI,
+        time_range: TimeRange,
+        resolution: int,
+        bands: list[str] | None = None,
+        reduction: Reduction | None = None,
+        block_pixels: int = 65_536,
+    ) -> ProviderPayload:
+        """Reduce the arrays ``fetch`` would return while reading them in row blocks.
+
+        Memory per call is bounded by ``block_pixels`` regardless of tile size,
+        and the statistics cover exactly the pixels ``fetch`` would return.
+        """
+        reduction = reduction or Reduction()
+        wanted_bands = bands or ["B04", "B08", "B11"]
+        height, width = self.array_shape(resolution)
+        seed_material = f"{aoi.bounds}-{time_range.iso_interval()}-{resolution}-{wanted_bands}"
+        seed = _seed(seed_material)
+        block_rows = max(1, block_pixels // width)
+
+        def blocks() -> Iterator[dict[str, np.ndarray]]:
+            full_cols = slice(0, width)
+            for row0 in range(0, height, block_rows):
+                rows = slice(row0, min(row0 + block_rows, height))
+                yield {
+                    band: _window_uniform(
+                        seed, width, rows, full_cols, 0.05, 0.7, stream_offset=k * height * width
+                    )
+                    for k, band in enumerate(wanted_bands)
+                }
+
+        summaries = reduce_blocks(blocks(), reduction)
+        metadata: dict[str, Any] = {
+            "bands": wanted_bands,
+            "shape": (height, width),
+            "seed": seed,
+            "reduction": reduction.describe(),
+            "stac_item_ids": self._stac_item_ids(aoi, time_range),
+        }
+        return ProviderPayload(
+            source="sentinel2_l2a",
+            arrays={},
+            vectors=[],
+            metadata=metadata,
+            summaries=summaries,
+        )
 
+    @staticmethod
+    def array_shape(resolution: int) -> tuple[int, int]:
+        """Return the ``(rows, cols)`` shape of arrays fetched at ``resolution``."""
+        side = max(16, int(600 / resolution))
+        return (side, side)
+
+    def list_scenes(self, aoi: AOI, time_range: TimeRange) -> list[dict[str, Any]]:
+        """Return scene records (``id``, ``datetime``, ``cloud_cover``) in acquisition order.
+
+        Live STAC items are used when enabled; otherwise one synthetic scene per
+        ``REVISIT_DAYS`` revisit falls inside the time range.
+        """
         if self.use_live_stac:
             try:
                 items = query_stac_items(
@@ -57,20 +191,135 @@ class Sentinel2Provider(Provider):
                     collection="sentinel-2-l2a",
                     bbox=aoi.bounds,
                     datetime_range=time_range.iso_interval(),
-                    limit=3,
+                    limit=100,
                 )
-                metadata["stac_item_ids"] = [item.get("id", "unknown") for item in items]
+                scenes = [
+                    {
+                        "id": item.get("id", "unknown"),
+                        "datetime": item.get("properties", {}).get("datetime", ""),
+                        "cloud_cover": float(item.get("properties", {}).get("eo:cloud_cover", 0.0)),
+                    }
+                    for item in items
+                ]
+                if scenes:
+                    return sorted(scenes, key=lambda scene: scene["datetime"])
             except Exception as exc:
                 LOGGER.warning(
-                    "Live STAC query failed; using deterministic arrays only.",
+                    "Live STAC scene listing failed; using the synthetic revisit schedule.",
                     extra={"context": {"error": str(exc)}},
                 )
-                metadata["stac_item_ids"] = []
-        else:
-            metadata["stac_item_ids"] = []
+        scenes = []
+        day = time_range.start
+        while day <= time_range.end:
+            scene_id = f"S2_MSIL2A_{day:%Y%m%d}_SYNTHETIC"
+            cloud_cover = 60.0 * (_seed(f"{aoi.bounds}-{scene_id}") % 1000) / 1000.0
+            scenes.append(
+                {
+                    "id": scene_id,
+                    "datetime": datetime.combine(day, time(10, 30)).isoformat() + "Z",
+                    "cloud_cover": cloud_cover,
+                }
+            )
+            day += timedelta(days=REVISIT_DAYS)
+        return scenes
+
+    def read_scene_window(
+        self,
+        aoi: AOI,
+        scene: dict[str, Any],
+        resolution: int,
+        bands: Sequence[str],
+        rows: slice,
+        cols: slice,
+    ) -> dict[str, np.ndarray]:
+        """Read a pixel window of one scene, including the ``SCL`` classification.
+
+        Windows are generated independently, so reading a scene chunk by chunk
+        gives the same pixels as reading it whole.
+        """
+        width = self.array_shape(resolution)[1]
+        row_idx = np.arange(rows.start, rows.stop, dtype="float32")[:, np.newaxis]
+        col_idx = np.arange(cols.start, cols.stop, dtype="float32")[np.newaxis, :]
+        scene_seed = _seed(f"{aoi.bounds}-{scene['id']}-{resolution}")
+        phase_r, phase_c = (scene_seed % 628) / 100.0, (scene_seed // 628 % 628) / 100.0
+        # Smooth cloud field in [-2, 2]; the threshold tracks the scene cloud cover.
+        field = np.sin(row_idx * 0.11 + phase_r) + np.sin(col_idx * 0.07 + phase_c)
+        threshold = 2.0 - 4.0 * float(scene["cloud_cover"]) / 100.0
+        cloud = field > threshold
+        shadow = ~cloud & (field > threshold - 0.3)
+        window: dict[str, np.ndarray] = {}
+        for band in bands:
+            if band == "SCL":
+                scl = np.full(field.shape, 4, dtype="uint8")
+                scl[shadow] = 3
+                scl[cloud] = 9
+                window[band] = scl
+                continue
+            values = _window_uniform(
+                _seed(f"{aoi.bounds}-{scene['id']}-{resolution}-{band}"),
+                width,
+                rows,
+                cols,
+                0.05,
+                0.7,
+            )
+            values[cloud] = _CLOUD_REFLECTANCE
+            window[band] = values
+        return window
 
+    def composite(
+        self,
+        aoi: AOI,
+        time_range: TimeRange,
+        resolution: int,
+        bands: list[str] | None = None,
+        percentiles: Sequence[float] = (50.0,),
+        chunk_size: int = 256,
+        n_bins: int = 256,
+    ) -> ProviderPayload:
+        """Build a cloud-masked per-pixel percentile composite over all scenes.
+
+        Scenes are streamed window by window through
+        :func:`~astatine_os.data.compositing.composite_scenes`. Each band holds
+        its median, and every requested percentile is also returned as
+        ``<band>_p<q>``. Pixels that are masked in every scene take the value
+        of the least cloudy scene, so the composite has no gaps.
+        """
+        wanted_bands = bands or ["B04", "B08", "B11"]
+        scenes = self.list_scenes(aoi, time_range)
+        shape = self.array_shape(resolution)
+        percentile_set = tuple(sorted({50.0, *percentiles}))
+
+        def read_window(
+            scene: dict[str, Any], names: Sequence[str], rows: slice, cols: slice
+        ) -> dict[str, np.ndarray]:
+            return self.read_scene_window(aoi, scene, resolution, names, rows, cols)
+
+        fill_scene = min(scenes, key=lambda scene: scene["cloud_cover"]) if scenes else None
+        composited = composite_scenes(
+            read_window,
+            scenes,
+            shape,
+            wanted_bands,
+            percentiles=percentile_set,
+            chunk_size=chunk_size,
+            n_bins=n_bins,
+            fill_scene=fill_scene,
+        )
+        arrays: dict[str, Any] = {band: composited[f"{band}_p50"] for band in wanted_bands}
+        arrays.update(composited)
+        valid_fraction = float(np.mean(composited["valid_count"] > 0))
+        metadata: dict[str, Any] = {
+            "bands": wanted_bands,
+            "shape": shape,
+            "composite": "median",
+            "percentiles": list(percentile_set),
+            "scene_ids": [scene["id"] for scene in scenes],
+            "fill_scene_id": fill_scene["id"] if fill_scene is not None else None,
+            "valid_pixel_fraction": valid_fraction,
+        }
         return ProviderPayload(
-            source="sentinel2_l2a",
+            source="sentinel2_l2a_composite",
             arrays=arrays,
             vectors=[],
             metadata=metadata,
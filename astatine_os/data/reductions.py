@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Streaming array reductions requested from providers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+REDUCTION_STATS: tuple[str, ...] = ("mean", "std", "min", "max", "count")
+
+BlockTransform = Callable[[dict[str, np.ndarray]], dict[str, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class Reduction:
+    """Statistics a provider should return instead of full arrays.
+
+    ``transform`` maps a block of named source arrays to the arrays that are
+    reduced, for example bands to spectral indices, and must be element-wise
+    so that reducing block by block matches reducing the whole array.
+    Quantiles are read from a ``n_bins`` histogram over ``value_range``.
+    """
+
+    stats: tuple[str, ...] = ("mean",)
+    quantiles: tuple[float, ...] = ()
+    value_range: tuple[float, float] = (-1.0, 1.0)
+    n_bins: int = 2048
+    transform: BlockTransform | None = None
+
+    def __post_init__(self) -> None:
+        unknown = set(self.stats) - set(REDUCTION_STATS)
+        if unknown:
+            raise ValueError(f"Unknown reduction statistics: {sorted(unknown)}")
+
+    def describe(self) -> dict[str, Any]:
+        """JSON-serializable description for provider metadata."""
+        return {"stats": list(self.stats), "quantiles": list(self.quantiles)}
+
+    def reduce(self, arrays: dict[str, Any]) -> dict[str, dict[str, float]]:
+        """Reduce in-memory arrays in one block."""
+        return reduce_blocks([arrays], self)
+
+
+class ReductionAccumulator:
+    """Running moments, extrema and histogram for one reduced array."""
+
+    def __init__(self, reduction: Reduction) -> None:
+        self.reduction = reduction
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.low, self.high = reduction.value_range
+        self.bin_width = (self.high - self.low) / reduction.n_bins
+        # The histogram is only kept when quantiles are requested.
+        self.hist = np.zeros(reduction.n_bins if reduction.quantiles else 0, dtype=np.int64)
+
+    def update(self, values: Any) -> None:
+        """Fold one block of values; non-finite values are ignored."""
+        flat = np.asarray(values, dtype="float64").reshape(-1)
+        finite = np.isfinite(flat)
+        if not finite.all():
+            flat = flat[finite]
+        if flat.size == 0:
+            return
+        self.count += int(flat.size)
+        self.total += float(np.sum(flat))
+        self.total_sq += float(np.dot(flat, flat))
+        self.minimum = min(self.minimum, float(np.min(flat)))
+        self.maximum = max(self.maximum, float(np.max(flat)))
+        if self.hist.size:
+            bins = ((flat - self.low) / self.bin_width).astype(np.int64)
+            np.clip(bins, 0, self.reduction.n_bins - 1, out=bins)
+            self.hist += np.bincount(bins, minlength=self.reduction.n_bins)
+
+    def _quantile(self, q: float) -> float:
+        cum = np.cumsum(self.hist)
+        target = min(max(q / 100.0 * self.count, 0.5), self.count - 0.5)
+        idx = int(np.searchsorted(cum, target, side="right"))
+        before = float(cum[idx - 1]) if idx > 0 else 0.0
+        return self.low + self.bin_width * (idx + (target - before) / float(self.hist[idx]))
+
+    def result(self) -> dict[str, float]:
+        """Return the requested statistics; ``NaN`` when no finite value was seen."""
+        empty = self.count == 0
+        mean = float("nan") if empty else self.total / self.count
+        values: dict[str, float] = {}
+        for stat in self.reduction.stats:
+            if stat == "mean":
+                values[stat] = mean
+            elif stat == "std":
+                values[stat] = (
+                    float("nan")
+                    if empty
+                    else float(np.sqrt(max(self.total_sq / self.count - mean * mean, 0.0)))
+                )
+            elif stat == "min":
+                values[stat] = float("nan") if empty else self.minimum
+            elif stat == "max":
+                values[stat] = float("nan") if empty else self.maximum
+            else:
+                values[stat] = float(self.count)
+        for q in self.reduction.quantiles:
+            values[f"p{q:g}"] = float("nan") if empty else self._quantile(q)
+        return values
+
+
+def reduce_blocks(
+    blocks: Iterable[dict[str, Any]], reduction: Reduction
+) -> dict[str, dict[str, float]]:
+    """Apply ``reduction`` over a stream of named array blocks."""
+    accumulators: dict[str, ReductionAccumulator] = {}
+    for block in blocks:
+        arrays = reduction.transform(block) if reduction.transform is not None else block
+        for name, values in arrays.items():
+            accumulators.setdefault(name, ReductionAccumulator(reduction)).update(values)
+    return {name: acc.result() for name, acc in accumulators.items()}
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Zero-copy array sharing between processes through memory-mapped scratch files."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+from astatine_os.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+_SHM_DIR = Path("/dev/shm")
+
+
+def default_scratch_dir() -> Path:
+    """Return a RAM-backed directory when available, else the system temp dir."""
+    if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return Path(tempfile.gettempdir())
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """Picklable reference to a published array.
+
+    Handles are a few bytes to serialize, so they can be embedded in task
+    graphs or sent to process pools in place of the array itself.
+    """
+
+    path: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def attach(self, writable: bool = False) -> np.memmap:
+        """Map the array into this process without copying it."""
+        view: np.memmap = np.load(self.path, mmap_mode="r+" if writable else "r")
+        if view.shape != self.shape or view.dtype != np.dtype(self.dtype):
+            raise ValueError(f"Shared array at {self.path} does not match its handle.")
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the array data in bytes."""
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+
+def _shared_block(
+    handle: SharedArrayHandle, block_info: dict[Any, Any] | None = None
+) -> np.ndarray:
+    assert block_info is not None
+    location = block_info[None]["array-location"]
+    return np.array(handle.attach()[tuple(slice(start, stop) for start, stop in location)])
+
+
+def shared_dask_array(handle: SharedArrayHandle, chunks: Any) -> Any:
+    """Dask array whose blocks are read from the published array behind ``handle``.
+
+    The graph holds only the handle, so tasks stay small on any scheduler
+    that runs on this host.
+    """
+    import dask.array as da
+    from dask.array.core import normalize_chunks
+
+    return da.map_blocks(
+        _shared_block,
+        handle,
+        chunks=normalize_chunks(chunks, handle.shape, dtype=handle.dtype),
+        dtype=handle.dtype,
+        meta=np.empty((0,) * len(handle.shape), dtype=handle.dtype),
+    )
+
+
+class SharedArrayRegistry:
+    """Publishes arrays once so process workers can attach zero-copy views.
+
+    Arrays are written to ``.npy`` files under ``scratch_dir`` (``/dev/shm``
+    when present, so pages stay in RAM) and every attaching process maps the
+    same pages. Publishing an existing key returns the existing handle. The
+    scratch directory is removed by :meth:`close`.
+    """
+
+    def __init__(self, scratch_dir: str | Path | None = None) -> None:
+        base = Path(scratch_dir) if scratch_dir is not None else default_scratch_dir()
+        base.mkdir(parents=True, exist_ok=True)
+        self.root = Path(tempfile.mkdtemp(prefix="astatine-shared-", dir=base))
+        self._handles: dict[str, SharedArrayHandle] = {}
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+        return self.root / f"{digest}.npy"
+
+    def allocate(
+        self, key: str, shape: tuple[int, ...], dtype: str | np.dtype, fill: float | None = None
+    ) -> SharedArrayHandle:
+        """Create a shared array that workers can write into."""
+        if key in self._handles:
+            return self._handles[key]
+        path = self._path(key)
+        array = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+        if fill is not None:
+            array[...] = fill
+        array.flush()
+        del array
+        handle = SharedArrayHandle(path=str(path), shape=tuple(shape), dtype=np.dtype(dtype).str)
+        self._handles[key] = handle
+        return handle
+
+    def publish(self, key: str, array: Any) -> SharedArrayHandle:
+        """Copy ``array`` into shared memory once and return its handle."""
+        if key in self._handles:
+            return self._handles[key]
+        source = np.asarray(array)
+        handle = self.allocate(key, source.shape, source.dtype)
+        target = handle.attach(writable=True)
+        target[...] = source
+        target.flush()
+        return handle
+
+    def handle(self, key: str) -> SharedArrayHandle:
+        """Return the handle published under ``key``."""
+        return self._handles[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handles
+
+    def close(self) -> None:
+        """Remove all published arrays; attached views must not be used afterwards."""
+        self._handles.clear()
+        try:
+            shutil.rmtree(self.root)
+        except OSError as exc:
+            LOGGER.warning(
+                "Failed to remove shared array scratch directory.",
+                extra={"context": {"path": str(self.root), "error": str(exc)}},
+            )
+
+    def __enter__(self) -> SharedArrayRegistry:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,198 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Dask execution backends and a reusable module-level cluster."""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any
+
+import dask
+
+from astatine_os.config import RuntimeConfig
+from astatine_os.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+_SHARED_CLIENTS: dict[tuple[int, int, bool], Any] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _start_local_cluster(cfg: RuntimeConfig) -> Any:
+    from dask.distributed import Client, LocalCluster
+
+    cluster = LocalCluster(
+        n_workers=cfg.dask_workers,
+        threads_per_worker=cfg.dask_threads_per_worker,
+        processes=cfg.dask_processes,
+        dashboard_address=None,
+        silence_logs=50,
+    )
+    return Client(cluster, set_as_default=False)
+
+
+def _close_client(client: Any) -> None:
+    cluster = getattr(client, "cluster", None)
+    client.close()
+    if cluster is not None:
+        cluster.close()
+
+
+def shared_client(cfg: RuntimeConfig) -> Any:
+    """Return the module-level client for this worker layout, starting it on first use.
+
+    The cluster stays alive across calls until :func:`shutdown_shared_clients`
+    runs, which happens automatically at interpreter exit.
+    """
+    key = (cfg.dask_workers, cfg.dask_threads_per_worker, cfg.dask_processes)
+    with _SHARED_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is not None and client.status == "running":
+            return client
+        client = _start_local_cluster(cfg)
+        _SHARED_CLIENTS[key] = client
+        return client
+
+
+def shutdown_shared_clients() -> None:
+    """Close every module-level cluster started by :func:`shared_client`."""
+    with _SHARED_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client in clients:
+        try:
+            _close_client(client)
+        except Exception as exc:
+            LOGGER.warning(
+                "Failed to close shared Dask cluster.",
+                extra={"context": {"error": str(exc)}},
+            )
+
+
+atexit.register(shutdown_shared_clients)
+
+
+@contextmanager
+def dask_client(cfg: RuntimeConfig) -> Iterator[Any | None]:
+    """Yield a distributed client for ``cfg``, or ``None`` for local schedulers.
+
+    An external scheduler at ``dask_scheduler_address`` takes precedence over
+    a local cluster. With ``reuse_dask_cluster`` the module-level cluster is
+    used and left running; otherwise a private cluster is closed on exit.
+    """
+    if not cfg.use_dask_distributed:
+        yield None
+        return
+    try:
+        from dask.distributed import Client
+    except Exception:
+        LOGGER.warning("dask.distributed is unavailable; using the local Dask scheduler.")
+        yield None
+        return
+    if cfg.dask_scheduler_address:
+        client = Client(cfg.dask_scheduler_address, set_as_default=False)
+        try:
+            yield client
+        finally:
+            client.close()
+    elif cfg.reuse_dask_cluster:
+        yield shared_client(cfg)
+    else:
+        client = _start_local_cluster(cfg)
+        try:
+            yield client
+        finally:
+            _close_client(client)
+
+
+def _local_executor(cfg: RuntimeConfig) -> Executor | None:
+    if cfg.dask_scheduler == "sync":
+        return None
+    workers = cfg.dask_workers * cfg.dask_threads_per_worker
+    if cfg.dask_scheduler == "processes":
+        return ProcessPoolExecutor(max_workers=cfg.dask_workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def shares_host_memory(cfg: RuntimeConfig) -> bool:
+    """Whether tasks of ``cfg`` run on this host and can attach shared-memory arrays.
+
+    Only workers of an external scheduler at ``dask_scheduler_address`` may
+    live on other machines.
+    """
+    return not (cfg.use_dask_distributed and cfg.dask_scheduler_address)
+
+
+def array_scheduler(cfg: RuntimeConfig) -> str:
+    """Scheduler for array work inside a task: ``"processes"`` on a process backend.
+
+    Tasks run in processes with the local ``"processes"`` scheduler or a
+    distributed cluster with ``dask_processes``. Daemonic workers, such as
+    those started by a distributed nanny, cannot start child processes, so
+    they get ``"threads"``.
+    """
+    if cfg.use_dask_distributed:
+        in_processes = cfg.dask_processes or bool(cfg.dask_scheduler_address)
+    else:
+        in_processes = cfg.dask_scheduler == "processes"
+    if in_processes and not multiprocessing.current_process().daemon:
+        return "processes"
+    return "threads"
+
+
+def iter_completed(
+    build: Callable[..., list[Any]], shared: Sequence[Any], cfg: RuntimeConfig
+) -> Iterator[tuple[int, Any]]:
+    """Yield ``(position, result)`` for the tasks of ``build(*shared)`` as each completes.
+
+    Each ``shared`` value enters the graph once: it is scattered to every
+    worker on a distributed client, or wrapped in a single delayed object for
+    the local ``dask_scheduler``. Results are released to the caller in
+    completion order, so it can write or fold them while later tasks run.
+    """
+    with dask_client(cfg) as client:
+        if client is None:
+            tasks = build(*(dask.delayed(value) for value in shared))
+            executor = _local_executor(cfg)
+            if executor is None:
+                for position, task in enumerate(tasks):
+                    yield position, dask.compute(task, scheduler="sync")[0]
+                return
+            with executor:
+                futures = {
+                    executor.submit(dask.compute, task, scheduler="sync"): position
+                    for position, task in enumerate(tasks)
+                }
+                for future in as_completed(futures):
+                    yield futures[future], future.result()[0]
+            return
+        from dask.distributed import as_completed as distributed_as_completed
+
+        handles = client.scatter(list(shared), broadcast=True) if shared else []
+        futures = client.compute(build(*handles))
+        positions = {future.key: position for position, future in enumerate(futures)}
+        for future in distributed_as_completed(futures, loop=client.loop):
+            yield positions[future.key], future.result()
+            future.release()
+
+
+def compute_tasks(
+    build: Callable[..., list[Any]], shared: Sequence[Any], cfg: RuntimeConfig
+) -> list[Any]:
+    """Evaluate the delayed tasks returned by ``build(*shared)`` on the configured backend.
+
+    Results are returned in task order; see :func:`iter_completed` for how
+    ``shared`` values are distributed.
+    """
+    with dask_client(cfg) as client:
+        if client is None:
+            tasks = build(*(dask.delayed(value) for value in shared))
+            return list(dask.compute(*tasks, scheduler=cfg.dask_scheduler))
+        handles = client.scatter(list(shared), broadcast=True) if shared else []
+        return list(client.gather(client.compute(build(*handles))))
@@ -3,15 +3,26 @@
 
 """Feature engineering modules."""
 
-from astatine_os.features.spectral_indices import compute_albedo_proxy, compute_ndbi, compute_ndvi
+from astatine_os.features.spectral_indices import (
+    SpectralSummary,
+    compute_albedo_proxy,
+    compute_ndbi,
+    compute_ndvi,
+    spectral_summary,
+)
+from astatine_os.features.street_canyon import CanyonGeometry, canyon_geometry
 from astatine_os.features.tiling import Tile, tile_aoi
 from astatine_os.features.urban_morphology import morphology_features
 
 __all__ = [
+    "CanyonGeometry",
+    "SpectralSummary",
     "Tile",
+    "canyon_geometry",
     "compute_albedo_proxy",
     "compute_ndbi",
     "compute_ndvi",
     "morphology_features",
+    "spectral_summary",
     "tile_aoi",
 ]
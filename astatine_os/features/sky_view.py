@@ -0,0 +1,364 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Raster sky view factor and frontal area index from building height grids."""
+
+from __future__ import annotations
+
+import functools
+import math
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+from shapely.geometry import box, shape
+
+from astatine_os.data.grid import RasterGrid, chunk_windows, rasterize_polygons
+from astatine_os.data.shared_arrays import SharedArrayHandle, SharedArrayRegistry
+from astatine_os.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+DEFAULT_WIND_DIRECTIONS_DEG = (0.0, 45.0, 90.0, 135.0, 180.0, 225.0, 270.0, 315.0)
+
+
+def building_height_grid(
+    building_features: Sequence[dict[str, Any]], grid: RasterGrid
+) -> np.ndarray:
+    """Rasterize footprint heights onto ``grid`` with open ground at 0 m."""
+    geoms = []
+    heights = []
+    for feature in building_features:
+        geom_obj = feature.get("geometry")
+        if not isinstance(geom_obj, dict):
+            continue
+        geoms.append(shape(geom_obj))
+        heights.append(float(feature.get("properties", {}).get("height_m", 10.0)))
+    return rasterize_polygons(geoms, heights, grid, fill=0.0, dtype="float32")
+
+
+def _ray_offsets(
+    n_azimuths: int, radius_px: int
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Unique integer pixel offsets and distances along each azimuth ray."""
+    rays = []
+    for k in range(n_azimuths):
+        azimuth = 2.0 * math.pi * k / n_azimuths
+        steps = np.arange(1, radius_px + 1, dtype="float64")
+        dx = np.rint(steps * math.sin(azimuth)).astype("int64")
+        dy = np.rint(-steps * math.cos(azimuth)).astype("int64")
+        pairs = np.unique(np.stack([dx, dy], axis=1), axis=0)
+        pairs = pairs[np.any(pairs != 0, axis=1)]
+        dist = np.hypot(pairs[:, 0], pairs[:, 1]).astype("float32")
+        rays.append((pairs[:, 0], pairs[:, 1], dist))
+    return rays
+
+
+def _svf_block_numpy(
+    heights: np.ndarray, pixel_size_m: float, n_azimuths: int, radius_px: int
+) -> np.ndarray:
+    h = np.asarray(heights, dtype="float32")
+    rows, cols = h.shape
+    pad = radius_px
+    padded = np.pad(h, pad, mode="constant", constant_values=0.0)
+    svf = np.zeros_like(h)
+    max_tan = np.empty_like(h)
+    scratch = np.empty_like(h)
+    for dx, dy, dist in _ray_offsets(n_azimuths, radius_px):
+        max_tan.fill(0.0)
+        for ox, oy, d in zip(dx, dy, dist * np.float32(pixel_size_m), strict=True):
+            window = padded[pad + oy : pad + oy + rows, pad + ox : pad + ox + cols]
+            np.subtract(window, h, out=scratch)
+            scratch /= d
+            np.maximum(max_tan, scratch, out=max_tan)
+        # cos^2 of the horizon elevation is 1 / (1 + tan^2).
+        np.square(max_tan, out=scratch)
+        scratch += 1.0
+        np.reciprocal(scratch, out=scratch)
+        svf += scratch
+    svf /= np.float32(n_azimuths)
+    return svf
+
+
+@functools.cache
+def _numba_kernel() -> Callable[..., np.ndarray] | None:
+    """Compile the kernel once per process; a missing numba is logged once."""
+    try:
+        import numba  # type: ignore[import-not-found]
+    except Exception:
+        LOGGER.warning("numba is unavailable; using the NumPy sky view kernel.")
+        return None
+
+    @numba.njit(parallel=True)  # type: ignore[misc]
+    def kernel(padded, pad, rows, cols, ray_dx, ray_dy, ray_dist, ray_start, n_azimuths):  # type: ignore[no-untyped-def]
+        out = np.zeros((rows, cols), dtype=np.float32)
+        for r in numba.prange(rows):
+            for c in range(cols):
+                base = padded[pad + r, pad + c]
+                total = 0.0
+                for k in range(n_azimuths):
+                    best = 0.0
+                    for idx in range(ray_start[k], ray_start[k + 1]):
+                        tan = (padded[pad + r + ray_dy[idx], pad + c + ray_dx[idx]] - base) / (
+                            ray_dist[idx]
+                        )
+                        if tan > best:
+                            best = tan
+                    total += 1.0 / (1.0 + best * best)
+                out[r, c] = total / n_azimuths
+        return out
+
+    return kernel
+
+
+def _svf_block(
+    heights: np.ndarray,
+    pixel_size_m: float,
+    n_azimuths: int,
+    radius_px: int,
+    use_numba: bool,
+) -> np.ndarray:
+    kernel = _numba_kernel() if use_numba else None
+    if kernel is None:
+        return _svf_block_numpy(heights, pixel_size_m, n_azimuths, radius_px)
+    rays = _ray_offsets(n_azimuths, radius_px)
+    ray_start = np.cumsum([0] + [len(ray[0]) for ray in rays]).astype("int64")
+    padded = np.pad(np.asarray(heights, dtype="float32"), radius_px, mode="constant")
+    return kernel(
+        padded,
+        radius_px,
+        heights.shape[0],
+        heights.shape[1],
+        np.concatenate([ray[0] for ray in rays]),
+        np.concatenate([ray[1] for ray in rays]),
+        np.concatenate([ray[2] for ray in rays]) * np.float32(pixel_size_m),
+        ray_start,
+        n_azimuths,
+    )
+
+
+def _svf_shared_window(
+    heights: SharedArrayHandle,
+    out: SharedArrayHandle,
+    rows: slice,
+    cols: slice,
+    pixel_size_m: float,
+    n_azimuths: int,
+    radius_px: int,
+    use_numba: bool,
+) -> None:
+    """Process-pool task: read a haloed window from shared heights, write SVF in place."""
+    source = heights.attach()
+    row0 = max(rows.start - radius_px, 0)
+    col0 = max(cols.start - radius_px, 0)
+    window = source[row0 : rows.stop + radius_px, col0 : cols.stop + radius_px]
+    svf = _svf_block(np.asarray(window), pixel_size_m, n_azimuths, radius_px, use_numba)
+    target = out.attach(writable=True)
+    target[rows, cols] = svf[
+        rows.start - row0 : rows.stop - row0, cols.start - col0 : cols.stop - col0
+    ]
+    target.flush()
+
+
+def _svf_processes(
+    heights: np.ndarray,
+    pixel_size_m: float,
+    n_azimuths: int,
+    radius_px: int,
+    chunk_size: int,
+    use_numba: bool,
+    workers: int | None,
+) -> np.ndarray:
+    with SharedArrayRegistry() as registry, ProcessPoolExecutor(max_workers=workers) as pool:
+        source = registry.publish("heights", np.asarray(heights, dtype="float32"))
+        out = registry.allocate("sky_view_factor", source.shape, "float32")
+        futures = [
+            pool.submit(
+                _svf_shared_window,
+                source,
+                out,
+                rows,
+                cols,
+                pixel_size_m,
+                n_azimuths,
+                radius_px,
+                use_numba,
+            )
+            for rows, cols in chunk_windows(heights.shape, chunk_size)
+        ]
+        for future in futures:
+            future.result()
+        return np.array(out.attach())
+
+
+def sky_view_factor(
+    heights: np.ndarray,
+    pixel_size_m: float,
+    n_azimuths: int = 16,
+    max_radius_m: float = 100.0,
+    chunk_size: int = 512,
+    scheduler: str = "threads",
+    use_numba: bool = False,
+    workers: int | None = None,
+) -> np.ndarray:
+    """Compute per-pixel sky view factor by horizon scanning a height raster.
+
+    For each of ``n_azimuths`` directions the maximum horizon elevation within
+    ``max_radius_m`` is found and the sky view factor is the azimuthal mean of
+    ``cos^2`` of that elevation. Ground outside the raster is treated as open.
+    Rasters larger than ``chunk_size`` are split into chunks with a halo of
+    ``max_radius_m`` and evaluated with Dask ``map_overlap`` on ``scheduler``
+    (``"threads"`` or ``"sync"``), so results match the single-block
+    computation exactly. With ``"processes"`` the height raster is published
+    once to shared memory and a pool of ``workers`` processes reads haloed
+    windows from it and writes into a shared output, so no chunk is pickled.
+    """
+    radius_px = max(1, int(math.ceil(max_radius_m / pixel_size_m)))
+    if max(heights.shape) <= chunk_size:
+        return _svf_block(heights, pixel_size_m, n_azimuths, radius_px, use_numba)
+    if scheduler == "processes":
+        return _svf_processes(
+            heights, pixel_size_m, n_azimuths, radius_px, chunk_size, use_numba, workers
+        )
+
+    import dask.array as da
+
+    source = da.from_array(np.asarray(heights, dtype="float32"), chunks=chunk_size)
+    result = source.map_overlap(
+        _svf_block,
+        depth=radius_px,
+        boundary=0.0,
+        dtype="float32",
+        pixel_size_m=pixel_size_m,
+        n_azimuths=n_azimuths,
+        radius_px=radius_px,
+        use_numba=use_numba,
+    )
+    return np.asarray(result.compute(scheduler=scheduler))
+
+
+def frontal_area_density(
+    heights: np.ndarray, pixel_size_m: float, wind_direction_deg: float
+) -> np.ndarray:
+    """Per-pixel frontal area per unit plan area for wind blowing from a direction.
+
+    Walls are the positive height steps against the upwind neighbour along each
+    axis, weighted by the projection of the wind direction onto that axis.
+    """
+    h = np.asarray(heights, dtype="float32")
+    theta = math.radians(wind_direction_deg)
+    from_north = math.cos(theta)
+    from_east = math.sin(theta)
+    padded = np.pad(h, 1, mode="constant", constant_values=0.0)
+    upwind_ns = padded[:-2, 1:-1] if from_north >= 0.0 else padded[2:, 1:-1]
+    upwind_ew = padded[1:-1, 2:] if from_east >= 0.0 else padded[1:-1, :-2]
+    walls_ns = np.maximum(h - upwind_ns, 0.0)
+    walls_ew = np.maximum(h - upwind_ew, 0.0)
+    density = abs(from_north) * walls_ns + abs(from_east) * walls_ew
+    density /= np.float32(pixel_size_m)
+    return density
+
+
+def frontal_area_index(
+    heights: np.ndarray,
+    pixel_size_m: float,
+    wind_directions_deg: Sequence[float] = DEFAULT_WIND_DIRECTIONS_DEG,
+) -> np.ndarray:
+    """Frontal area index for each wind direction over the whole raster."""
+    return np.array(
+        [
+            float(np.mean(frontal_area_density(heights, pixel_size_m, direction)))
+            for direction in wind_directions_deg
+        ],
+        dtype="float64",
+    )
+
+
+def raster_canyon_metrics(
+    building_features: Sequence[dict[str, Any]],
+    bounds: tuple[float, float, float, float],
+    resolution_m: float,
+    n_azimuths: int = 16,
+    max_radius_m: float = 100.0,
+    use_numba: bool = False,
+) -> dict[str, float]:
+    """Summarize raster sky view factor and frontal area index for one tile."""
+    (metrics,) = raster_canyon_metrics_by_tile(
+        [box(*bounds)],
+        building_features,
+        bounds,
+        resolution_m,
+        n_azimuths=n_azimuths,
+        max_radius_m=max_radius_m,
+        use_numba=use_numba,
+    )
+    return metrics
+
+
+def raster_canyon_metrics_by_tile(
+    tile_geometries: Sequence[Any],
+    building_features: Sequence[dict[str, Any]],
+    bounds: tuple[float, float, float, float],
+    resolution_m: float,
+    n_azimuths: int = 16,
+    max_radius_m: float = 100.0,
+    use_numba: bool = False,
+    scheduler: str = "threads",
+    workers: int | None = None,
+) -> list[dict[str, float]]:
+    """Summarize :func:`raster_canyon_metrics` for many tiles from one height raster.
+
+    Footprints are rasterized once over ``bounds`` and the sky view factor
+    and frontal area densities are computed in one pass, so buildings in
+    neighbouring tiles cast horizons across tile edges. Each tile is then
+    summarized over its window of the raster. ``scheduler`` and ``workers``
+    are passed to :func:`sky_view_factor`.
+    """
+    grid = RasterGrid.from_bounds(bounds, resolution_m)
+    heights = building_height_grid(building_features, grid)
+    pixel_size_m = float(np.mean(grid.pixel_size_m))
+    svf = sky_view_factor(
+        heights,
+        pixel_size_m,
+        n_azimuths,
+        max_radius_m,
+        scheduler=scheduler,
+        use_numba=use_numba,
+        workers=workers,
+    )
+    densities = np.stack(
+        [
+            frontal_area_density(heights, pixel_size_m, direction)
+            for direction in DEFAULT_WIND_DIRECTIONS_DEG
+        ]
+    )
+    results = []
+    for geometry in tile_geometries:
+        window = grid.window_for_bounds(geometry.bounds)
+        if window is None:
+            results.append(
+                {
+                    "sky_view_factor": float("nan"),
+                    "frontal_area_index": float("nan"),
+                    "frontal_area_index_max": float("nan"),
+                }
+            )
+            continue
+        rows, cols = window
+        tile_svf = svf[rows, cols]
+        open_ground = heights[rows, cols] <= 0.0
+        svf_open = (
+            float(np.mean(tile_svf[open_ground]))
+            if np.any(open_ground)
+            else float(np.mean(tile_svf))
+        )
+        fai = densities[:, rows, cols].mean(axis=(1, 2), dtype="float64")
+        results.append(
+            {
+                "sky_view_factor": svf_open,
+                "frontal_area_index": float(np.mean(fai)),
+                "frontal_area_index_max": float(np.max(fai)),
+            }
+        )
+    return results
@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
+
 import numpy as np
 
 
@@ -26,3 +29,252 @@ def compute_ndbi(swir: np.ndarray, nir: np.ndarray) -> np.ndarray:
 def compute_albedo_proxy(red: np.ndarray, nir: np.ndarray, swir: np.ndarray) -> np.ndarray:
     """Simple broad-band albedo proxy."""
     return np.clip(0.3 * red + 0.3 * nir + 0.4 * swir, 0.0, 1.0)
+
+
+SPECTRAL_INDICES: tuple[str, ...] = ("ndvi", "ndbi", "albedo")
+
+
+def spectral_index_block(bands: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Map a block of Sentinel-2 ``B04``/``B08``/``B11`` bands to spectral indices.
+
+    Used as a provider reduction transform so indices are reduced block by
+    block at the reader.
+    """
+    red, nir, swir = bands["B04"], bands["B08"], bands["B11"]
+    return {
+        "ndvi": compute_ndvi(nir, red),
+        "ndbi": compute_ndbi(swir, nir),
+        "albedo": compute_albedo_proxy(red, nir, swir),
+    }
+
+
+@dataclass
+class SpectralSummary:
+    """Per-tile reductions of NDVI, NDBI and the albedo proxy."""
+
+    count: int
+    mean: dict[str, float]
+    std: dict[str, float] = field(default_factory=dict)
+    percentiles: dict[str, dict[float, float]] = field(default_factory=dict)
+    arrays: dict[str, np.ndarray] = field(default_factory=dict)
+
+
+class SpectralWorkspace:
+    """Reusable scratch buffers for ``spectral_summary`` on same-shaped tiles."""
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype | str = "float32") -> None:
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.primary = np.empty(self.shape, dtype=self.dtype)
+        self.secondary = np.empty(self.shape, dtype=self.dtype)
+        self.scratch = np.empty(self.shape, dtype=self.dtype)
+        self.mask = np.empty(self.shape, dtype=bool)
+
+    def fits(self, shape: tuple[int, ...], dtype: np.dtype) -> bool:
+        """Return whether buffers can be reused for ``shape`` and ``dtype``."""
+        return self.shape == tuple(shape) and self.dtype == dtype
+
+
+def _normalized_difference_into(
+    high: np.ndarray, low: np.ndarray, ws: SpectralWorkspace
+) -> np.ndarray:
+    """Write ``_safe_ratio(high - low, high + low)`` into ``ws.primary``."""
+    np.subtract(high, low, out=ws.secondary)
+    np.add(high, low, out=ws.primary)
+    np.abs(ws.primary, out=ws.scratch)
+    np.less(ws.scratch, 1e-6, out=ws.mask)
+    np.copyto(ws.primary, ws.primary.dtype.type(1e-6), where=ws.mask)
+    return np.divide(ws.secondary, ws.primary, out=ws.primary)
+
+
+def _reduce_into(
+    name: str,
+    values: np.ndarray,
+    summary: SpectralSummary,
+    ws: SpectralWorkspace,
+    std: bool,
+    percentiles: tuple[float, ...],
+    keep_array: bool,
+) -> None:
+    mean = float(values.mean(dtype="float64"))
+    summary.mean[name] = mean
+    if std:
+        np.subtract(values, values.dtype.type(mean), out=ws.scratch)
+        np.square(ws.scratch, out=ws.scratch)
+        summary.std[name] = float(np.sqrt(ws.scratch.mean(dtype="float64")))
+    if percentiles:
+        np.copyto(ws.scratch, values)
+        qs = np.percentile(ws.scratch, percentiles, overwrite_input=True)
+        summary.percentiles[name] = {q: float(v) for q, v in zip(percentiles, qs, strict=True)}
+    if keep_array:
+        summary.arrays[name] = values.copy()
+
+
+def _spectral_numpy(
+    red: np.ndarray,
+    nir: np.ndarray,
+    swir: np.ndarray,
+    ws: SpectralWorkspace,
+    summary: SpectralSummary,
+    std: bool,
+    percentiles: tuple[float, ...],
+    keep: set[str],
+) -> None:
+    _normalized_difference_into(nir, red, ws)
+    _reduce_into("ndvi", ws.primary, summary, ws, std, percentiles, "ndvi" in keep)
+    _normalized_difference_into(swir, nir, ws)
+    _reduce_into("ndbi", ws.primary, summary, ws, std, percentiles, "ndbi" in keep)
+
+    dtype = ws.primary.dtype.type
+    np.multiply(red, dtype(0.3), out=ws.primary)
+    np.multiply(nir, dtype(0.3), out=ws.secondary)
+    ws.primary += ws.secondary
+    np.multiply(swir, dtype(0.4), out=ws.secondary)
+    ws.primary += ws.secondary
+    np.clip(ws.primary, 0.0, 1.0, out=ws.primary)
+    _reduce_into("albedo", ws.primary, summary, ws, std, percentiles, "albedo" in keep)
+
+
+def _spectral_numexpr(
+    red: np.ndarray,
+    nir: np.ndarray,
+    swir: np.ndarray,
+    ws: SpectralWorkspace,
+    summary: SpectralSummary,
+    std: bool,
+    percentiles: tuple[float, ...],
+    keep: set[str],
+) -> bool:
+    try:
+        import numexpr as ne  # type: ignore[import-not-found]
+    except Exception:
+        return False
+    albedo = "(0.3 * red + 0.3 * nir + 0.4 * swir)"
+    expressions = {
+        "ndvi": "(nir - red) / where(abs(nir + red) < 1e-6, 1e-6, nir + red)",
+        "ndbi": "(swir - nir) / where(abs(swir + nir) < 1e-6, 1e-6, swir + nir)",
+        "albedo": f"where({albedo} < 0, 0, where({albedo} > 1, 1, {albedo}))",
+    }
+    local = {"red": red, "nir": nir, "swir": swir}
+    for name, expression in expressions.items():
+        ne.evaluate(expression, local_dict=local, out=ws.primary, casting="same_kind")
+        _reduce_into(name, ws.primary, summary, ws, std, percentiles, name in keep)
+    return True
+
+
+_NUMBA_SPECTRAL: Any = None
+
+
+def _spectral_numba(
+    red: np.ndarray,
+    nir: np.ndarray,
+    swir: np.ndarray,
+    summary: SpectralSummary,
+    std: bool,
+    percentiles: tuple[float, ...],
+    keep: set[str],
+) -> bool:
+    """Single pass over pixels; arrays are only written when needed."""
+    global _NUMBA_SPECTRAL
+    if _NUMBA_SPECTRAL is None:
+        try:
+            import numba  # type: ignore[import-not-found]
+        except Exception:
+            return False
+
+        @numba.njit  # type: ignore[misc]
+        def kernel(red, nir, swir, out, write):  # type: ignore[no-untyped-def]
+            sums = np.zeros(3, dtype=np.float64)
+            sq = np.zeros(3, dtype=np.float64)
+            for i in range(red.size):
+                r = red[i]
+                n = nir[i]
+                s = swir[i]
+                den = n + r
+                if abs(den) < 1e-6:
+                    den = 1e-6
+                ndvi = (n - r) / den
+                den = s + n
+                if abs(den) < 1e-6:
+                    den = 1e-6
+                ndbi = (s - n) / den
+                alb = min(max(0.3 * r + 0.3 * n + 0.4 * s, 0.0), 1.0)
+                sums[0] += ndvi
+                sums[1] += ndbi
+                sums[2] += alb
+                sq[0] += ndvi * ndvi
+                sq[1] += ndbi * ndbi
+                sq[2] += alb * alb
+                if write:
+                    out[0, i] = ndvi
+                    out[1, i] = ndbi
+                    out[2, i] = alb
+            return sums, sq
+
+        _NUMBA_SPECTRAL = kernel
+
+    write = bool(percentiles or keep)
+    out = np.empty((3, red.size if write else 0), dtype=red.dtype)
+    sums, sq = _NUMBA_SPECTRAL(red.ravel(), nir.ravel(), swir.ravel(), out, write)
+    count = max(red.size, 1)
+    for idx, name in enumerate(SPECTRAL_INDICES):
+        mean = float(sums[idx] / count)
+        summary.mean[name] = mean
+        if std:
+            summary.std[name] = float(np.sqrt(max(sq[idx] / count - mean * mean, 0.0)))
+        if write:
+            values = out[idx]
+            if percentiles:
+                qs = np.percentile(values, percentiles)
+                summary.percentiles[name] = {
+                    q: float(v) for q, v in zip(percentiles, qs, strict=True)
+                }
+            if name in keep:
+                summary.arrays[name] = values.reshape(red.shape)
+    return True
+
+
+def spectral_summary(
+    red: np.ndarray,
+    nir: np.ndarray,
+    swir: np.ndarray,
+    std: bool = False,
+    percentiles: tuple[float, ...] = (),
+    keep_arrays: tuple[str, ...] = (),
+    backend: str = "numpy",
+    workspace: SpectralWorkspace | None = None,
+) -> SpectralSummary:
+    """Compute NDVI, NDBI and albedo reductions in one fused kernel.
+
+    Index rasters are written into preallocated scratch buffers in the input
+    dtype (float32 stays float32) and reduced immediately, so at most three
+    tile-sized temporaries exist regardless of how many statistics are
+    requested. Full index arrays are only returned for names in
+    ``keep_arrays``. ``backend`` selects ``"numpy"``, ``"numexpr"`` or
+    ``"numba"``; unavailable optional backends fall back to NumPy.
+    """
+    red_arr = np.asarray(red)
+    nir_arr = np.asarray(nir)
+    swir_arr = np.asarray(swir)
+    dtype = np.result_type(red_arr, nir_arr, swir_arr, np.float32)
+    red_arr, nir_arr, swir_arr = (
+        np.ascontiguousarray(arr, dtype=dtype) for arr in (red_arr, nir_arr, swir_arr)
+    )
+    summary = SpectralSummary(count=int(red_arr.size), mean={})
+    keep = set(keep_arrays)
+    pct = tuple(float(q) for q in percentiles)
+
+    if backend == "numba" and _spectral_numba(red_arr, nir_arr, swir_arr, summary, std, pct, keep):
+        return summary
+    ws = workspace
+    if ws is None or not ws.fits(red_arr.shape, dtype):
+        ws = SpectralWorkspace(red_arr.shape, dtype)
+    if backend == "numexpr" and _spectral_numexpr(
+        red_arr, nir_arr, swir_arr, ws, summary, std, pct, keep
+    ):
+        return summary
+    if backend not in {"numpy", "numexpr", "numba"}:
+        raise ValueError(f"Unsupported spectral backend: {backend}")
+    summary.mean.clear()
+    _spectral_numpy(red_arr, nir_arr, swir_arr, ws, summary, std, pct, keep)
+    return summary
@@ -0,0 +1,326 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Street canyon geometry derived from building footprint gaps."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from astatine_os.features.zonal import grouped_quantiles
+
+DEFAULT_STREET_WIDTH_M = 18.0
+DEFAULT_BUILDING_HEIGHT_M = 10.0
+_METERS_PER_DEGREE = 111_320.0
+
+
+@dataclass(frozen=True)
+class CanyonGeometry:
+    """Street width and canyon aspect distribution for one tile."""
+
+    street_width_m: float
+    street_width_p25_m: float
+    street_width_p75_m: float
+    canyon_aspect_ratio: float
+    canyon_aspect_p75: float
+    sample_count: int
+
+    @classmethod
+    def fallback(cls, mean_building_height_m: float = DEFAULT_BUILDING_HEIGHT_M) -> CanyonGeometry:
+        """Constant-width canyon used when footprints cannot resolve street gaps."""
+        aspect = mean_building_height_m / DEFAULT_STREET_WIDTH_M
+        return cls(
+            street_width_m=DEFAULT_STREET_WIDTH_M,
+            street_width_p25_m=DEFAULT_STREET_WIDTH_M,
+            street_width_p75_m=DEFAULT_STREET_WIDTH_M,
+            canyon_aspect_ratio=aspect,
+            canyon_aspect_p75=aspect,
+            sample_count=0,
+        )
+
+
+def _footprint_arrays(
+    building_features: Sequence[dict[str, Any]],
+) -> tuple[np.ndarray, np.ndarray]:
+    geoms: list[Any] = []
+    heights: list[float] = []
+    for feature in building_features:
+        geom_obj = feature.get("geometry")
+        if not isinstance(geom_obj, dict):
+            continue
+        geom = shape(geom_obj)
+        if geom.is_empty or geom.geom_type not in {"Polygon", "MultiPolygon"}:
+            continue
+        geoms.append(geom)
+        heights.append(float(feature.get("properties", {}).get("height_m", 10.0)))
+    return np.asarray(geoms, dtype=object), np.asarray(heights, dtype="float64")
+
+
+def _line_array(street_features: Sequence[dict[str, Any]]) -> np.ndarray:
+    lines = []
+    for feature in street_features:
+        geom_obj = feature.get("geometry")
+        if not isinstance(geom_obj, dict):
+            continue
+        geom = shape(geom_obj)
+        if geom.geom_type in {"LineString", "MultiLineString"} and not geom.is_empty:
+            lines.append(geom)
+    return np.asarray(lines, dtype=object)
+
+
+def _to_local_meters(geoms: np.ndarray, ref_lat: float) -> np.ndarray:
+    """Project WGS84 geometries onto a local equirectangular plane in meters."""
+    scale_x = _METERS_PER_DEGREE * max(math.cos(math.radians(ref_lat)), 0.2)
+
+    def _project(coords: np.ndarray) -> np.ndarray:
+        return coords * np.array([scale_x, _METERS_PER_DEGREE])
+
+    return shapely.transform(geoms, _project)
+
+
+def _chunks(count: int, chunk_size: int) -> list[tuple[int, int]]:
+    return [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+
+
+def _facing_gaps_chunk(
+    tree: shapely.STRtree,
+    geoms: np.ndarray,
+    query_idx: np.ndarray,
+    min_gap_m: float,
+    max_gap_m: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    source, target = tree.query(geoms[query_idx], predicate="dwithin", distance=max_gap_m)
+    source = query_idx[source]
+    keep = source != target
+    source = source[keep]
+    target = target[keep]
+    dist = shapely.distance(geoms[source], geoms[target])
+    # Touching or near-touching neighbours share a party wall, not a street.
+    keep = dist >= min_gap_m
+    return source[keep], target[keep], dist[keep]
+
+
+def facing_building_gaps(
+    building_features: Sequence[dict[str, Any]],
+    min_gap_m: float = 2.0,
+    max_gap_m: float = 80.0,
+    workers: int = 1,
+    chunk_size: int = 20_000,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return per-building facing gap width, canyon aspect and footprint centroids.
+
+    For every footprint the nearest other footprint separated by at least
+    ``min_gap_m`` is treated as the facing building across the street. Buildings
+    without a partner inside ``max_gap_m`` receive ``NaN``. Centroids are returned
+    in WGS84 so callers can assign buildings to tiles.
+    """
+    geoms, heights = _footprint_arrays(building_features)
+    return _facing_gaps(geoms, heights, min_gap_m, max_gap_m, workers, chunk_size)
+
+
+def _facing_gaps(
+    geoms: np.ndarray,
+    heights: np.ndarray,
+    min_gap_m: float,
+    max_gap_m: float,
+    workers: int = 1,
+    chunk_size: int = 20_000,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    centroids = shapely.get_coordinates(shapely.centroid(geoms)) if len(geoms) else np.empty((0, 2))
+    width = np.full(len(geoms), np.nan)
+    aspect = np.full(len(geoms), np.nan)
+    if len(geoms) < 2:
+        return width, aspect, centroids
+
+    local = _to_local_meters(geoms, ref_lat=float(np.mean(centroids[:, 1])))
+    tree = shapely.STRtree(local)
+    # Search radii grow geometrically up to max_gap_m. A building with a partner
+    # inside the current radius has seen every candidate that could be nearest,
+    # so only the others are queried again; dense areas never pay for max_gap_m.
+    radius = min(max_gap_m, max(2.0 * min_gap_m, max_gap_m / 8.0))
+    remaining = np.arange(len(local))
+    parts: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    while len(remaining):
+        spans = [remaining[start:stop] for start, stop in _chunks(len(remaining), chunk_size)]
+        if workers > 1 and len(spans) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                found = list(
+                    pool.map(
+                        lambda span, r=radius: _facing_gaps_chunk(tree, local, span, min_gap_m, r),
+                        spans,
+                    )
+                )
+        else:
+            found = [_facing_gaps_chunk(tree, local, span, min_gap_m, radius) for span in spans]
+        parts.extend(found)
+        if radius >= max_gap_m:
+            break
+        paired = np.concatenate([part[0] for part in found])
+        remaining = np.setdiff1d(remaining, paired, assume_unique=False)
+        radius = min(max_gap_m, 2.0 * radius)
+
+    source = np.concatenate([part[0] for part in parts])
+    target = np.concatenate([part[1] for part in parts])
+    dist = np.concatenate([part[2] for part in parts])
+    if len(source) == 0:
+        return width, aspect, centroids
+
+    np.fmin.at(width, source, dist)
+    # np.fmin.at ignores the NaN initial value, so rows without a gap stay NaN.
+    nearest = np.isclose(dist, width[source])
+    pair_height = 0.5 * (heights[source[nearest]] + heights[target[nearest]])
+    aspect[source[nearest]] = pair_height / width[source[nearest]]
+    return width, aspect, centroids
+
+
+def centreline_widths(
+    street_features: Sequence[dict[str, Any]],
+    building_features: Sequence[dict[str, Any]],
+    max_gap_m: float = 80.0,
+) -> np.ndarray:
+    """Estimate street widths as twice the centreline distance to the nearest footprint."""
+    geoms, _ = _footprint_arrays(building_features)
+    widths, _ = _centreline_gaps(_line_array(street_features), geoms, max_gap_m)
+    return widths
+
+
+def _centreline_gaps(
+    lines: np.ndarray, geoms: np.ndarray, max_gap_m: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return centreline street widths and the index of the line each one belongs to."""
+    if len(lines) == 0 or len(geoms) == 0:
+        return np.empty(0), np.empty(0, dtype="int64")
+    ref_lat = float(np.mean(shapely.get_coordinates(shapely.centroid(geoms))[:, 1]))
+    local_lines = _to_local_meters(lines, ref_lat)
+    local_geoms = _to_local_meters(geoms, ref_lat)
+    tree = shapely.STRtree(local_geoms)
+    (line_idx, _), dist = tree.query_nearest(
+        local_lines, max_distance=max_gap_m / 2.0, return_distance=True
+    )
+    keep = dist > 0.0
+    return 2.0 * dist[keep], line_idx[keep]
+
+
+def _summarize(widths: np.ndarray, aspects: np.ndarray, mean_height_m: float) -> CanyonGeometry:
+    widths = widths[np.isfinite(widths)]
+    aspects = aspects[np.isfinite(aspects)]
+    if len(widths) == 0:
+        return CanyonGeometry.fallback(mean_height_m)
+    w25, w50, w75 = np.percentile(widths, [25.0, 50.0, 75.0])
+    if len(aspects):
+        a50, a75 = np.percentile(aspects, [50.0, 75.0])
+    else:
+        a50 = a75 = mean_height_m / w50
+    return CanyonGeometry(
+        street_width_m=float(w50),
+        street_width_p25_m=float(w25),
+        street_width_p75_m=float(w75),
+        canyon_aspect_ratio=float(a50),
+        canyon_aspect_p75=float(a75),
+        sample_count=int(len(widths)),
+    )
+
+
+def canyon_geometry(
+    building_features: Sequence[dict[str, Any]],
+    street_features: Sequence[dict[str, Any]] | None = None,
+    min_gap_m: float = 2.0,
+    max_gap_m: float = 80.0,
+) -> CanyonGeometry:
+    """Derive the street canyon distribution for one tile from its footprints."""
+    geoms, heights = _footprint_arrays(building_features)
+    width, aspect, _ = _facing_gaps(geoms, heights, min_gap_m, max_gap_m)
+    mean_height = float(np.mean(heights)) if len(heights) else DEFAULT_BUILDING_HEIGHT_M
+    if street_features:
+        line_widths, _ = _centreline_gaps(_line_array(street_features), geoms, max_gap_m)
+        width = np.concatenate([width, line_widths])
+        aspect = np.concatenate([aspect, mean_height / np.maximum(line_widths, 2.0)])
+    return _summarize(width, aspect, mean_height)
+
+
+def _tile_owner(tiles: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Index of the tile containing each point, or -1 outside every tile."""
+    owner = np.full(len(points), -1, dtype="int64")
+    if len(points) and len(tiles):
+        point_idx, tile_idx = shapely.STRtree(tiles).query(points, predicate="within")
+        owner[point_idx] = tile_idx
+    return owner
+
+
+def canyon_geometry_by_tile(
+    tile_geometries: Sequence[Any],
+    building_features: Sequence[dict[str, Any]],
+    street_features: Sequence[dict[str, Any]] | None = None,
+    min_gap_m: float = 2.0,
+    max_gap_m: float = 80.0,
+    workers: int = 1,
+) -> list[CanyonGeometry]:
+    """Derive canyon geometry for many tiles from one AOI-wide footprint set.
+
+    Gaps are measured across the whole AOI, so buildings facing each other across
+    a tile boundary are paired correctly. Each building is assigned to the tile
+    containing its centroid, and each street centreline width, as in
+    :func:`canyon_geometry`, to the tile containing the line's centroid.
+    """
+    geoms, heights = _footprint_arrays(building_features)
+    width, aspect, centroids = _facing_gaps(geoms, heights, min_gap_m, max_gap_m, workers)
+    tiles = np.asarray(tile_geometries, dtype=object)
+    owner = _tile_owner(tiles, shapely.points(centroids) if len(centroids) else centroids)
+
+    n_tiles = len(tiles)
+    assigned = owner >= 0
+    height_count = np.bincount(owner[assigned], minlength=n_tiles)
+    height_sum = np.bincount(owner[assigned], weights=heights[assigned], minlength=n_tiles)
+    mean_height = np.divide(
+        height_sum,
+        height_count,
+        out=np.full(n_tiles, DEFAULT_BUILDING_HEIGHT_M),
+        where=height_count > 0,
+    )
+    if street_features:
+        lines = _line_array(street_features)
+        line_widths, line_idx = _centreline_gaps(lines, geoms, max_gap_m)
+        line_owner = _tile_owner(tiles, shapely.centroid(lines[line_idx]))
+        line_aspect = np.full(len(line_widths), np.nan)
+        on_tile = line_owner >= 0
+        line_aspect[on_tile] = mean_height[line_owner[on_tile]] / np.maximum(
+            line_widths[on_tile], 2.0
+        )
+        owner = np.concatenate([owner, line_owner])
+        width = np.concatenate([width, line_widths])
+        aspect = np.concatenate([aspect, line_aspect])
+        assigned = owner >= 0
+    has_width = assigned & np.isfinite(width)
+    has_aspect = assigned & np.isfinite(aspect)
+    width_count = np.bincount(owner[has_width], minlength=n_tiles)
+    width_q = grouped_quantiles(owner[has_width], width[has_width], n_tiles, (25.0, 50.0, 75.0))
+    aspect_q = grouped_quantiles(owner[has_aspect], aspect[has_aspect], n_tiles, (50.0, 75.0))
+
+    results: list[CanyonGeometry] = []
+    for idx in range(n_tiles):
+        if width_count[idx] == 0:
+            results.append(CanyonGeometry.fallback(float(mean_height[idx])))
+            continue
+        w25, w50, w75 = width_q[idx]
+        a50, a75 = aspect_q[idx]
+        if not np.isfinite(a50):
+            a50 = a75 = mean_height[idx] / w50
+        results.append(
+            CanyonGeometry(
+                street_width_m=float(w50),
+                street_width_p25_m=float(w25),
+                street_width_p75_m=float(w75),
+                canyon_aspect_ratio=float(a50),
+                canyon_aspect_p75=float(a75),
+                sample_count=int(width_count[idx]),
+            )
+        )
+    return results
@@ -17,13 +17,33 @@ def summarize_street_scene(
     facade_ratio: np.ndarray,
 ) -> dict[str, float]:
     """Aggregate street-level segmentation-like ratios."""
-    gvr = float(np.mean(green_view_ratio))
-    svr = float(np.mean(sky_view_ratio))
-    fcr = float(np.mean(facade_ratio))
+    arrays = summarize_street_scene_array(
+        np.asarray(green_view_ratio)[None, ...],
+        np.asarray(sky_view_ratio)[None, ...],
+        np.asarray(facade_ratio)[None, ...],
+    )
+    return {name: float(values[0]) for name, values in arrays.items()}
+
+
+def summarize_street_scene_array(
+    green_view_ratio: np.ndarray,
+    sky_view_ratio: np.ndarray,
+    facade_ratio: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Aggregate street-level ratios for many tiles at once.
+
+    Inputs carry the tile axis first; any trailing axes (image samples, pixels)
+    are averaged, so ``(n_tiles, ...)`` arrays map to ``(n_tiles,)`` outputs.
+    """
+
+    def _tile_mean(values: np.ndarray) -> np.ndarray:
+        arr = np.asarray(values, dtype="float64")
+        return arr.reshape(arr.shape[0], -1).mean(axis=1)
+
     return {
-        "green_view_ratio": gvr,
-        "street_sky_ratio": svr,
-        "street_facade_ratio": fcr,
+        "green_view_ratio": _tile_mean(green_view_ratio),
+        "street_sky_ratio": _tile_mean(sky_view_ratio),
+        "street_facade_ratio": _tile_mean(facade_ratio),
     }
 
 
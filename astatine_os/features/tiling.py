@@ -6,11 +6,15 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
+import shapely
 from shapely.geometry import Polygon, box
 
 from astatine_os.data.aoi import AOI
+from astatine_os.data.grid import hilbert_index
 
 
 @dataclass(frozen=True)
@@ -55,3 +59,50 @@ def tile_aoi(aoi: AOI, tile_size_m: int) -> list[Tile]:
             x += step_x
         y += step_y
     return tiles
+
+
+def snapped_tiles(aoi: AOI, tile_size_m: int) -> list[Tile]:
+    """Return the cells of a global tile lattice that intersect ``aoi``.
+
+    Rows are ``tile_size_m`` tall from the south pole and each row is split
+    into columns from the antimeridian using the meter-to-degree factor at
+    the row's centre latitude. Cells keep their full square geometry and a
+    position-derived id, so AOIs that overlap share identical tiles.
+    """
+    minx, miny, maxx, maxy = aoi.bounds
+    step_y = _meter_to_degree_lat(tile_size_m)
+    tiles: list[Tile] = []
+    for row in range(math.floor((miny + 90.0) / step_y), math.ceil((maxy + 90.0) / step_y)):
+        y0 = -90.0 + row * step_y
+        step_x = _meter_to_degree_lon(tile_size_m, y0 + step_y / 2.0)
+        for col in range(math.floor((minx + 180.0) / step_x), math.ceil((maxx + 180.0) / step_x)):
+            x0 = -180.0 + col * step_x
+            cell = box(x0, y0, x0 + step_x, y0 + step_y)
+            if cell.intersects(aoi.geometry):
+                tiles.append(Tile(tile_id=f"g{tile_size_m}_r{row}_c{col}", geometry=cell))
+    return tiles
+
+
+def spatial_batches(tiles: list[Tile], batch_size: int) -> list[list[int]]:
+    """Group tile indices into batches of spatially contiguous tiles.
+
+    Tiles are ordered along a Hilbert curve through their centroids and cut
+    into runs of ``batch_size``, so each batch covers a compact patch.
+    """
+    if not tiles:
+        return []
+    centroids = np.array([tile.centroid_xy for tile in tiles], dtype="float64")
+    bounds = (
+        float(centroids[:, 0].min()),
+        float(centroids[:, 1].min()),
+        float(centroids[:, 0].max()),
+        float(centroids[:, 1].max()),
+    )
+    order = np.argsort(hilbert_index(centroids[:, 0], centroids[:, 1], bounds), kind="stable")
+    return [order[i : i + batch_size].tolist() for i in range(0, len(order), batch_size)]
+
+
+def batch_aoi(tiles: Sequence[Tile]) -> AOI:
+    """Bounding box of a batch of tiles, for provider requests that cover the whole batch."""
+    bounds = shapely.total_bounds(np.asarray([tile.geometry for tile in tiles], dtype=object))
+    return AOI(name=f"batch-{tiles[0].tile_id}", geometry=box(*bounds))
@@ -6,8 +6,11 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
+import shapely
 from shapely.geometry import Polygon, shape
 
 from astatine_os.data.aoi import AOI
@@ -49,3 +52,65 @@ def morphology_features(aoi: AOI, building_features: list[dict[str, Any]]) -> di
         "street_orientation_deg": float(orientation_mean),
         "roughness_proxy": float(roughness_proxy),
     }
+
+
+def morphology_features_by_tile(
+    tile_geometries: Sequence[Any], building_features: Sequence[dict[str, Any]]
+) -> list[dict[str, float]]:
+    """Compute :func:`morphology_features` for many tiles in one pass over shared footprints.
+
+    Each building is assigned to the tile containing its centroid, so a
+    footprint fetched by several neighbouring tiles is counted once.
+    """
+    geoms: list[Any] = []
+    heights: list[float] = []
+    for feature in building_features:
+        geom_obj = feature.get("geometry")
+        if not isinstance(geom_obj, dict):
+            continue
+        geom = shape(geom_obj)
+        if geom.geom_type == "MultiPolygon":
+            geom = max(geom.geoms, key=lambda g: g.area)
+        if not isinstance(geom, Polygon):
+            continue
+        geoms.append(geom)
+        heights.append(float(feature.get("properties", {}).get("height_m", 10.0)))
+
+    tiles = np.asarray(tile_geometries, dtype=object)
+    footprints = np.asarray(geoms, dtype=object)
+    n_tiles = len(tiles)
+    owner = np.full(len(footprints), -1, dtype="int64")
+    if len(footprints) and n_tiles:
+        point_idx, tile_idx = shapely.STRtree(tiles).query(
+            shapely.centroid(footprints), predicate="within"
+        )
+        owner[point_idx] = tile_idx
+    assigned = owner >= 0
+    owner = owner[assigned]
+    footprints = footprints[assigned]
+    bounds = shapely.bounds(footprints).reshape(-1, 4)
+    angles = np.degrees(
+        np.arctan2(bounds[:, 3] - bounds[:, 1], np.maximum(bounds[:, 2] - bounds[:, 0], 1e-9))
+    )
+    count = np.bincount(owner, minlength=n_tiles)
+    building_area = np.bincount(owner, weights=shapely.area(footprints), minlength=n_tiles)
+    height_sum = np.bincount(
+        owner, weights=np.asarray(heights, dtype="float64")[assigned], minlength=n_tiles
+    )
+    angle_sum = np.bincount(owner, weights=angles, minlength=n_tiles)
+
+    tile_area = np.maximum(shapely.area(tiles), 1e-9)
+    density = np.minimum(0.98, building_area / tile_area)
+    has_buildings = count > 0
+    mean_height = np.divide(height_sum, count, out=np.full(n_tiles, 8.0), where=has_buildings)
+    orientation_mean = np.divide(angle_sum, count, out=np.full(n_tiles, 45.0), where=has_buildings)
+    roughness_proxy = density * mean_height / 20.0
+    return [
+        {
+            "building_density": float(density[idx]),
+            "mean_building_height_m": float(mean_height[idx]),
+            "street_orientation_deg": float(orientation_mean[idx]),
+            "roughness_proxy": float(roughness_proxy[idx]),
+        }
+        for idx in range(n_tiles)
+    ]
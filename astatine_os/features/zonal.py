@@ -0,0 +1,324 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Zonal statistics over an integer label raster."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import shapely
+from shapely.geometry import box
+
+from astatine_os.data.grid import RasterGrid, rasterize_polygons
+
+NO_ZONE = -1
+DEFAULT_STATS: tuple[str, ...] = ("mean", "std", "count")
+
+
+def tile_label_raster(geometries: Sequence[Any], grid: RasterGrid) -> np.ndarray:
+    """Rasterize zone polygons once into an int32 label raster aligned with ``grid``.
+
+    Pixel values are the zone index in ``geometries``; pixels outside every
+    zone hold ``NO_ZONE``.
+    """
+    labels = np.arange(len(geometries), dtype="int32")
+    return rasterize_polygons(geometries, labels, grid, fill=NO_ZONE, dtype="int32")
+
+
+def _label_block(
+    block: np.ndarray,
+    geometries: np.ndarray,
+    tree: Any,
+    grid: RasterGrid,
+    block_info: dict[Any, Any] | None = None,
+) -> np.ndarray:
+    if block_info is None:
+        raise ValueError("_label_block must be called through map_blocks, which passes block_info.")
+    (row0, row1), (col0, col1) = block_info[None]["array-location"]
+    sub = grid.window(slice(row0, row1), slice(col0, col1))
+    hits = np.sort(tree.query(box(*sub.bounds)))
+    labels = hits.astype("int32")
+    return rasterize_polygons(geometries[hits], labels, sub, fill=NO_ZONE, dtype="int32")
+
+
+def tile_label_raster_dask(
+    geometries: Sequence[Any], grid: RasterGrid, chunk_size: int = 1024
+) -> Any:
+    """Lazy, chunked equivalent of ``tile_label_raster``.
+
+    Each block only rasterizes the zones whose bounding boxes intersect it, so
+    label rasters for city-scale grids never need to exist in memory at once.
+    """
+    import dask.array as da
+
+    geoms = np.asarray(geometries, dtype=object)
+    tree = shapely.STRtree(geoms)
+    template = da.empty(grid.shape, chunks=chunk_size, dtype="int32")
+    return template.map_blocks(_label_block, geometries=geoms, tree=tree, grid=grid, dtype="int32")
+
+
+def representative_pixels(geometries: Sequence[Any], grid: RasterGrid) -> np.ndarray:
+    """Return ``(row, col)`` of the pixel containing each zone's representative point."""
+    out = np.empty((len(geometries), 2), dtype="int64")
+    for idx, geom in enumerate(geometries):
+        point = geom.representative_point()
+        col = int((point.x - grid.minx) / grid.res_x)
+        row = int((grid.maxy - point.y) / grid.res_y)
+        out[idx] = (min(max(row, 0), grid.height - 1), min(max(col, 0), grid.width - 1))
+    return out
+
+
+def grouped_quantiles(
+    groups: np.ndarray,
+    values: np.ndarray,
+    n_groups: int,
+    quantiles: Sequence[float],
+) -> np.ndarray:
+    """Exact per-group quantiles with linear interpolation, as in ``np.percentile``.
+
+    ``groups`` must hold integers in ``[0, n_groups)``. One lexicographic sort
+    orders values within their group, after which every quantile of every group
+    is read with fancy indexing. Returns an ``(n_groups, len(quantiles))``
+    array with ``NaN`` for empty groups. ``quantiles`` are percentages.
+    """
+    qs = np.asarray(quantiles, dtype="float64") / 100.0
+    result = np.full((n_groups, len(qs)), np.nan)
+    if len(values) == 0 or len(qs) == 0:
+        return result
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    present = counts > 0
+    position = qs[np.newaxis, :] * (counts[present, np.newaxis] - 1)
+    lower = np.floor(position).astype("int64")
+    upper = np.minimum(lower + 1, counts[present, np.newaxis] - 1)
+    frac = position - lower
+    base = starts[present, np.newaxis]
+    low_values = sorted_values[base + lower]
+    high_values = sorted_values[base + upper]
+    result[present] = low_values + (high_values - low_values) * frac
+    return result
+
+
+def _moments(
+    labels: np.ndarray, values: np.ndarray, n_zones: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    labels = np.asarray(labels).ravel()
+    values = np.asarray(values, dtype="float64").ravel()
+    valid = (labels >= 0) & (labels < n_zones) & np.isfinite(values)
+    zone = labels[valid]
+    data = values[valid]
+    return (
+        np.bincount(zone, minlength=n_zones).astype("float64"),
+        np.bincount(zone, weights=data, minlength=n_zones),
+        np.bincount(zone, weights=data * data, minlength=n_zones),
+    )
+
+
+def _finalize(
+    count: np.ndarray, total: np.ndarray, total_sq: np.ndarray, stats: Sequence[str]
+) -> dict[str, np.ndarray]:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+        var = np.where(count > 0, np.maximum(total_sq / count - mean * mean, 0.0), np.nan)
+    out: dict[str, np.ndarray] = {}
+    if "mean" in stats:
+        out["mean"] = mean
+    if "std" in stats:
+        out["std"] = np.sqrt(var)
+    if "count" in stats:
+        out["count"] = count.astype("int64")
+    return out
+
+
+def _zonal_numpy(
+    values: np.ndarray,
+    labels: np.ndarray,
+    n_zones: int,
+    stats: Sequence[str],
+    quantiles: Sequence[float],
+) -> dict[str, np.ndarray]:
+    count, total, total_sq = _moments(labels, values, n_zones)
+    out = _finalize(count, total, total_sq, stats)
+    if quantiles:
+        flat_labels = np.asarray(labels).ravel()
+        flat_values = np.asarray(values, dtype="float64").ravel()
+        valid = (flat_labels >= 0) & (flat_labels < n_zones) & np.isfinite(flat_values)
+        table = grouped_quantiles(flat_labels[valid], flat_values[valid], n_zones, quantiles)
+        for idx, q in enumerate(quantiles):
+            out[f"p{q:g}"] = table[:, idx]
+    return out
+
+
+def _block_moments(values: np.ndarray, labels: np.ndarray, n_zones: int) -> np.ndarray:
+    return np.stack(_moments(labels, values, n_zones))[np.newaxis, np.newaxis]
+
+
+def _block_extrema(values: np.ndarray, labels: np.ndarray, n_zones: int) -> np.ndarray:
+    labels = labels.ravel()
+    data = values.astype("float64").ravel()
+    valid = (labels >= 0) & (labels < n_zones) & np.isfinite(data)
+    low = np.full(n_zones, np.inf)
+    high = np.full(n_zones, -np.inf)
+    np.minimum.at(low, labels[valid], data[valid])
+    np.maximum.at(high, labels[valid], data[valid])
+    return np.stack([low, high])[np.newaxis, np.newaxis]
+
+
+def _block_histogram(
+    values: np.ndarray,
+    labels: np.ndarray,
+    low: np.ndarray,
+    width: np.ndarray,
+    n_zones: int,
+    n_bins: int,
+) -> np.ndarray:
+    labels = labels.ravel()
+    data = values.astype("float64").ravel()
+    valid = (labels >= 0) & (labels < n_zones) & np.isfinite(data)
+    zone = labels[valid]
+    bins = np.clip(((data[valid] - low[zone]) / width[zone]).astype("int64"), 0, n_bins - 1)
+    hist = np.bincount(zone * n_bins + bins, minlength=n_zones * n_bins)
+    return hist.reshape(1, 1, n_zones, n_bins)
+
+
+def _zonal_dask(
+    values: Any,
+    labels: Any,
+    n_zones: int,
+    stats: Sequence[str],
+    quantiles: Sequence[float],
+    n_bins: int,
+) -> dict[str, np.ndarray]:
+    import dask.array as da
+
+    labels = da.asarray(labels).rechunk(values.chunks)
+    partial = da.map_blocks(
+        _block_moments,
+        values,
+        labels,
+        n_zones=n_zones,
+        new_axis=[2, 3],
+        chunks=((1,) * values.numblocks[0], (1,) * values.numblocks[1], (3,), (n_zones,)),
+        dtype="float64",
+    )
+    count, total, total_sq = partial.sum(axis=(0, 1)).compute()
+    out = _finalize(count, total, total_sq, stats)
+    if not quantiles:
+        return out
+
+    extrema = da.map_blocks(
+        _block_extrema,
+        values,
+        labels,
+        n_zones=n_zones,
+        new_axis=[2, 3],
+        chunks=((1,) * values.numblocks[0], (1,) * values.numblocks[1], (2,), (n_zones,)),
+        dtype="float64",
+    )
+    low = extrema[:, :, 0].min(axis=(0, 1)).compute()
+    high = extrema[:, :, 1].max(axis=(0, 1)).compute()
+    low = np.where(np.isfinite(low), low, 0.0)
+    width = np.where(high > low, (high - low) / n_bins, 1.0)
+    hist = (
+        da.map_blocks(
+            _block_histogram,
+            values,
+            labels,
+            low=low,
+            width=width,
+            n_zones=n_zones,
+            n_bins=n_bins,
+            new_axis=[2, 3],
+            chunks=(
+                (1,) * values.numblocks[0],
+                (1,) * values.numblocks[1],
+                (n_zones,),
+                (n_bins,),
+            ),
+            dtype="int64",
+        )
+        .sum(axis=(0, 1))
+        .compute()
+    )
+    cumulative = np.cumsum(hist, axis=1)
+    for q in quantiles:
+        target = q / 100.0 * count
+        bin_idx = np.minimum((cumulative < target[:, np.newaxis]).sum(axis=1), n_bins - 1)
+        prev = np.where(bin_idx > 0, cumulative[np.arange(n_zones), bin_idx - 1], 0)
+        in_bin = np.maximum(hist[np.arange(n_zones), bin_idx], 1)
+        frac = np.clip((target - prev) / in_bin, 0.0, 1.0)
+        estimate = low + (bin_idx + frac) * width
+        out[f"p{q:g}"] = np.where(count > 0, np.minimum(estimate, high), np.nan)
+    return out
+
+
+def zonal_statistics(
+    values: Any,
+    labels: Any,
+    n_zones: int,
+    stats: Sequence[str] = DEFAULT_STATS,
+    quantiles: Sequence[float] = (),
+    n_bins: int = 256,
+) -> dict[str, np.ndarray]:
+    """Aggregate a raster per zone of a label raster.
+
+    Returns one array of length ``n_zones`` per requested statistic
+    (``mean``, ``std``, ``count``) and per quantile (keyed ``p<q>``). Non-finite
+    values and ``NO_ZONE`` pixels are ignored; empty zones yield ``NaN``.
+    NumPy inputs are reduced with ``bincount`` and an exact sort-based
+    quantile. Dask inputs are reduced block by block so memory stays bounded
+    by the chunk size; their quantiles come from ``n_bins`` per-zone
+    histograms and are therefore approximate to one bin width.
+    """
+    if hasattr(values, "dask"):
+        return _zonal_dask(values, labels, n_zones, stats, quantiles, n_bins)
+    return _zonal_numpy(np.asarray(values), np.asarray(labels), n_zones, stats, quantiles)
+
+
+def zonal_statistics_stack(
+    bands: Mapping[str, Any],
+    labels: Any,
+    n_zones: int,
+    stats: Sequence[str] = DEFAULT_STATS,
+    quantiles: Sequence[float] = (),
+) -> dict[str, dict[str, np.ndarray]]:
+    """Aggregate several aligned bands or indices against one label raster."""
+    return {
+        name: zonal_statistics(band, labels, n_zones, stats=stats, quantiles=quantiles)
+        for name, band in bands.items()
+    }
+
+
+def zone_means(
+    bands: Mapping[str, np.ndarray],
+    geometries: Sequence[Any],
+    bounds: tuple[float, float, float, float],
+) -> dict[str, np.ndarray]:
+    """Per-zone means of AOI mosaics covering ``bounds``.
+
+    Bands sharing a shape share one label raster. Zones too small to contain a
+    pixel center take the value of the pixel under their representative point.
+    """
+    minx, miny, maxx, maxy = bounds
+    labels_by_shape: dict[tuple[int, ...], tuple[np.ndarray, np.ndarray]] = {}
+    out: dict[str, np.ndarray] = {}
+    for name, band in bands.items():
+        arr = np.asarray(band)
+        if arr.shape not in labels_by_shape:
+            grid = RasterGrid(minx, miny, maxx, maxy, width=arr.shape[1], height=arr.shape[0])
+            labels_by_shape[arr.shape] = (
+                tile_label_raster(geometries, grid),
+                representative_pixels(geometries, grid),
+            )
+        labels, fallback_px = labels_by_shape[arr.shape]
+        stats = zonal_statistics(arr, labels, len(geometries), stats=("mean", "count"))
+        mean = stats["mean"]
+        empty = stats["count"] == 0
+        mean[empty] = arr[fallback_px[empty, 0], fallback_px[empty, 1]]
+        out[name] = mean
+    return out
@@ -4,7 +4,14 @@
 """Graph modeling utilities."""
 
 from astatine_os.graph.build_graph import build_airflow_graph
-from astatine_os.graph.physics_proxies import compute_physics_proxies
-from astatine_os.graph.schemas import GraphPrediction, TileFeature
+from astatine_os.graph.physics_proxies import compute_physics_proxies, compute_physics_proxies_array
+from astatine_os.graph.schemas import GraphPrediction, TileFeature, TileFeatureTable
 
-__all__ = ["GraphPrediction", "TileFeature", "build_airflow_graph", "compute_physics_proxies"]
+__all__ = [
+    "GraphPrediction",
+    "TileFeature",
+    "TileFeatureTable",
+    "build_airflow_graph",
+    "compute_physics_proxies",
+    "compute_physics_proxies_array",
+]
@@ -5,6 +5,62 @@
 
 from __future__ import annotations
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def compute_physics_proxies_array(
+    building_density: ArrayLike,
+    mean_building_height_m: ArrayLike,
+    street_width_m: ArrayLike,
+    street_orientation_deg: ArrayLike,
+    vegetation_fraction: ArrayLike,
+    green_view_ratio: ArrayLike,
+    sky_view_factor: ArrayLike | None = None,
+) -> dict[str, np.ndarray]:
+    """Estimate interpretable physical proxies for many tiles at once.
+
+    All inputs broadcast against each other and every output is a float64
+    array of the broadcast shape. ``NaN`` entries in ``sky_view_factor`` fall
+    back to the aspect-ratio approximation for that tile.
+    """
+    density = np.asarray(building_density, dtype="float64")
+    height = np.asarray(mean_building_height_m, dtype="float64")
+    width = np.asarray(street_width_m, dtype="float64")
+    orientation = np.asarray(street_orientation_deg, dtype="float64")
+
+    canyon_aspect_ratio = height / np.maximum(2.0, width)
+    sky_view_factor_proxy = np.maximum(0.05, 1.0 - np.minimum(0.95, canyon_aspect_ratio * 0.6))
+    if sky_view_factor is not None:
+        measured = np.asarray(sky_view_factor, dtype="float64")
+        sky_view_factor_proxy = np.where(
+            np.isnan(measured),
+            sky_view_factor_proxy,
+            np.clip(measured, 0.05, 1.0),
+        )
+    roughness_proxy = density * (height / 25.0)
+    ventilation_barrier_proxy = (1.0 - sky_view_factor_proxy) * (1.0 + roughness_proxy)
+    orientation_factor = np.abs((orientation % 180.0) - 90.0) / 90.0
+    vegetation_cooling_proxy = 0.5 * np.asarray(vegetation_fraction, dtype="float64") + 0.5 * (
+        np.asarray(green_view_ratio, dtype="float64")
+    )
+    shape = np.broadcast_shapes(
+        canyon_aspect_ratio.shape,
+        sky_view_factor_proxy.shape,
+        roughness_proxy.shape,
+        orientation_factor.shape,
+        vegetation_cooling_proxy.shape,
+    )
+    outputs = {
+        "canyon_aspect_ratio": canyon_aspect_ratio,
+        "sky_view_factor_proxy": sky_view_factor_proxy,
+        "roughness_proxy": roughness_proxy,
+        "ventilation_barrier_proxy": ventilation_barrier_proxy,
+        "orientation_factor": orientation_factor,
+        "vegetation_cooling_proxy": vegetation_cooling_proxy,
+    }
+    return {name: np.broadcast_to(value, shape) for name, value in outputs.items()}
+
 
 def compute_physics_proxies(
     building_density: float,
@@ -13,19 +69,20 @@ def compute_physics_proxies(
     street_orientation_deg: float,
     vegetation_fraction: float,
     green_view_ratio: float,
+    sky_view_factor: float | None = None,
 ) -> dict[str, float]:
-    """Estimate interpretable physical proxies."""
-    canyon_aspect_ratio = mean_building_height_m / max(2.0, street_width_m)
-    sky_view_factor_proxy = max(0.05, 1.0 - min(0.95, canyon_aspect_ratio * 0.6))
-    roughness_proxy = building_density * (mean_building_height_m / 25.0)
-    ventilation_barrier_proxy = (1.0 - sky_view_factor_proxy) * (1.0 + roughness_proxy)
-    orientation_factor = abs((street_orientation_deg % 180.0) - 90.0) / 90.0
-    vegetation_cooling_proxy = 0.5 * vegetation_fraction + 0.5 * green_view_ratio
-    return {
-        "canyon_aspect_ratio": float(canyon_aspect_ratio),
-        "sky_view_factor_proxy": float(sky_view_factor_proxy),
-        "roughness_proxy": float(roughness_proxy),
-        "ventilation_barrier_proxy": float(ventilation_barrier_proxy),
-        "orientation_factor": float(orientation_factor),
-        "vegetation_cooling_proxy": float(vegetation_cooling_proxy),
-    }
+    """Estimate interpretable physical proxies.
+
+    When a raster ``sky_view_factor`` is supplied it replaces the aspect-ratio
+    approximation.
+    """
+    arrays = compute_physics_proxies_array(
+        building_density=building_density,
+        mean_building_height_m=mean_building_height_m,
+        street_width_m=street_width_m,
+        street_orientation_deg=street_orientation_deg,
+        vegetation_fraction=vegetation_fraction,
+        green_view_ratio=green_view_ratio,
+        sky_view_factor=np.nan if sky_view_factor is None else sky_view_factor,
+    )
+    return {name: float(value) for name, value in arrays.items()}
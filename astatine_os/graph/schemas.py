@@ -5,7 +5,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+
+import numpy as np
 
 
 @dataclass
@@ -29,6 +32,72 @@ class TileFeature:
     meteo_wind_m_s: float
 
 
+TILE_FEATURE_COLUMNS: tuple[str, ...] = tuple(
+    item.name for item in fields(TileFeature) if item.name != "tile_id"
+)
+
+
+@dataclass
+class TileFeatureTable:
+    """Columnar view of many ``TileFeature`` rows.
+
+    ``tile_id`` is a string array and every other ``TileFeature`` field is a
+    float64 array of the same length, so whole-AOI computations can operate
+    on columns instead of per-tile objects.
+    """
+
+    tile_id: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    def __post_init__(self) -> None:
+        missing = [name for name in TILE_FEATURE_COLUMNS if name not in self.columns]
+        if missing:
+            raise ValueError(f"TileFeatureTable is missing columns: {missing}")
+        for name in TILE_FEATURE_COLUMNS:
+            column = np.asarray(self.columns[name], dtype="float64")
+            if column.shape != self.tile_id.shape:
+                raise ValueError(
+                    f"Column {name} has shape {column.shape}, expected {self.tile_id.shape}"
+                )
+            self.columns[name] = column
+
+    def __len__(self) -> int:
+        return int(self.tile_id.shape[0])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @classmethod
+    def from_columns(
+        cls, tile_id: Iterable[str], columns: Mapping[str, Iterable[float]]
+    ) -> TileFeatureTable:
+        """Build a table from any iterable columns."""
+        return cls(
+            tile_id=np.asarray(list(tile_id), dtype=str),
+            columns={name: np.asarray(list(columns[name]), dtype="float64") for name in columns},
+        )
+
+    @classmethod
+    def from_features(cls, features: Iterable[TileFeature]) -> TileFeatureTable:
+        """Convert row objects into columns."""
+        rows = list(features)
+        return cls(
+            tile_id=np.asarray([row.tile_id for row in rows], dtype=str),
+            columns={
+                name: np.fromiter((getattr(row, name) for row in rows), "float64", len(rows))
+                for name in TILE_FEATURE_COLUMNS
+            },
+        )
+
+    def to_features(self) -> list[TileFeature]:
+        """Convert columns back into row objects with Python floats."""
+        lists = {name: self.columns[name].tolist() for name in TILE_FEATURE_COLUMNS}
+        return [
+            TileFeature(tile_id=str(tile_id), **{name: lists[name][idx] for name in lists})
+            for idx, tile_id in enumerate(self.tile_id.tolist())
+        ]
+
+
 @dataclass
 class GraphPrediction:
     """Model output for one tile."""
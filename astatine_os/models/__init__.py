@@ -3,6 +3,6 @@
 
 """Model definitions for vision and graph learning."""
 
-from astatine_os.models.inference import InferenceEngine
+from astatine_os.models.inference import MODEL_VERSION, InferenceEngine
 
-__all__ = ["InferenceEngine"]
+__all__ = ["MODEL_VERSION", "InferenceEngine"]
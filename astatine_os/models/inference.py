@@ -7,11 +7,64 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
 
 import networkx as nx
+import numpy as np
 
 from astatine_os.graph.schemas import GraphPrediction, TileFeature
 
+# Bump whenever the baseline formulas change so cached results are invalidated.
+MODEL_VERSION = "baseline-1"
+
+
+def surface_temperature_term(
+    ndbi: Any,
+    ndvi: Any,
+    building_density: Any,
+    roughness_proxy: Any,
+) -> Any:
+    """Part of the temperature anomaly driven by slow-changing surface data."""
+    return 2.2 * ndbi - 1.6 * ndvi + 1.2 * building_density + 0.8 * roughness_proxy
+
+
+def meteo_temperature_term(meteo_air_temp_c: Any, meteo_wind_m_s: Any) -> Any:
+    """Part of the temperature anomaly driven by meteorology."""
+    return 0.03 * (meteo_air_temp_c - 25.0) - 0.15 * meteo_wind_m_s
+
+
+def temperature_anomaly(
+    ndbi: Any,
+    ndvi: Any,
+    building_density: Any,
+    roughness_proxy: Any,
+    meteo_air_temp_c: Any,
+    meteo_wind_m_s: Any,
+) -> Any:
+    """Baseline temperature anomaly; accepts scalars, NumPy or Dask arrays."""
+    return surface_temperature_term(
+        ndbi, ndvi, building_density, roughness_proxy
+    ) + meteo_temperature_term(meteo_air_temp_c, meteo_wind_m_s)
+
+
+def ventilation_score(
+    street_sky_ratio: Any,
+    canyon_aspect_ratio: Any,
+    roughness_proxy: Any,
+    green_view_ratio: Any,
+    degree: Any,
+) -> Any:
+    """Baseline ventilation score clipped to [0, 1]; accepts scalars or arrays."""
+    vent = (
+        0.5
+        + 0.4 * street_sky_ratio
+        - 0.35 * canyon_aspect_ratio
+        - 0.25 * roughness_proxy
+        + 0.20 * green_view_ratio
+        + 0.03 * degree
+    )
+    return np.clip(vent, 0.0, 1.0)
+
 
 @dataclass
 class InferenceEngine:
@@ -31,23 +84,21 @@ class InferenceEngine:
 
         for tile_id, feature in by_tile.items():
             degree = graph.degree(tile_id) if graph.has_node(tile_id) else 0
-            temp = (
-                2.2 * feature.ndbi
-                - 1.6 * feature.ndvi
-                + 1.2 * feature.building_density
-                + 0.8 * feature.roughness_proxy
-                + 0.03 * (feature.meteo_air_temp_c - 25.0)
-                - 0.15 * feature.meteo_wind_m_s
+            temp = temperature_anomaly(
+                feature.ndbi,
+                feature.ndvi,
+                feature.building_density,
+                feature.roughness_proxy,
+                feature.meteo_air_temp_c,
+                feature.meteo_wind_m_s,
             )
-            vent = (
-                0.5
-                + 0.4 * feature.street_sky_ratio
-                - 0.35 * feature.canyon_aspect_ratio
-                - 0.25 * feature.roughness_proxy
-                + 0.20 * feature.green_view_ratio
-                + 0.03 * degree
+            vent = ventilation_score(
+                feature.street_sky_ratio,
+                feature.canyon_aspect_ratio,
+                feature.roughness_proxy,
+                feature.green_view_ratio,
+                degree,
             )
-            vent = max(0.0, min(1.0, vent))
             predictions.append(
                 GraphPrediction(
                     tile_id=tile_id,
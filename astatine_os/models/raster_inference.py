@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Pixel-resolution microclimate maps over chunked Dask arrays."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from astatine_os.graph.schemas import TileFeatureTable
+from astatine_os.models.inference import temperature_anomaly, ventilation_score
+
+TILE_LAYERS: tuple[str, ...] = (
+    "building_density",
+    "roughness_proxy",
+    "meteo_air_temp_c",
+    "meteo_wind_m_s",
+    "street_sky_ratio",
+    "canyon_aspect_ratio",
+    "green_view_ratio",
+    "degree",
+)
+
+
+def _take_block(labels: np.ndarray, lookup: np.ndarray) -> np.ndarray:
+    # NO_ZONE (-1) indexes the trailing NaN sentinel appended to the lookup.
+    return lookup[np.where(labels < 0, len(lookup) - 1, labels)]
+
+
+def broadcast_tile_values(labels: Any, values: np.ndarray) -> Any:
+    """Map a (Dask) label raster to one float32 value per tile; ``NaN`` outside tiles."""
+    import dask.array as da
+
+    lookup = np.append(np.asarray(values, dtype="float32"), np.float32(np.nan))
+    return da.asarray(labels).map_blocks(_take_block, lookup=lookup, dtype="float32")
+
+
+def broadcast_tile_layers(
+    labels: Any,
+    table: TileFeatureTable,
+    degree: np.ndarray,
+    layers: tuple[str, ...] = TILE_LAYERS,
+) -> dict[str, Any]:
+    """Broadcast tile-level columns onto the pixel grid through a label raster.
+
+    ``labels`` is a (Dask) int32 raster of row indices into ``table``.
+    Pixels outside every tile receive ``NaN``.
+    """
+    columns = {**table.columns, "degree": np.asarray(degree, dtype="float64")}
+    return {name: broadcast_tile_values(labels, columns[name]) for name in layers}
+
+
+def microclimate_rasters(
+    ndvi: Any,
+    ndbi: Any,
+    labels: Any,
+    table: TileFeatureTable,
+    degree: np.ndarray,
+    street_sky_ratio: Any | None = None,
+) -> dict[str, Any]:
+    """Evaluate the baseline formulas pixel-wise.
+
+    ``ndvi`` and ``ndbi`` are pixel rasters on the label grid. Morphology,
+    street-scene and meteorology inputs come from the tile table, broadcast
+    lazily block by block. An optional pixel ``street_sky_ratio`` (for example
+    a raster sky view factor) replaces the tile value. Outputs are lazy
+    float32 Dask arrays with the chunking of ``labels``.
+    """
+    import dask.array as da
+
+    labels = da.asarray(labels)
+    ndvi = da.asarray(ndvi).rechunk(labels.chunks)
+    ndbi = da.asarray(ndbi).rechunk(labels.chunks)
+    layers = broadcast_tile_layers(labels, table, degree)
+    sky = layers["street_sky_ratio"]
+    if street_sky_ratio is not None:
+        sky = da.asarray(street_sky_ratio).rechunk(labels.chunks)
+
+    temperature = temperature_anomaly(
+        ndbi,
+        ndvi,
+        layers["building_density"],
+        layers["roughness_proxy"],
+        layers["meteo_air_temp_c"],
+        layers["meteo_wind_m_s"],
+    )
+    ventilation = ventilation_score(
+        sky,
+        layers["canyon_aspect_ratio"],
+        layers["roughness_proxy"],
+        layers["green_view_ratio"],
+        layers["degree"],
+    )
+    return {
+        "temperature_anomaly_c": temperature.astype("float32"),
+        "ventilation_score": ventilation.astype("float32"),
+    }
+
+
+def graph_degree(graph: Any, tile_ids: Iterable[str]) -> np.ndarray:
+    """Return node degree per tile in table order."""
+    return np.array(
+        [graph.degree(tile_id) if graph.has_node(tile_id) else 0 for tile_id in tile_ids],
+        dtype="float64",
+    )
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Long-lived sessions that re-score meteorology on resident surface features."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from astatine_os.data.io_vector import GeoJSONStreamWriter, encode_geometries
+from astatine_os.data.providers import Provider, TimeRange
+from astatine_os.features.tiling import Tile, batch_aoi, spatial_batches
+from astatine_os.graph.schemas import TileFeatureTable
+from astatine_os.logging import get_logger
+from astatine_os.models.inference import (
+    meteo_temperature_term,
+    surface_temperature_term,
+    ventilation_score,
+)
+from astatine_os.models.raster_inference import graph_degree
+
+LOGGER = get_logger(__name__)
+
+
+@dataclass
+class NowcastUpdate:
+    """Per-tile layers after one meteorology update, in session tile order."""
+
+    tile_ids: list[str]
+    air_temp_c: np.ndarray
+    wind_m_s: np.ndarray
+    temperature_anomaly_c: np.ndarray
+    ventilation_score: np.ndarray
+    elapsed_s: float
+
+
+class NowcastSession:
+    """Keeps surface-derived partial scores resident between meteorology updates.
+
+    The temperature anomaly is linear in air temperature and wind speed, so
+    the surface term, the ventilation score and the tile geometries are
+    computed once. Each update only evaluates the meteorology term.
+    ERA5 is requested once per batch of ``batch_size`` tiles, matching the
+    analysis run with the same ``tile_batch_size``.
+    """
+
+    def __init__(
+        self,
+        tiles: list[Tile],
+        table: TileFeatureTable,
+        graph: Any,
+        meteo_provider: Provider,
+        batch_size: int = 1,
+    ) -> None:
+        by_id = {tile.tile_id: tile for tile in tiles}
+        self.tile_ids = table.tile_id.tolist()
+        self.tiles = [by_id[tile_id] for tile_id in self.tile_ids]
+        self.meteo_provider = meteo_provider
+        self.batch_size = batch_size
+        self.surface_term = surface_temperature_term(
+            table["ndbi"], table["ndvi"], table["building_density"], table["roughness_proxy"]
+        )
+        self.ventilation = ventilation_score(
+            table["street_sky_ratio"],
+            table["canyon_aspect_ratio"],
+            table["roughness_proxy"],
+            table["green_view_ratio"],
+            graph_degree(graph, self.tile_ids),
+        )
+        self._geometries = encode_geometries([tile.geometry for tile in self.tiles], precision=7)
+
+    def update(self, air_temp_c: Any, wind_m_s: Any) -> NowcastUpdate:
+        """Re-score with a meteorology slice: scalars or one value per tile."""
+        started = time.perf_counter()
+        size = len(self.tile_ids)
+        air = np.broadcast_to(np.asarray(air_temp_c, dtype="float64"), (size,))
+        wind = np.broadcast_to(np.asarray(wind_m_s, dtype="float64"), (size,))
+        temperature = self.surface_term + meteo_temperature_term(air, wind)
+        return NowcastUpdate(
+            tile_ids=self.tile_ids,
+            air_temp_c=air,
+            wind_m_s=wind,
+            temperature_anomaly_c=temperature,
+            ventilation_score=self.ventilation,
+            elapsed_s=time.perf_counter() - started,
+        )
+
+    def refresh(self, time_range: TimeRange) -> NowcastUpdate:
+        """Fetch the ERA5 slice for ``time_range`` per tile batch and re-score."""
+        started = time.perf_counter()
+        bands = ["air_temp_c", "wind_speed_m_s"]
+        air = np.empty(len(self.tiles), dtype="float64")
+        wind = np.empty(len(self.tiles), dtype="float64")
+        for batch in spatial_batches(self.tiles, self.batch_size):
+            payload = self.meteo_provider.fetch(
+                batch_aoi([self.tiles[idx] for idx in batch]),
+                time_range,
+                resolution=1,
+                bands=bands,
+            )
+            air[batch] = float(np.mean(payload.arrays["air_temp_c"]))
+            wind[batch] = float(np.mean(payload.arrays["wind_speed_m_s"]))
+        result = self.update(air, wind)
+        result.elapsed_s = time.perf_counter() - started
+        return result
+
+    def write(self, update: NowcastUpdate, out_dir: Path) -> Path:
+        """Write the updated temperature anomaly layer as GeoJSON."""
+        with GeoJSONStreamWriter(out_dir / "temperature_anomaly.geojson") as writer:
+            for idx, tile_id in enumerate(update.tile_ids):
+                writer.write_encoded(
+                    self._geometries[idx],
+                    {
+                        "tile_id": tile_id,
+                        "temperature_anomaly_c": float(update.temperature_anomaly_c[idx]),
+                        "ventilation_score": float(update.ventilation_score[idx]),
+                        "air_temp_c": float(update.air_temp_c[idx]),
+                        "wind_m_s": float(update.wind_m_s[idx]),
+                    },
+                )
+        LOGGER.info(
+            "Wrote nowcast layer",
+            extra={"context": {"tiles": len(update.tile_ids), "elapsed_s": update.elapsed_s}},
+        )
+        return writer.path
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Content-hashed stage graph with per-stage memoization in ``CacheStore``."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from graphlib import TopologicalSorter
+from typing import Any
+
+from astatine_os.data.cache import CacheStore
+from astatine_os.logging import get_logger
+from astatine_os.version import __version__
+
+LOGGER = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of the analysis graph.
+
+    ``func`` receives the outputs of ``deps`` by stage name. ``params`` holds
+    every other input that affects the output and must be JSON-serializable;
+    bump ``version`` when the stage code changes its results. Memoized stages
+    store ``encode(output)`` in the cache and rebuild it with ``decode``.
+    Stages with ``memoize=False`` (sources and artifact writers) always run.
+    """
+
+    name: str
+    func: Callable[[dict[str, Any]], Any]
+    deps: tuple[str, ...] = ()
+    params: dict[str, Any] = field(default_factory=dict)
+    version: str = "1"
+    memoize: bool = True
+    encode: Callable[[Any], Any] | None = None
+    decode: Callable[[Any], Any] | None = None
+
+
+@dataclass(frozen=True)
+class StageRecord:
+    """How a stage was satisfied in one run: ``hit``, ``miss`` or ``run``."""
+
+    name: str
+    status: str
+    key: str
+
+
+class StagePipeline:
+    """Runs stages in dependency order, reusing cached outputs whose key matches.
+
+    A stage key hashes the stage name, version, package version, params and
+    the content digests of its dependencies' outputs. Because digests are
+    taken from outputs rather than keys, a stage that recomputes to an
+    identical result leaves every downstream stage a cache hit.
+    """
+
+    def __init__(self, stages: Sequence[Stage], cache: CacheStore) -> None:
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique.")
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {missing}")
+        self.cache = cache
+        self.order = list(
+            TopologicalSorter({stage.name: stage.deps for stage in stages}).static_order()
+        )
+
+    def _key(self, stage: Stage, digests: dict[str, str]) -> str:
+        return CacheStore.make_key(
+            {
+                "kind": "stage",
+                "stage": stage.name,
+                "version": stage.version,
+                "package_version": __version__,
+                "params": stage.params,
+                "inputs": {dep: digests[dep] for dep in stage.deps},
+            }
+        )
+
+    def run(self) -> tuple[dict[str, Any], list[StageRecord]]:
+        """Evaluate every stage; returns outputs by name and one record per stage."""
+        outputs: dict[str, Any] = {}
+        digests: dict[str, str] = {}
+        records: list[StageRecord] = []
+        for name in self.order:
+            stage = self.stages[name]
+            key = self._key(stage, digests)
+            entry = self.cache.load_json(key) if stage.memoize else None
+            if entry is not None and entry.get("kind") == "stage":
+                value = entry["value"]
+                outputs[name] = stage.decode(value) if stage.decode is not None else value
+                digests[name] = entry["digest"]
+                records.append(StageRecord(name, "hit", key))
+                continue
+            output = stage.func({dep: outputs[dep] for dep in stage.deps})
+            outputs[name] = output
+            if stage.encode is not None:
+                value = stage.encode(output)
+            else:
+                value = output if stage.memoize else None
+            # Writers without an encoding have no content to digest and inherit their key.
+            digests[name] = CacheStore.make_key({"value": value}) if value is not None else key
+            if stage.memoize:
+                self.cache.save_json(
+                    key, {"kind": "stage", "stage": name, "digest": digests[name], "value": value}
+                )
+            records.append(StageRecord(name, "miss" if stage.memoize else "run", key))
+            LOGGER.info(
+                "Stage complete",
+                extra={"context": {"stage": name, "memoized": stage.memoize}},
+            )
+        return outputs, records
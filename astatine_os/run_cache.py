@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Run-level memoization of analysis output artifacts."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from astatine_os.data.cache import CacheStore
+from astatine_os.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+def _link_or_copy(src: str | Path, dst: str | Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+def _iter_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return [item for item in path.rglob("*") if item.is_file()]
+    return [path] if path.is_file() else []
+
+
+class RunCache:
+    """Stores the artifacts of completed runs under their input hash.
+
+    Artifacts are copied into ``<cache_dir>/runs/<key>`` when a run finishes
+    and hard-linked back into the output directory on a hit, falling back to
+    copies across filesystems. A manifest in the ``CacheStore`` is written
+    last, so an interrupted store is never treated as a hit.
+    """
+
+    def __init__(self, cache: CacheStore) -> None:
+        self.cache = cache
+        self.runs_dir = cache.root_dir / "runs"
+
+    def restore(self, key: str, out_dir: Path) -> dict[str, Any] | None:
+        """Link the artifacts of run ``key`` into ``out_dir``; ``None`` on a miss."""
+        manifest = self.cache.load_json(key)
+        if manifest is None or manifest.get("kind") != "analysis_run":
+            return None
+        source = self.runs_dir / key
+        artifacts = list(manifest["artifacts"])
+        if not all((source / name).exists() for name in artifacts):
+            LOGGER.warning(
+                "Run cache entry is incomplete; recomputing.",
+                extra={"context": {"key": key}},
+            )
+            return None
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name in artifacts:
+            target = out_dir / name
+            _remove(target)
+            if (source / name).is_dir():
+                shutil.copytree(source / name, target, copy_function=_link_or_copy)
+            else:
+                _link_or_copy(source / name, target)
+        return manifest
+
+    def store(
+        self, key: str, out_dir: Path, artifacts: list[str], result: dict[str, str | None]
+    ) -> None:
+        """Copy ``artifacts`` (paths relative to ``out_dir``) into the cache under ``key``.
+
+        ``result`` maps ``AnalysisResult`` fields to artifact names so a hit
+        can rebuild the result without reading any artifact.
+        """
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.runs_dir))
+        try:
+            for name in artifacts:
+                src = out_dir / name
+                dst = staging / name
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                if src.is_dir():
+                    shutil.copytree(src, dst)
+                else:
+                    shutil.copy2(src, dst)
+            target = self.runs_dir / key
+            _remove(target)
+            os.replace(staging, target)
+        except OSError as exc:
+            shutil.rmtree(staging, ignore_errors=True)
+            LOGGER.warning(
+                "Failed to store run artifacts in the cache.",
+                extra={"context": {"key": key, "error": str(exc)}},
+            )
+            return
+        self.cache.save_json(
+            key, {"kind": "analysis_run", "artifacts": artifacts, "result": result}
+        )
+
+    @staticmethod
+    def detach(out_dir: Path, artifacts: list[str]) -> None:
+        """Unlink hard-linked artifacts so rewriting them cannot modify the cache."""
+        for name in artifacts:
+            for path in _iter_files(out_dir / name):
+                if path.stat().st_nlink > 1:
+                    path.unlink()
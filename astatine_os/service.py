@@ -0,0 +1,357 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Long-running local analysis service with warm workers and a bounded job queue."""
+
+from __future__ import annotations
+
+import json
+import queue
+import socketserver
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from astatine_os.data.cache import CacheStore
+from astatine_os.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+Runner = Callable[..., Any]
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the job queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """One queued analysis request and its outcome."""
+
+    job_id: str
+    request: dict[str, Any]
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cached: bool = False
+
+    def describe(self) -> dict[str, Any]:
+        """JSON-serializable status for polling clients."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "cached": self.cached,
+            "request": self.request,
+            "queued_s": (self.started_at or time.time()) - self.submitted_at,
+            "run_s": (
+                (self.finished_at or time.time()) - self.started_at
+                if self.started_at is not None
+                else None
+            ),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+def _result_paths(result: Any) -> dict[str, Any]:
+    return {
+        name: str(value) if isinstance(value, Path) else value
+        for name, value in vars(result).items()
+        if name != "stages"
+    }
+
+
+class EndpointMetrics:
+    """Request counts, errors and recent latencies per endpoint."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._counts: dict[str, int] = defaultdict(int)
+        self._errors: dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        """Record one request."""
+        with self._lock:
+            self._latencies[endpoint].append(seconds)
+            self._counts[endpoint] += 1
+            if not ok:
+                self._errors[endpoint] += 1
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Latency percentiles in milliseconds over the recent window."""
+        with self._lock:
+            result = {}
+            for endpoint, values in self._latencies.items():
+                ms = np.asarray(values, dtype="float64") * 1000.0
+                result[endpoint] = {
+                    "count": float(self._counts[endpoint]),
+                    "errors": float(self._errors[endpoint]),
+                    "mean_ms": float(ms.mean()),
+                    "p50_ms": float(np.percentile(ms, 50)),
+                    "p95_ms": float(np.percentile(ms, 95)),
+                }
+            return result
+
+
+class AnalysisService:
+    """Runs analysis requests on persistent worker threads from a bounded queue.
+
+    Workers share the process, so provider sets, the module-level Dask
+    cluster (``reuse_dask_cluster``) and the in-memory layer of the cache
+    (``memory_cache_mb``) holding stage features and predictions stay warm
+    across requests. Finished requests are kept in an LRU keyed by their
+    parameters, so repeating a request returns the earlier job immediately.
+    At most ``result_cache_size`` finished jobs stay pollable; the least
+    recently used ones are evicted from both the LRU and the job table.
+    """
+
+    def __init__(
+        self,
+        out_dir: str | Path,
+        config_overrides: dict[str, Any] | None = None,
+        workers: int = 2,
+        queue_size: int = 64,
+        result_cache_size: int = 256,
+        runner: Runner | None = None,
+    ) -> None:
+        if runner is None:
+            from astatine_os.api import analyze_microclimate
+
+            runner = analyze_microclimate
+        self.out_dir = Path(out_dir)
+        self.config_overrides = {
+            "reuse_dask_cluster": True,
+            "memory_cache_mb": 256,
+            **(config_overrides or {}),
+        }
+        self.runner = runner
+        self.metrics = EndpointMetrics()
+        self.started_at = time.time()
+        self._queue: queue.Queue[Job | None] = queue.Queue(maxsize=queue_size)
+        self._jobs: dict[str, Job] = {}
+        self._completed: dict[str, str] = {}
+        self._finished_jobs: OrderedDict[str, str] = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._lock = threading.Lock()
+        self._finished = 0
+        self._workers = [
+            threading.Thread(target=self._work, name=f"astatine-worker-{idx}", daemon=True)
+            for idx in range(workers)
+        ]
+        for thread in self._workers:
+            thread.start()
+
+    @staticmethod
+    def _request_key(request: dict[str, Any]) -> str:
+        return CacheStore.make_key(request)
+
+    def submit(self, request: dict[str, Any]) -> Job:
+        """Queue a request, or return the finished job of an identical one."""
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object.")
+        if not request.get("place"):
+            raise ValueError("Request needs a 'place'.")
+        overrides = request.get("config_overrides") or {}
+        if not isinstance(overrides, dict):
+            raise ValueError("'config_overrides' must be a JSON object.")
+        request = {
+            "place": request["place"],
+            "start": request.get("start", "2025-07-01"),
+            "end": request.get("end", "2025-07-31"),
+            "config_overrides": overrides,
+            "force": bool(request.get("force", False)),
+        }
+        key = self._request_key({**request, "force": False})
+        with self._lock:
+            previous = self._completed.get(key)
+            if previous is not None and not request["force"]:
+                self._finished_jobs.move_to_end(previous)
+                return self._jobs[previous]
+            job = Job(job_id=uuid.uuid4().hex[:12], request=request)
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full as exc:
+                raise QueueFullError("The job queue is full; retry later.") from exc
+            self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Return a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.status = "running"
+            job.started_at = time.time()
+            request = job.request
+            try:
+                result = self.runner(
+                    request["place"],
+                    start=request["start"],
+                    end=request["end"],
+                    out_dir=self.out_dir / job.job_id,
+                    config_overrides={**self.config_overrides, **request["config_overrides"]},
+                    force=request["force"],
+                )
+                job.result = _result_paths(result)
+                job.cached = any(
+                    record.name == "run_cache" for record in getattr(result, "stages", [])
+                )
+                job.status = "done"
+            except Exception as exc:
+                LOGGER.warning(
+                    "Analysis job failed.",
+                    extra={"context": {"job_id": job.job_id, "error": str(exc)}},
+                )
+                job.error = str(exc)
+                job.status = "failed"
+            finally:
+                job.finished_at = time.time()
+            key = self._request_key({**request, "force": False})
+            with self._lock:
+                self._finished += 1
+                if job.status == "done":
+                    self._completed[key] = job.job_id
+                self._finished_jobs[job.job_id] = key
+                while len(self._finished_jobs) > self._result_cache_size:
+                    evicted, evicted_key = self._finished_jobs.popitem(last=False)
+                    del self._jobs[evicted]
+                    if self._completed.get(evicted_key) == evicted:
+                        del self._completed[evicted_key]
+
+    def status(self) -> dict[str, Any]:
+        """Queue depth, job throughput and endpoint latencies."""
+        uptime = time.time() - self.started_at
+        with self._lock:
+            finished = self._finished
+            running = sum(job.status == "running" for job in self._jobs.values())
+        return {
+            "uptime_s": uptime,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "running": running,
+            "finished": finished,
+            "jobs_per_second": finished / uptime if uptime > 0 else 0.0,
+            "endpoints": self.metrics.snapshot(),
+        }
+
+    def close(self) -> None:
+        """Stop the workers after the jobs already queued."""
+        for _ in self._workers:
+            self._queue.put(None)
+        for thread in self._workers:
+            thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "astatine-os"
+    server: AnalysisHTTPServer | _UnixAnalysisServer
+
+    @property
+    def service(self) -> AnalysisService:
+        return self.server.service
+
+    def log_message(self, format: str, *args: Any) -> None:
+        LOGGER.debug("HTTP request", extra={"context": {"line": format % args}})
+
+    def _send(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, method: str) -> tuple[str, int, dict[str, Any]]:
+        parts = [part for part in self.path.split("?")[0].split("/") if part]
+        if method == "GET" and parts == ["health"]:
+            return "GET /health", 200, {"status": "ok"}
+        if method == "GET" and parts == ["metrics"]:
+            return "GET /metrics", 200, self.service.status()
+        if method == "GET" and len(parts) == 2 and parts[0] == "jobs":
+            job = self.service.get(parts[1])
+            if job is None:
+                return "GET /jobs/{id}", 404, {"error": "unknown job"}
+            return "GET /jobs/{id}", 200, job.describe()
+        if method == "POST" and parts == ["jobs"]:
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length < 0:
+                    raise ValueError("Content-Length must not be negative.")
+                request = json.loads(self.rfile.read(length) or b"{}")
+                job = self.service.submit(request)
+            except QueueFullError as exc:
+                return "POST /jobs", 503, {"error": str(exc)}
+            except (ValueError, TypeError) as exc:
+                return "POST /jobs", 400, {"error": str(exc)}
+            return "POST /jobs", 200 if job.status == "done" else 202, job.describe()
+        return f"{method} other", 404, {"error": "not found"}
+
+    def _handle(self, method: str) -> None:
+        started = time.perf_counter()
+        endpoint, status, payload = self._route(method)
+        self._send(status, payload)
+        self.service.metrics.record(endpoint, time.perf_counter() - started, status < 400)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._handle("POST")
+
+
+class AnalysisHTTPServer(ThreadingHTTPServer):
+    """Threaded TCP server that hands requests to an ``AnalysisService``."""
+
+    def __init__(self, host: str, port: int, service: AnalysisService) -> None:
+        super().__init__((host, port), _Handler)
+        self.service = service
+        self.url = f"http://{host}:{self.server_port}"
+
+
+class _UnixAnalysisServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, service: AnalysisService) -> None:
+        super().__init__(str(path), _Handler)
+        self.service = service
+        self.url = str(path)
+
+    def get_request(self) -> tuple[Any, Any]:
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address.
+        return request, ("unix", 0)
+
+
+def make_server(
+    service: AnalysisService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: str | Path | None = None,
+) -> AnalysisHTTPServer | _UnixAnalysisServer:
+    """Bind an HTTP server for ``service`` on TCP or, with ``unix_socket``, a Unix socket.
+
+    The returned server's ``url`` is where clients reach it: the base URL,
+    with the bound port when ``port`` is 0, or the socket path.
+    """
+    if unix_socket is None:
+        return AnalysisHTTPServer(host, port, service)
+    path = Path(unix_socket)
+    path.unlink(missing_ok=True)
+    return _UnixAnalysisServer(path, service)
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Benchmark GeoJSON output bytes and seconds per 100k tiles for each layer layout."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from pathlib import Path
+
+import numpy as np
+from shapely.geometry import box, mapping
+
+from astatine_os.data.io_vector import GeoJSONStreamWriter, encode_geometries
+
+
+def _synthetic_tiles(count: int, seed: int) -> tuple[list[object], np.ndarray, np.ndarray]:
+    """50 m lattice cells around Istanbul with random attributes."""
+    side = int(np.ceil(np.sqrt(count)))
+    step = 50.0 / 111_320.0
+    geoms = [
+        box(
+            28.9 + (idx % side) * step,
+            41.0 + (idx // side) * step,
+            28.9 + (idx % side + 1) * step,
+            41.0 + (idx // side + 1) * step,
+        )
+        for idx in range(count)
+    ]
+    rng = np.random.default_rng(seed)
+    return geoms, rng.normal(0.5, 1.0, count), rng.uniform(0.0, 1.0, count)
+
+
+def _legacy(out: Path, geoms: list[object], temp: np.ndarray, vent: np.ndarray) -> None:
+    """Previous writer: ``mapping`` per layer and stdlib ``json.dumps`` per feature."""
+    for name, key, values in (
+        ("temperature_anomaly", "temperature_anomaly_c", temp),
+        ("ventilation_score", "ventilation_score", vent),
+    ):
+        with (out / f"{name}.geojson").open("w", encoding="utf-8") as handle:
+            handle.write('{"type": "FeatureCollection", "features": [\n')
+            for idx, geom in enumerate(geoms):
+                if idx:
+                    handle.write(",\n")
+                feature = {
+                    "type": "Feature",
+                    "geometry": mapping(geom),
+                    "properties": {"tile_id": f"t{idx}", key: float(values[idx])},
+                }
+                handle.write(json.dumps(feature))
+            handle.write("\n]}\n")
+
+
+def _layout(name: str, precision: int | None) -> Callable[..., None]:
+    def run(out: Path, geoms: list[object], temp: np.ndarray, vent: np.ndarray) -> None:
+        encoded = encode_geometries(geoms, precision)
+        if name == "combined":
+            with GeoJSONStreamWriter(out / "predictions.geojson") as combined:
+                for idx, geometry in enumerate(encoded):
+                    combined.write_encoded(
+                        geometry,
+                        {
+                            "tile_id": f"t{idx}",
+                            "temperature_anomaly_c": temp[idx],
+                            "ventilation_score": vent[idx],
+                        },
+                    )
+            return
+        with ExitStack() as stack:
+            temperature = stack.enter_context(
+                GeoJSONStreamWriter(out / "temperature_anomaly.geojson")
+            )
+            ventilation = stack.enter_context(
+                GeoJSONStreamWriter(out / "ventilation_score.geojson")
+            )
+            shared = (
+                stack.enter_context(GeoJSONStreamWriter(out / "tiles.geojson"))
+                if name == "shared"
+                else None
+            )
+            for idx, geometry in enumerate(encoded):
+                tile_id = f"t{idx}"
+                if shared is not None:
+                    shared.write_encoded(geometry, {"tile_id": tile_id})
+                layer_geometry = None if shared is not None else geometry
+                temperature.write_encoded(
+                    layer_geometry, {"tile_id": tile_id, "temperature_anomaly_c": temp[idx]}
+                )
+                ventilation.write_encoded(
+                    layer_geometry, {"tile_id": tile_id, "ventilation_score": vent[idx]}
+                )
+
+    return run
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tiles", type=int, default=100_000)
+    parser.add_argument("--precision", type=int, default=7)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    geoms, temp, vent = _synthetic_tiles(args.tiles, seed=42)
+    runs = {
+        "legacy": _legacy,
+        "layers": _layout("layers", args.precision),
+        "shared": _layout("shared", args.precision),
+        "combined": _layout("combined", args.precision),
+    }
+    scale = 100_000 / args.tiles
+    print(f"tiles: {args.tiles}, precision: {args.precision} decimals")
+    for label, run in runs.items():
+        best = float("inf")
+        size = 0
+        for _ in range(args.repeats):
+            with tempfile.TemporaryDirectory() as tmp:
+                out = Path(tmp)
+                start = time.perf_counter()
+                run(out, geoms, temp, vent)
+                best = min(best, time.perf_counter() - start)
+                size = sum(path.stat().st_size for path in out.iterdir())
+        print(f"{label}: {size * scale / 1e6:.1f} MB and {best * scale:.2f} s per 100k tiles")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
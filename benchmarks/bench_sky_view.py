@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Benchmark raster sky view factor throughput per square kilometre."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from astatine_os.features.sky_view import frontal_area_index, sky_view_factor
+
+
+def _synthetic_city(size_px: int, seed: int) -> np.ndarray:
+    """Block city with 40 m blocks, 20 m streets and 6 to 45 m buildings."""
+    rng = np.random.default_rng(seed)
+    heights = np.zeros((size_px, size_px), dtype="float32")
+    block, street = 40, 20
+    for y in range(0, size_px, block + street):
+        for x in range(0, size_px, block + street):
+            heights[y : y + block, x : x + block] = rng.uniform(6.0, 45.0)
+    return heights
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--km2", type=float, default=1.0, help="Square area to simulate.")
+    parser.add_argument("--resolution", type=float, default=2.0, help="Pixel size in meters.")
+    parser.add_argument("--azimuths", type=int, default=16)
+    parser.add_argument("--radius", type=float, default=100.0, help="Horizon radius in meters.")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--scheduler", default="threads", choices=["threads", "processes", "sync"])
+    parser.add_argument("--numba", action="store_true")
+    args = parser.parse_args(argv)
+
+    size_px = int(round(np.sqrt(args.km2) * 1000.0 / args.resolution))
+    heights = _synthetic_city(size_px, seed=42)
+
+    if args.numba:
+        # Compile outside the timed region.
+        sky_view_factor(heights[:32, :32], args.resolution, args.azimuths, 10.0, use_numba=True)
+
+    start = time.perf_counter()
+    svf = sky_view_factor(
+        heights,
+        args.resolution,
+        n_azimuths=args.azimuths,
+        max_radius_m=args.radius,
+        chunk_size=args.chunk_size,
+        scheduler=args.scheduler,
+        use_numba=args.numba,
+    )
+    svf_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fai = frontal_area_index(heights, args.resolution)
+    fai_seconds = time.perf_counter() - start
+
+    print(f"grid: {size_px}x{size_px} px at {args.resolution} m ({args.km2} km2)")
+    print(
+        f"svf: {svf_seconds:.3f} s total, {svf_seconds / args.km2:.3f} s/km2, mean={svf.mean():.3f}"
+    )
+    print(
+        f"fai: {fai_seconds:.3f} s total, {fai_seconds / args.km2:.3f} s/km2, mean={fai.mean():.3f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Benchmark the per-tile cost of batched tile payloads against one tile per call."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+from typing import Any
+
+import dask
+from shapely.geometry import box
+
+from astatine_os.api import _tile_payload_batch
+from astatine_os.config import get_runtime_config
+from astatine_os.data.aoi import AOI
+from astatine_os.data.providers import ProviderSet, TimeRange
+from astatine_os.features.tiling import spatial_batches, tile_aoi
+
+
+def _tasks(tiles: list[Any], time_range: TimeRange, cfg: Any, batch_size: int) -> list[Any]:
+    """One task per batch of ``batch_size`` tiles; ``batch_size=1`` is one task per tile."""
+    shared_providers = dask.delayed(ProviderSet.from_config(cfg))
+    shared_cfg = dask.delayed(cfg)
+    return [
+        dask.delayed(_tile_payload_batch)(
+            [tiles[idx] for idx in batch], time_range, shared_providers, shared_cfg
+        )
+        for batch in spatial_batches(tiles, batch_size)
+    ]
+
+
+def _direct(tiles: list[Any], time_range: TimeRange, cfg: Any, batch_size: int) -> None:
+    providers = ProviderSet.from_config(cfg)
+    for batch in spatial_batches(tiles, batch_size):
+        _tile_payload_batch([tiles[idx] for idx in batch], time_range, providers, cfg)
+
+
+def _best(run: Any, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--km", type=float, default=1.5, help="Side of the square AOI.")
+    parser.add_argument("--tile-size", type=int, default=50, help="Tile size in meters.")
+    parser.add_argument("--resolution", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--scheduler", default="sync", choices=["threads", "processes", "sync"])
+    parser.add_argument("--raster-sky-view", action="store_true")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    side_deg = args.km * 1000.0 / 111_320.0
+    aoi = AOI(name="bench", geometry=box(24.9, 60.1, 24.9 + 2.0 * side_deg, 60.1 + side_deg))
+    tiles = tile_aoi(aoi, tile_size_m=args.tile_size)
+    cfg = get_runtime_config(
+        resolution_m=args.resolution,
+        tile_size_m=args.tile_size,
+        raster_sky_view=args.raster_sky_view,
+    )
+    time_range = TimeRange(start=date(2025, 7, 1), end=date(2025, 7, 31))
+
+    print(f"tiles: {len(tiles)} at {args.tile_size} m, scheduler={args.scheduler}")
+    for label, size in (("per-tile", 1), (f"batch={args.batch_size}", args.batch_size)):
+        direct = _best(lambda size=size: _direct(tiles, time_range, cfg, size), args.repeats)
+        graph = _best(
+            lambda size=size: dask.compute(
+                *_tasks(tiles, time_range, cfg, size), scheduler=args.scheduler
+            ),
+            args.repeats,
+        )
+        print(
+            f"{label}: direct {direct / len(tiles) * 1e3:.3f} ms/tile, "
+            f"dask {graph / len(tiles) * 1e3:.3f} ms/tile"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
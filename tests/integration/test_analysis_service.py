@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Integration test for the local analysis service."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+from astatine_os.service import AnalysisService, make_server
+
+
+def _call(base: str, path: str, payload: dict[str, Any] | None = None) -> tuple[int, Any]:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(base + path, data=data, method="POST" if data else "GET")
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.status, json.loads(response.read())
+
+
+def test_service_runs_polls_and_caches_jobs(tmp_path: Path) -> None:
+    service = AnalysisService(
+        tmp_path / "out",
+        config_overrides={
+            "cache_dir": str(tmp_path / "cache"),
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+        },
+        workers=1,
+    )
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = server.url
+    try:
+        request = {"place": "Istanbul_Besiktas", "start": "2025-07-01", "end": "2025-07-03"}
+        status, job = _call(base, "/jobs", request)
+        assert status == 202
+        deadline = time.time() + 120
+        while job["status"] in {"queued", "running"} and time.time() < deadline:
+            time.sleep(0.1)
+            _, job = _call(base, f"/jobs/{job['job_id']}")
+        assert job["status"] == "done", job
+        assert Path(job["result"]["temperature_geojson"]).exists()
+
+        status, repeat = _call(base, "/jobs", request)
+        assert status == 200
+        assert repeat["job_id"] == job["job_id"]
+
+        _, metrics = _call(base, "/metrics")
+        assert metrics["finished"] == 1
+        assert metrics["endpoints"]["POST /jobs"]["count"] == 2
+        assert metrics["endpoints"]["GET /jobs/{id}"]["p95_ms"] >= 0.0
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Integration test for batch analysis over overlapping AOIs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from shapely.geometry import box
+
+from astatine_os import api
+from astatine_os.data.aoi import AOI
+from astatine_os.data.io_summary import read_run_summary
+
+
+def test_analyze_many_fetches_shared_tiles_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    original = api._static_tile_inputs
+
+    def counting(tiles: Any, *args: Any, **kwargs: Any) -> Any:
+        calls.extend(tile.tile_id for tile in tiles)
+        return original(tiles, *args, **kwargs)
+
+    monkeypatch.setattr(api, "_static_tile_inputs", counting)
+    aois = [
+        AOI(name="district a", geometry=box(29.0, 41.0, 29.008, 41.006)),
+        AOI(name="district b", geometry=box(29.004, 41.0, 29.012, 41.006)),
+    ]
+    batch = api.analyze_many(
+        aois,
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "out",
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+        },
+    )
+
+    assert batch.unique_tiles < batch.requested_tiles
+    assert sorted(calls) == sorted(set(calls))
+    assert len(calls) == batch.unique_tiles
+    assert batch.tiles_per_second > 0
+    for name, slug in (("district a", "district_a"), ("district b", "district_b")):
+        result = batch.results[name]
+        assert result.output_dir == tmp_path / "out" / slug
+        summary, tiles = read_run_summary(result.output_dir)
+        assert summary["place"] == name
+        assert tiles.num_rows == summary["tiles"]["rows"] > 0
+
+
+def test_analyze_many_keeps_colliding_names_apart(tmp_path: Path) -> None:
+    geometry = box(29.0, 41.0, 29.004, 41.003)
+    batch = api.analyze_many(
+        [AOI(name="district a", geometry=geometry), AOI(name="district_a", geometry=geometry)],
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "out",
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+        },
+    )
+
+    dirs = {name: result.output_dir for name, result in batch.results.items()}
+    assert len(set(dirs.values())) == 2
+    for name, output_dir in dirs.items():
+        assert output_dir.parent == tmp_path / "out"
+        assert output_dir.name.startswith("district_a-")
+        assert read_run_summary(output_dir)[0]["place"] == name
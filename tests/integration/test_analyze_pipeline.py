@@ -7,8 +7,16 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
+import numpy as np
+import pytest
+
+from astatine_os import api
 from astatine_os.api import analyze_microclimate
+from astatine_os.data.io_summary import read_provider_metadata, read_run_summary
+from astatine_os.data.providers import Sentinel2Provider
+from astatine_os.data.shared_arrays import SharedArrayHandle, SharedArrayRegistry
 
 
 def test_analyze_microclimate_outputs(tmp_path: Path) -> None:
@@ -30,9 +38,188 @@ def test_analyze_microclimate_outputs(tmp_path: Path) -> None:
     assert result.cool_refuges_geojson.exists()
     assert result.report_markdown.exists()
 
-    summary_path = out_dir / "predictions_summary.json"
-    assert summary_path.exists()
-    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary, tiles = read_run_summary(out_dir)
     assert summary["place"] == "Istanbul_Besiktas"
-    assert len(summary["tile_features"]) > 0
-    assert len(summary["predictions"]) == len(summary["tile_features"])
+    assert summary["tiles"]["rows"] == tiles.num_rows > 0
+    assert {"tile_id", "ndvi", "temperature_anomaly_c", "sentinel_metadata_id"} <= set(
+        tiles.column_names
+    )
+    metadata = read_provider_metadata(out_dir)
+    assert len(metadata) == summary["provider_metadata"]["rows"]
+    providers = [name for name in tiles.column_names if name.endswith("_metadata_id")]
+    assert len(metadata) < tiles.num_rows * len(providers)
+    assert tiles.column("sentinel_seed").null_count == 0
+    assert set(tiles.column("sentinel_metadata_id").to_pylist()) <= set(metadata)
+
+
+def test_geojson_layouts_share_geometry(tmp_path: Path) -> None:
+    base = {
+        "cache_dir": tmp_path / "cache",
+        "use_dask_distributed": False,
+        "dask_scheduler": "sync",
+        "geojson_precision": 3,
+    }
+    shared = analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "shared",
+        config_overrides={**base, "geojson_layout": "shared"},
+    )
+    tiles = json.loads((tmp_path / "shared" / "tiles.geojson").read_text(encoding="utf-8"))
+    temperature = json.loads(shared.temperature_geojson.read_text(encoding="utf-8"))
+    assert [f["properties"]["tile_id"] for f in tiles["features"]] == [
+        f["properties"]["tile_id"] for f in temperature["features"]
+    ]
+    assert all(f["geometry"] is None for f in temperature["features"])
+    x, y = tiles["features"][0]["geometry"]["coordinates"][0][0]
+    assert round(x, 3) == x and round(y, 3) == y
+
+    combined = analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "combined",
+        config_overrides={**base, "geojson_layout": "combined"},
+    )
+    assert combined.temperature_geojson == combined.ventilation_geojson
+    layer = json.loads(combined.temperature_geojson.read_text(encoding="utf-8"))
+    properties = layer["features"][0]["properties"]
+    assert {"temperature_anomaly_c", "ventilation_score", "cool_refuge_rank"} <= set(properties)
+    assert [stage.status for stage in combined.stages if stage.name == "predictions"] == ["hit"]
+
+
+def test_vector_tiles_archive(tmp_path: Path) -> None:
+    result = analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "out",
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "threads",
+            "vector_tiles": True,
+            "vector_tile_min_zoom": 8,
+            "vector_tile_max_zoom": 14,
+        },
+    )
+    assert result.vector_tiles == tmp_path / "out" / "predictions.pmtiles"
+    header = result.vector_tiles.read_bytes()[:127]
+    assert header[:7] == b"PMTiles"
+    assert (header[100], header[101]) == (8, 14)
+
+
+def test_composite_with_fully_clouded_pixels_gives_finite_predictions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original = Sentinel2Provider.read_scene_window
+
+    def cloud_first_pixel(self: Sentinel2Provider, *args: Any) -> dict[str, np.ndarray]:
+        window = original(self, *args)
+        rows, cols = args[-2], args[-1]
+        if "SCL" in window and rows.start == 0 and cols.start == 0:
+            window["SCL"] = window["SCL"].copy()
+            window["SCL"][0, 0] = 9
+        return window
+
+    monkeypatch.setattr(Sentinel2Provider, "read_scene_window", cloud_first_pixel)
+    analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "out",
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+            "sentinel_composite": True,
+        },
+    )
+    _, tiles = read_run_summary(tmp_path / "out")
+    assert np.isfinite(tiles.column("temperature_anomaly_c").to_numpy()).all()
+    assert np.isfinite(tiles.column("ndvi").to_numpy()).all()
+
+
+def test_rasters_are_fetched_once_per_tile_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requests: list[tuple[float, ...]] = []
+    original = Sentinel2Provider.fetch
+
+    def counting(self: Sentinel2Provider, aoi: Any, *args: Any, **kwargs: Any) -> Any:
+        requests.append(aoi.bounds)
+        return original(self, aoi, *args, **kwargs)
+
+    monkeypatch.setattr(Sentinel2Provider, "fetch", counting)
+    analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "out",
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+            "tile_batch_size": 8,
+            "raster_sky_view": True,
+        },
+    )
+    _, tiles = read_run_summary(tmp_path / "out")
+    assert len(requests) == -(-tiles.num_rows // 8)
+    assert np.isfinite(tiles.column("ndvi").to_numpy()).all()
+    assert np.isfinite(tiles.column("sky_view_factor").to_numpy()).all()
+
+
+def test_process_backend_shares_mosaics_through_registry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    published: list[str] = []
+    shared_values: list[Any] = []
+    publish = SharedArrayRegistry.publish
+    iter_completed = api.iter_completed
+
+    def recording_publish(self: SharedArrayRegistry, key: str, array: Any) -> Any:
+        published.append(key)
+        return publish(self, key, array)
+
+    def recording_iter_completed(build: Any, shared: Any, cfg: Any) -> Any:
+        shared_values.extend(shared)
+        return iter_completed(build, shared, cfg)
+
+    monkeypatch.setattr(SharedArrayRegistry, "publish", recording_publish)
+    monkeypatch.setattr(api, "iter_completed", recording_iter_completed)
+    base = {
+        "cache_dir": tmp_path / "cache",
+        "use_dask_distributed": False,
+        "dask_workers": 2,
+        "tile_batch_size": 8,
+        "zonal_aggregation": True,
+        "raster_native": True,
+        "raster_sky_view": True,
+    }
+    processes = analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "processes",
+        config_overrides={**base, "dask_scheduler": "processes"},
+    )
+    assert processes.raster_maps is not None and processes.raster_maps.exists()
+    mosaics = [value for value in shared_values if isinstance(value, api._SurfaceMosaics)]
+    assert len(mosaics) == 1
+    assert all(isinstance(band, SharedArrayHandle) for band in mosaics[0].sentinel.values())
+    assert isinstance(mosaics[0].thermal, SharedArrayHandle)
+    assert {"B04", "B08", "B11"} <= set(published)
+
+    analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "sync",
+        config_overrides={**base, "cache_dir": tmp_path / "sync-cache", "dask_scheduler": "sync"},
+    )
+    _, expected = read_run_summary(tmp_path / "sync")
+    _, actual = read_run_summary(tmp_path / "processes")
+    for name in ("ndvi", "sky_view_factor", "temperature_anomaly_c"):
+        np.testing.assert_allclose(actual.column(name).to_numpy(), expected.column(name).to_numpy())
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Integration test for meteorology-only nowcast re-scoring."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from astatine_os.api import analyze_microclimate, start_nowcast
+from astatine_os.data.io_summary import read_run_summary
+from astatine_os.data.providers import TimeRange
+
+
+def test_nowcast_matches_full_inference_and_rescores(tmp_path: Path) -> None:
+    overrides = {
+        "cache_dir": tmp_path / "cache",
+        "use_dask_distributed": False,
+        "dask_scheduler": "sync",
+    }
+    analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / "full",
+        config_overrides=overrides,
+    )
+    _, tiles = read_run_summary(tmp_path / "full")
+    expected = {row["tile_id"]: row for row in tiles.to_pylist()}
+
+    session = start_nowcast(
+        "Istanbul_Besiktas", start="2025-07-01", end="2025-07-03", config_overrides=overrides
+    )
+    update = session.refresh(TimeRange(date(2025, 7, 1), date(2025, 7, 3)))
+    np.testing.assert_allclose(
+        update.temperature_anomaly_c,
+        [expected[tile_id]["temperature_anomaly_c"] for tile_id in update.tile_ids],
+        atol=1e-9,
+    )
+
+    hotter = session.update(air_temp_c=update.air_temp_c + 10.0, wind_m_s=update.wind_m_s)
+    np.testing.assert_allclose(
+        hotter.temperature_anomaly_c - update.temperature_anomaly_c, 0.3, atol=1e-9
+    )
+    np.testing.assert_array_equal(hotter.ventilation_score, update.ventilation_score)
+    layer = json.loads(session.write(hotter, tmp_path / "nowcast").read_text())
+    assert len(layer["features"]) == len(update.tile_ids)
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Integration test for the run-level result cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from astatine_os import api
+
+
+def _analyze(tmp_path: Path, out_name: str, **kwargs: Any) -> api.AnalysisResult:
+    return api.analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=tmp_path / out_name,
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+        },
+        **kwargs,
+    )
+
+
+def test_identical_run_is_restored_and_force_recomputes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = _analyze(tmp_path, "first")
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("tiles must not be recomputed on a run cache hit")
+
+    monkeypatch.setattr(api, "tile_aoi", fail)
+    restored = _analyze(tmp_path, "second")
+    assert restored.report_markdown == tmp_path / "second" / "report.md"
+    assert restored.temperature_geojson.read_bytes() == first.temperature_geojson.read_bytes()
+    assert (tmp_path / "second" / "predictions_summary.json").exists()
+
+    monkeypatch.undo()
+    forced = _analyze(tmp_path, "second", force=True)
+    statuses = {record.name: record.status for record in forced.stages}
+    assert statuses["tile_features"] == "hit"
+    assert statuses["predictions"] == "hit"
+    assert statuses["report"] == "run"
+    # Rewriting outputs after a hit must not touch the cached copies.
+    assert forced.temperature_geojson.stat().st_nlink == 1
+    assert _analyze(tmp_path, "third").temperature_geojson.read_bytes() == (
+        first.temperature_geojson.read_bytes()
+    )
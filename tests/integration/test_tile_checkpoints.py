@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Integration test for resumable analysis from per-tile checkpoints."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from astatine_os import api
+from astatine_os.data.io_summary import read_run_summary
+
+
+def _run(tmp_path: Path, out_name: str, **overrides: Any) -> dict[str, Any]:
+    out_dir = tmp_path / out_name
+    api.analyze_microclimate(
+        "Istanbul_Besiktas",
+        start="2025-07-01",
+        end="2025-07-03",
+        out_dir=out_dir,
+        config_overrides={
+            "cache_dir": tmp_path / "cache",
+            "use_dask_distributed": False,
+            "dask_scheduler": "sync",
+            **overrides,
+        },
+        force=True,
+    )
+    return read_run_summary(out_dir)[1].to_pydict()
+
+
+def test_rerun_only_schedules_batches_with_missing_tiles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = _run(tmp_path, "first", tile_batch_size=4)
+    entries = {
+        path: json.loads(path.read_text(encoding="utf-8"))
+        for path in (tmp_path / "cache").rglob("*.json")
+    }
+    checkpoints = [path for path, entry in entries.items() if "inputs" in entry]
+    assert len(checkpoints) == len(first["tile_id"])
+    # An interrupted run has some tile checkpoints but no stage outputs yet.
+    missing = entries[checkpoints[0]]["meta"]["tile_id"]
+    checkpoints[0].unlink()
+    for path, entry in entries.items():
+        if entry.get("kind") == "stage":
+            path.unlink()
+
+    calls: list[str] = []
+    original = api._static_tile_inputs
+
+    def counting(tiles: Any, *args: Any, **kwargs: Any) -> Any:
+        calls.extend(tile.tile_id for tile in tiles)
+        return original(tiles, *args, **kwargs)
+
+    monkeypatch.setattr(api, "_static_tile_inputs", counting)
+    second = _run(tmp_path, "second", tile_batch_size=4)
+    # The batch of the missing tile is recomputed whole, since canyon gaps span it.
+    assert missing in calls
+    assert len(calls) == 4
+    assert second == first
+
+
+def test_writer_settings_reuse_tile_checkpoints(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _run(tmp_path, "first")
+    for path in (tmp_path / "cache").rglob("*.json"):
+        if json.loads(path.read_text(encoding="utf-8")).get("kind") == "stage":
+            path.unlink()
+
+    calls: list[str] = []
+    original = api._static_tile_inputs
+
+    def counting(tiles: Any, *args: Any, **kwargs: Any) -> Any:
+        calls.extend(tile.tile_id for tile in tiles)
+        return original(tiles, *args, **kwargs)
+
+    monkeypatch.setattr(api, "_static_tile_inputs", counting)
+    _run(tmp_path, "second", geojson_precision=5, geojson_layout="combined")
+    assert calls == []
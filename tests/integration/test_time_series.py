@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Integration test for multi-window time-series analysis."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from astatine_os import api
+from astatine_os.data.providers import TimeRange
+
+
+def test_time_series_reuses_static_layers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import xarray as xr
+
+    static_calls: list[str] = []
+    original = api._static_tile_inputs
+
+    def counting(tiles: Any, *args: Any, **kwargs: Any) -> Any:
+        static_calls.extend(tile.tile_id for tile in tiles)
+        return original(tiles, *args, **kwargs)
+
+    monkeypatch.setattr(api, "_static_tile_inputs", counting)
+    windows = api.split_time_range(TimeRange(date(2025, 7, 1), date(2025, 7, 17)), 7)
+    assert [(w.start.day, w.end.day) for w in windows] == [(1, 7), (8, 14), (15, 17)]
+
+    result = api.analyze_time_series(
+        "Istanbul_Besiktas",
+        windows,
+        out_dir=tmp_path / "series",
+        config_overrides={"use_dask_distributed": False, "dask_scheduler": "sync"},
+    )
+
+    assert len(static_calls) == len(result.tile_ids)
+    cube = xr.open_zarr(result.cube_zarr)
+    assert cube["temperature_anomaly_c"].shape == (3, len(result.tile_ids))
+    density = cube["building_density"].values
+    np.testing.assert_array_equal(density, np.broadcast_to(density[0], density.shape))
+    assert not np.allclose(cube["meteo_air_temp_c"].values[0], cube["meteo_air_temp_c"].values[1])
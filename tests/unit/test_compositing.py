@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for streaming cloud-masked compositing."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+
+import numpy as np
+from shapely.geometry import box
+
+from astatine_os.data.aoi import AOI
+from astatine_os.data.compositing import HistogramAccumulator, composite_scenes
+from astatine_os.data.providers import Sentinel2Provider, TimeRange
+
+
+def test_histogram_percentiles_track_exact_values() -> None:
+    rng = np.random.default_rng(3)
+    stack = rng.uniform(0.05, 0.7, size=(12, 9, 11))
+    valid = rng.uniform(size=stack.shape) > 0.3
+    valid[:, 0, 0] = False
+    acc = HistogramAccumulator((9, 11), n_bins=256)
+    for scene, mask in zip(stack, valid, strict=True):
+        acc.add(scene, mask)
+
+    result = acc.percentiles([10.0, 50.0, 90.0])
+    expected = np.nanpercentile(np.where(valid, stack, np.nan), [10.0, 50.0, 90.0], axis=0)
+    assert np.isnan(result[:, 0, 0]).all()
+    finite = np.isfinite(expected)
+    # Interpolated ranks differ by at most one sample gap plus the bin width.
+    assert np.nanmedian(np.abs(result[finite] - expected[finite])) < 0.03
+    assert int(acc.valid.reshape(9, 11)[1, 1]) == int(valid[:, 1, 1].sum())
+
+
+def test_sentinel_composite_is_chunk_invariant_and_masks_clouds() -> None:
+    provider = Sentinel2Provider()
+    aoi = AOI(name="test", geometry=box(24.93, 60.16, 24.94, 60.17))
+    time_range = TimeRange(start=date(2025, 7, 1), end=date(2025, 7, 31))
+    scenes = provider.list_scenes(aoi, time_range)
+    assert len(scenes) == 7
+
+    whole = provider.read_scene_window(
+        aoi, scenes[0], 20, ["B04", "SCL"], slice(0, 30), slice(0, 30)
+    )
+    part = provider.read_scene_window(
+        aoi, scenes[0], 20, ["B04", "SCL"], slice(5, 17), slice(8, 30)
+    )
+    np.testing.assert_array_equal(part["B04"], whole["B04"][5:17, 8:30])
+    np.testing.assert_array_equal(part["SCL"], whole["SCL"][5:17, 8:30])
+
+    chunked = provider.composite(aoi, time_range, 20, bands=["B04"], chunk_size=7)
+    single = provider.composite(aoi, time_range, 20, bands=["B04"], chunk_size=64)
+    np.testing.assert_array_equal(chunked.arrays["B04"], single.arrays["B04"])
+    covered = chunked.arrays["valid_count"] > 0
+    assert covered.any()
+    assert np.nanmax(chunked.arrays["B04"][covered]) <= 0.71
+    assert chunked.metadata["scene_ids"] == [scene["id"] for scene in scenes]
+
+
+def test_composite_fills_pixels_masked_in_every_scene() -> None:
+    rng = np.random.default_rng(5)
+    stack = rng.uniform(0.05, 0.7, size=(4, 6, 6)).astype("float32")
+
+    def read_window(
+        scene: Any, names: Sequence[str], rows: slice, cols: slice
+    ) -> dict[str, np.ndarray]:
+        scl = np.full((6, 6), 4, dtype=np.uint8)
+        scl[2, 3] = 9
+        return {"B04": stack[scene][rows, cols], "SCL": scl[rows, cols]}
+
+    gaps = composite_scenes(read_window, range(4), (6, 6), ["B04"], chunk_size=4)
+    assert np.isnan(gaps["B04_p50"][2, 3])
+    filled = composite_scenes(read_window, range(4), (6, 6), ["B04"], chunk_size=4, fill_scene=1)
+    assert np.isfinite(filled["B04_p50"]).all()
+    assert filled["B04_p50"][2, 3] == stack[1, 2, 3]
+    assert filled["valid_count"][2, 3] == 0
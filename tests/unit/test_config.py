@@ -22,3 +22,11 @@ def test_config_expands_paths(tmp_path: Path) -> None:
     cfg = get_runtime_config(out_dir=tmp_path / "out")
     assert cfg.out_dir.exists() is False
     assert cfg.out_dir.is_absolute()
+
+
+def test_config_rejects_inverted_vector_tile_zooms() -> None:
+    with pytest.raises(ValidationError, match="vector_tile_min_zoom"):
+        get_runtime_config(vector_tile_min_zoom=14, vector_tile_max_zoom=12)
+    assert (
+        get_runtime_config(vector_tile_min_zoom=12, vector_tile_max_zoom=12).vector_tiles is False
+    )
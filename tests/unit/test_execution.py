@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for Dask execution backends."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import dask
+import pytest
+
+from astatine_os import execution
+from astatine_os.config import get_runtime_config
+from astatine_os.data.providers import worker_provider_set
+from astatine_os.execution import (
+    array_scheduler,
+    compute_tasks,
+    iter_completed,
+    shared_client,
+    shares_host_memory,
+    shutdown_shared_clients,
+)
+
+
+def _scaled(values: list[int], factor: Any) -> list[Any]:
+    return [dask.delayed(lambda v, f: v * f)(value, factor) for value in values]
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "threads"])
+def test_local_schedulers_share_arguments(scheduler: str) -> None:
+    cfg = get_runtime_config(use_dask_distributed=False, dask_scheduler=scheduler)
+    result = compute_tasks(lambda factor: _scaled([1, 2, 3], factor), [10], cfg)
+    assert result == [10, 20, 30]
+
+
+@pytest.mark.parametrize("distributed", [False, True])
+def test_iter_completed_yields_every_task_once(distributed: bool) -> None:
+    cfg = get_runtime_config(
+        use_dask_distributed=distributed, dask_workers=1, dask_scheduler="threads"
+    )
+    results = dict(iter_completed(lambda factor: _scaled([1, 2, 3, 4], factor), [3], cfg))
+    assert results == {0: 3, 1: 6, 2: 9, 3: 12}
+
+
+def test_shared_cluster_is_reused_across_calls() -> None:
+    cfg = get_runtime_config(dask_workers=1, reuse_dask_cluster=True)
+    try:
+        first = shared_client(cfg)
+        assert compute_tasks(lambda factor: _scaled([4], factor), [2], cfg) == [8]
+        assert shared_client(cfg) is first
+        assert first.status == "running"
+    finally:
+        shutdown_shared_clients()
+    assert first.status != "running"
+
+
+def test_worker_provider_set_is_built_once_per_process() -> None:
+    cfg = get_runtime_config()
+    assert worker_provider_set(cfg) is worker_provider_set(cfg)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"use_dask_distributed": False, "dask_scheduler": "processes"}, "processes"),
+        ({"use_dask_distributed": False, "dask_scheduler": "threads"}, "threads"),
+        ({"use_dask_distributed": True, "dask_processes": True}, "processes"),
+        ({"use_dask_distributed": True, "dask_processes": False}, "threads"),
+    ],
+)
+def test_array_scheduler_follows_the_task_backend(
+    overrides: dict[str, Any], expected: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = get_runtime_config(**overrides)
+    assert array_scheduler(cfg) == expected
+
+    class Daemon:
+        daemon = True
+
+    monkeypatch.setattr(execution.multiprocessing, "current_process", Daemon)
+    assert array_scheduler(cfg) == "threads"
+
+
+def test_external_scheduler_workers_do_not_share_host_memory() -> None:
+    assert shares_host_memory(get_runtime_config(use_dask_distributed=True))
+    assert not shares_host_memory(
+        get_runtime_config(use_dask_distributed=True, dask_scheduler_address="tcp://10.0.0.2:8786")
+    )
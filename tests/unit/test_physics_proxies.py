@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for vectorized physics proxies and feature tables."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from astatine_os.api import _assemble_tile_features
+from astatine_os.features.street_scene import (
+    summarize_street_scene,
+    summarize_street_scene_array,
+)
+from astatine_os.graph.physics_proxies import (
+    compute_physics_proxies,
+    compute_physics_proxies_array,
+)
+from astatine_os.graph.schemas import TILE_FEATURE_COLUMNS, TileFeatureTable
+
+
+def test_array_proxies_match_scalar_version() -> None:
+    density = np.array([0.1, 0.4, 0.8])
+    height = np.array([6.0, 15.0, 40.0])
+    width = np.array([1.0, 18.0, 12.0])
+    svf = np.array([np.nan, 0.7, np.nan])
+    arrays = compute_physics_proxies_array(density, height, width, 30.0, 0.3, 0.2, svf)
+    for idx in range(3):
+        scalar = compute_physics_proxies(
+            float(density[idx]),
+            float(height[idx]),
+            float(width[idx]),
+            30.0,
+            0.3,
+            0.2,
+            None if np.isnan(svf[idx]) else float(svf[idx]),
+        )
+        for name, value in scalar.items():
+            assert np.isclose(arrays[name][idx], value)
+
+
+def test_street_scene_array_matches_scalar_version() -> None:
+    rng = np.random.default_rng(0)
+    green, sky, facade = rng.uniform(size=(3, 5, 2, 2))
+    arrays = summarize_street_scene_array(green, sky, facade)
+    scalar = summarize_street_scene(green[3], sky[3], facade[3])
+    assert arrays["green_view_ratio"].shape == (5,)
+    assert np.isclose(arrays["street_sky_ratio"][3], scalar["street_sky_ratio"])
+
+
+def test_feature_table_round_trip() -> None:
+    table = TileFeatureTable.from_columns(
+        ["a", "b"], {name: [1.0, 2.0] for name in TILE_FEATURE_COLUMNS}
+    )
+    rows = table.to_features()
+    assert [row.tile_id for row in rows] == ["a", "b"]
+    assert TileFeatureTable.from_features(rows)["ndvi"].tolist() == [1.0, 2.0]
+
+
+def test_feature_table_accepts_uneven_street_samples() -> None:
+    scalars = (
+        "lon",
+        "lat",
+        "ndvi",
+        "ndbi",
+        "albedo",
+        "building_density",
+        "mean_building_height_m",
+        "orientation_deg",
+        "meteo_air_temp_c",
+        "meteo_wind_m_s",
+        "street_width_m",
+        "sky_view_factor",
+    )
+    tiles = [
+        {
+            "tile_id": f"t{count}",
+            **dict.fromkeys(scalars, 0.5),
+            "street_arrays": {
+                "green_view_ratio": np.full(count, 0.2),
+                "sky_view_ratio": np.full(count, 0.4),
+                "facade_ratio": np.full(count, 0.4),
+            },
+        }
+        for count in (3, 7)
+    ]
+    table = _assemble_tile_features(tiles)
+    assert np.isclose(table["green_view_ratio"], 0.2).all()
+    assert np.isclose(table["street_sky_ratio"], 0.4).all()
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for the memoized stage pipeline."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from astatine_os.data.cache import CacheStore
+from astatine_os.pipeline import Stage, StagePipeline
+
+
+def _stages(calls: list[str], scale: int, offset: int) -> list[Stage]:
+    def source(inputs: dict[str, Any]) -> list[int]:
+        calls.append("source")
+        return [1, 2, 3]
+
+    def scaled(inputs: dict[str, Any]) -> list[int]:
+        calls.append("scaled")
+        # Only the parity of ``scale`` matters, so 2 and 4 give equal outputs.
+        return [value * (scale % 2 + 1) for value in inputs["source"]]
+
+    def total(inputs: dict[str, Any]) -> int:
+        calls.append("total")
+        return sum(inputs["scaled"]) + offset
+
+    return [
+        Stage("total", total, deps=("scaled",), params={"offset": offset}),
+        Stage("scaled", scaled, deps=("source",), params={"scale": scale}),
+        Stage("source", source),
+    ]
+
+
+def test_only_invalidated_stages_recompute(tmp_path: Path) -> None:
+    cache = CacheStore(tmp_path)
+    calls: list[str] = []
+    outputs, records = StagePipeline(_stages(calls, 2, 0), cache).run()
+    assert outputs["total"] == 6
+    assert [record.status for record in records] == ["miss", "miss", "miss"]
+
+    calls.clear()
+    outputs, records = StagePipeline(_stages(calls, 2, 10), cache).run()
+    assert outputs["total"] == 16
+    assert calls == ["total"]
+    assert {record.name: record.status for record in records}["scaled"] == "hit"
+
+    # An upstream change that reproduces the same output cuts off downstream work.
+    calls.clear()
+    StagePipeline(_stages(calls, 4, 10), cache).run()
+    assert calls == ["scaled"]
+
+
+def test_unknown_dependency_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="unknown stages"):
+        StagePipeline([Stage("a", lambda inputs: 1, deps=("b",))], CacheStore(tmp_path))
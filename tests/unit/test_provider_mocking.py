@@ -48,3 +48,14 @@ def test_provider_contract() -> None:
     payload = provider.fetch(aoi, TimeRange(start=date(2025, 1, 1), end=date(2025, 1, 2)), 10)
     assert payload.source == "mock"
     assert provider.attribution() == "mock-attribution"
+
+
+def test_default_fetch_summary_reduces_arrays() -> None:
+    provider = MockProvider()
+    aoi = AOI(name="test", geometry=box(0.0, 0.0, 1.0, 1.0))
+    payload = provider.fetch_summary(
+        aoi, TimeRange(start=date(2025, 1, 1), end=date(2025, 1, 2)), 10
+    )
+    assert payload.arrays == {}
+    assert payload.summaries == {"x": {"mean": 1.0}}
+    assert payload.metadata["reduction"]["stats"] == ["mean"]
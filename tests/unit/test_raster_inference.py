@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for pixel-resolution microclimate maps."""
+
+from __future__ import annotations
+
+import warnings
+from pathlib import Path
+
+import dask.array as da
+import networkx as nx
+import numpy as np
+from shapely.geometry import box
+
+from astatine_os.data.grid import RasterGrid
+from astatine_os.features.zonal import tile_label_raster, tile_label_raster_dask
+from astatine_os.graph.schemas import TILE_FEATURE_COLUMNS, TileFeatureTable
+from astatine_os.models.inference import InferenceEngine
+from astatine_os.models.raster_inference import graph_degree, microclimate_rasters
+
+
+def test_chunked_labels_match_eager_labels() -> None:
+    grid = RasterGrid(0.0, 0.0, 3.0, 2.0, width=30, height=20)
+    tiles = [box(0.0, 0.0, 1.5, 2.0), box(1.5, 0.0, 2.6, 1.0)]
+    eager = tile_label_raster(tiles, grid)
+    lazy = tile_label_raster_dask(tiles, grid, chunk_size=7).compute()
+    assert np.array_equal(eager, lazy)
+
+
+def test_uniform_pixels_reproduce_tile_predictions() -> None:
+    grid = RasterGrid(0.0, 0.0, 2.0, 1.0, width=20, height=10)
+    tiles = [box(0.0, 0.0, 1.0, 1.0), box(1.0, 0.0, 2.0, 1.0)]
+    columns = {name: [0.3, 0.6] for name in TILE_FEATURE_COLUMNS}
+    table = TileFeatureTable.from_columns(["a", "b"], columns)
+    graph = nx.Graph()
+    graph.add_edge("a", "b")
+    labels = tile_label_raster_dask(tiles, grid, chunk_size=8)
+    ndvi = da.from_array(np.where(np.arange(20) < 10, 0.3, 0.6)[None, :].repeat(10, 0), chunks=8)
+    layers = microclimate_rasters(
+        ndvi, ndvi, labels, table, graph_degree(graph, table.tile_id.tolist())
+    )
+    preds = InferenceEngine().predict(graph, table.to_features())
+    temp = layers["temperature_anomaly_c"].compute()
+    vent = layers["ventilation_score"].compute()
+    assert np.allclose(temp[:, 0], preds[0].temperature_anomaly_c, atol=1e-5)
+    assert np.allclose(vent[:, -1], preds[1].ventilation_score, atol=1e-5)
+
+
+def test_prediction_raster_is_georeferenced_on_tile_grid() -> None:
+    from astatine_os.api import _prediction_raster
+
+    step = 100.0 / 111_320.0
+    tiles = [
+        box(29.0, 41.0, 29.0 + step, 41.0 + step),
+        box(29.0 + step, 41.0, 29.0 + 2 * step, 41.0 + step),
+    ]
+    raster, grid = _prediction_raster(tiles, np.array([1.5, -0.5]), 10.0, chunk_px=4)
+    assert grid.bounds == (29.0, 41.0, 29.0 + 2 * step, 41.0 + step)
+    assert grid.transform[2] == 29.0 and grid.transform[5] == 41.0 + step
+    assert raster.chunks[0][0] == 4
+    values = raster.compute()
+    xs, _ = grid.pixel_centers()
+    assert np.all(values[:, xs < 29.0 + step] == np.float32(1.5))
+    assert np.all(values[:, xs > 29.0 + step] == np.float32(-0.5))
+
+
+def test_overview_levels_follow_raster_size() -> None:
+    from astatine_os.data.io_raster import overview_factors
+
+    assert overview_factors((100, 120)) == []
+    assert overview_factors((300, 1000)) == [2, 4]
+
+
+def test_raster_zarr_is_consolidated_without_warnings(tmp_path: Path) -> None:
+    import xarray as xr
+
+    from astatine_os.data.io_raster import write_raster_zarr
+
+    grid = RasterGrid(29.0, 41.0, 29.01, 41.01, width=12, height=10)
+    layers = {"temperature_anomaly_c": da.ones(grid.shape, chunks=4, dtype="float32")}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        path = write_raster_zarr(tmp_path / "maps.zarr", layers, grid)
+    ds = xr.open_zarr(path, consolidated=True)
+    assert ds["temperature_anomaly_c"].shape == (10, 12)
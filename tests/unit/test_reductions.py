@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for provider-side reductions."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from astatine_os.data.aoi import AOI
+from astatine_os.data.providers import Reduction, Sentinel2Provider, TimeRange
+from astatine_os.features.spectral_indices import spectral_index_block, spectral_summary
+
+
+def test_blockwise_sentinel_summary_matches_full_fetch() -> None:
+    provider = Sentinel2Provider()
+    aoi = AOI(name="test", geometry=box(24.93, 60.16, 24.94, 60.17))
+    time_range = TimeRange(start=date(2025, 7, 1), end=date(2025, 7, 31))
+    reduction = Reduction(
+        stats=("mean", "std", "min", "max"),
+        quantiles=(10.0, 50.0),
+        transform=spectral_index_block,
+    )
+    summary = provider.fetch_summary(aoi, time_range, 10, reduction=reduction, block_pixels=500)
+    full = provider.fetch(aoi, time_range, 10)
+    expected = spectral_summary(
+        full.arrays["B04"],
+        full.arrays["B08"],
+        full.arrays["B11"],
+        std=True,
+        percentiles=(10.0, 50.0),
+        keep_arrays=("ndvi",),
+    )
+
+    assert summary.arrays == {}
+    assert summary.metadata["seed"] == full.metadata["seed"]
+    for name in ("ndvi", "ndbi", "albedo"):
+        assert summary.summaries[name]["mean"] == pytest.approx(expected.mean[name], abs=1e-6)
+        assert summary.summaries[name]["std"] == pytest.approx(expected.std[name], abs=1e-6)
+        for q in (10.0, 50.0):
+            assert summary.summaries[name][f"p{q:g}"] == pytest.approx(
+                expected.percentiles[name][q], abs=2.0 / reduction.n_bins
+            )
+    assert summary.summaries["ndvi"]["min"] == pytest.approx(
+        float(np.min(expected.arrays["ndvi"])), abs=1e-6
+    )
+
+
+def test_reduction_rejects_unknown_statistics() -> None:
+    with pytest.raises(ValueError):
+        Reduction(stats=("median",))
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for the service job queue and the cache memory layer."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+
+from astatine_os.data.cache import CacheStore
+from astatine_os.service import AnalysisService, QueueFullError, make_server
+
+
+def test_job_queue_is_bounded(tmp_path: Path) -> None:
+    release = threading.Event()
+
+    def runner(place: str, **kwargs: Any) -> SimpleNamespace:
+        release.wait(timeout=10)
+        return SimpleNamespace(output_dir=kwargs["out_dir"])
+
+    service = AnalysisService(tmp_path, workers=1, queue_size=1, runner=runner)
+    try:
+        first = service.submit({"place": "a"})
+        while first.status == "queued":
+            release.wait(timeout=0.01)
+        service.submit({"place": "b"})
+        with pytest.raises(QueueFullError):
+            service.submit({"place": "c"})
+    finally:
+        release.set()
+        service.close()
+    assert service.get(first.job_id).status == "done"  # type: ignore[union-attr]
+
+
+def test_finished_jobs_are_evicted_beyond_the_result_cache(tmp_path: Path) -> None:
+    def runner(place: str, **kwargs: Any) -> SimpleNamespace:
+        if place == "bad":
+            raise RuntimeError("no data")
+        return SimpleNamespace(output_dir=kwargs["out_dir"])
+
+    service = AnalysisService(tmp_path, workers=1, result_cache_size=2, runner=runner)
+    jobs = [service.submit({"place": place}) for place in ("a", "bad", "b", "c")]
+    service.close()
+    assert [service.get(job.job_id) for job in jobs[:2]] == [None, None]
+    assert [service.get(job.job_id) for job in jobs[2:]] == jobs[2:]
+    assert len(service._jobs) == 2
+    # An evicted result is computed again rather than served from the LRU.
+    assert service.submit({"place": "a"}).job_id != jobs[0].job_id
+
+
+def test_cache_memory_layer_serves_without_disk(tmp_path: Path) -> None:
+    store = CacheStore(tmp_path, memory_bytes=1024)
+    path = store.save_json("ab" * 32, {"value": 1})
+    path.unlink()
+    assert store.load_json("ab" * 32) == {"value": 1}
+    assert CacheStore(tmp_path).load_json("ab" * 32) is None
+
+
+@pytest.mark.parametrize(
+    ("body", "headers"),
+    [
+        (b"[1, 2]", {}),
+        (b'{"place": "a", "config_overrides": [1]}', {}),
+        (b"{}", {"Content-Length": "abc"}),
+        (b"{}", {"Content-Length": "-1"}),
+    ],
+)
+def test_bad_job_requests_get_400(tmp_path: Path, body: bytes, headers: dict[str, str]) -> None:
+    def runner(place: str, **kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(output_dir=kwargs["out_dir"])
+
+    service = AnalysisService(tmp_path, workers=1, runner=runner)
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    address = urlsplit(server.url)
+    connection = http.client.HTTPConnection(str(address.hostname), address.port, timeout=10)
+    try:
+        connection.putrequest("POST", "/jobs")
+        connection.putheader("Content-Length", headers.get("Content-Length", str(len(body))))
+        connection.endheaders(body)
+        response = connection.getresponse()
+        assert response.status == 400
+        assert "error" in json.loads(response.read())
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+        service.close()
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for the shared-memory array registry."""
+
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from astatine_os.data.shared_arrays import (
+    SharedArrayHandle,
+    SharedArrayRegistry,
+    shared_dask_array,
+)
+
+
+def _column_sums(handle: SharedArrayHandle) -> np.ndarray:
+    return np.asarray(handle.attach().sum(axis=0))
+
+
+def test_published_arrays_attach_in_worker_processes(tmp_path: Path) -> None:
+    mosaic = np.arange(48, dtype="float32").reshape(6, 8)
+    with SharedArrayRegistry(tmp_path) as registry:
+        handle = registry.publish("sentinel/B04", mosaic)
+        assert registry.publish("sentinel/B04", mosaic * 2) == handle
+        assert len(pickle.dumps(handle)) < 512
+
+        view = handle.attach()
+        np.testing.assert_array_equal(view, mosaic)
+        with pytest.raises(ValueError):
+            view[0, 0] = 1.0
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            sums = pool.submit(_column_sums, handle).result()
+        np.testing.assert_array_equal(sums, mosaic.sum(axis=0))
+        root = registry.root
+    assert not root.exists()
+
+
+def test_shared_dask_array_reads_blocks_from_the_handle(tmp_path: Path) -> None:
+    mosaic = np.arange(70, dtype="float32").reshape(7, 10)
+    with SharedArrayRegistry(tmp_path) as registry:
+        array = shared_dask_array(registry.publish("B08", mosaic), chunks=4)
+        assert array.chunks == ((4, 3), (4, 4, 2))
+        np.testing.assert_array_equal(array.compute(scheduler="processes"), mosaic)
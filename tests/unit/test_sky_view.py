@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for raster sky view factor and frontal area index."""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pytest
+from shapely.geometry import box, mapping
+
+from astatine_os.features import sky_view
+from astatine_os.features.sky_view import (
+    frontal_area_index,
+    raster_canyon_metrics,
+    raster_canyon_metrics_by_tile,
+    sky_view_factor,
+)
+
+
+def test_svf_is_one_on_open_ground_and_lower_in_canyons() -> None:
+    heights = np.zeros((40, 40), dtype="float32")
+    assert np.allclose(sky_view_factor(heights, 2.0, n_azimuths=8, max_radius_m=20.0), 1.0)
+
+    heights[:, 15:18] = 30.0
+    heights[:, 22:25] = 30.0
+    svf = sky_view_factor(heights, 2.0, n_azimuths=8, max_radius_m=20.0)
+    assert svf[20, 20] < 0.6
+    assert svf[20, 2] > svf[20, 20]
+
+
+def test_svf_chunked_matches_single_block() -> None:
+    rng = np.random.default_rng(3)
+    heights = (rng.uniform(0.0, 1.0, size=(64, 64)) > 0.7).astype("float32") * 20.0
+    whole = sky_view_factor(heights, 2.0, n_azimuths=8, max_radius_m=12.0, chunk_size=128)
+    chunked = sky_view_factor(
+        heights, 2.0, n_azimuths=8, max_radius_m=12.0, chunk_size=20, scheduler="sync"
+    )
+    assert np.allclose(whole, chunked, atol=1e-6)
+    shared = sky_view_factor(
+        heights,
+        2.0,
+        n_azimuths=8,
+        max_radius_m=12.0,
+        chunk_size=20,
+        scheduler="processes",
+        workers=2,
+    )
+    assert np.allclose(whole, shared, atol=1e-6)
+
+
+def test_frontal_area_index_depends_on_wind_direction() -> None:
+    heights = np.zeros((20, 20), dtype="float32")
+    heights[2:18, 9:11] = 10.0
+    fai = frontal_area_index(heights, 1.0, wind_directions_deg=(0.0, 90.0, 270.0))
+    assert fai[1] > 5.0 * fai[0]
+    assert np.isclose(fai[1], fai[2])
+
+
+def test_missing_numba_is_logged_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    warnings: list[str] = []
+    monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.setattr(sky_view.LOGGER, "warning", lambda msg, *a, **k: warnings.append(msg))
+    sky_view._numba_kernel.cache_clear()
+    heights = np.zeros((8, 8), dtype="float32")
+    try:
+        for _ in range(3):
+            sky_view_factor(heights, 2.0, n_azimuths=4, max_radius_m=4.0, use_numba=True)
+    finally:
+        sky_view._numba_kernel.cache_clear()
+    assert len(warnings) == 1
+
+
+def test_raster_metrics_by_tile_see_buildings_in_neighbouring_tiles() -> None:
+    deg = 1.0 / 111_320.0
+    left = box(0.0, 0.0, 40.0 * deg, 40.0 * deg)
+    right = box(40.0 * deg, 0.0, 80.0 * deg, 40.0 * deg)
+    tower = {
+        "type": "Feature",
+        "geometry": mapping(box(42.0 * deg, 0.0, 50.0 * deg, 40.0 * deg)),
+        "properties": {"height_m": 40.0},
+    }
+    bounds = (0.0, 0.0, 80.0 * deg, 40.0 * deg)
+    alone = raster_canyon_metrics([], left.bounds, resolution_m=2.0, n_azimuths=8)
+    by_tile = raster_canyon_metrics_by_tile(
+        [left, right], [tower], bounds, resolution_m=2.0, n_azimuths=8, max_radius_m=40.0
+    )
+    assert alone["sky_view_factor"] == pytest.approx(1.0)
+    assert by_tile[0]["sky_view_factor"] < 1.0
+    assert by_tile[0]["frontal_area_index"] == 0.0 < by_tile[1]["frontal_area_index"]
@@ -7,7 +7,12 @@ from __future__ import annotations
 
 import numpy as np
 
-from astatine_os.features.spectral_indices import compute_albedo_proxy, compute_ndbi, compute_ndvi
+from astatine_os.features.spectral_indices import (
+    compute_albedo_proxy,
+    compute_ndbi,
+    compute_ndvi,
+    spectral_summary,
+)
 
 
 def test_ndvi_shape_and_range() -> None:
@@ -32,3 +37,16 @@ def test_albedo_proxy_is_bounded() -> None:
     swir = np.array([[0.7]], dtype="float32")
     alb = compute_albedo_proxy(red, nir, swir)
     assert 0.0 <= float(alb[0, 0]) <= 1.0
+
+
+def test_fused_summary_matches_separate_indices() -> None:
+    rng = np.random.default_rng(1)
+    red, nir, swir = rng.uniform(0.05, 0.7, size=(3, 32, 32)).astype("float32")
+    summary = spectral_summary(red, nir, swir, std=True, percentiles=(50.0,), keep_arrays=("ndbi",))
+    ndvi = compute_ndvi(nir, red)
+    assert np.isclose(summary.mean["ndvi"], float(ndvi.mean(dtype="float64")))
+    assert np.isclose(summary.std["albedo"], float(compute_albedo_proxy(red, nir, swir).std()))
+    assert np.isclose(summary.percentiles["ndvi"][50.0], float(np.median(ndvi)))
+    assert set(summary.arrays) == {"ndbi"}
+    assert summary.arrays["ndbi"].dtype == np.float32
+    assert np.allclose(summary.arrays["ndbi"], compute_ndbi(swir, nir))
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for incremental GeoJSON, GeoParquet and Zarr writers and the run summary."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import shapely
+from shapely.geometry import box
+
+from astatine_os.data.io_summary import (
+    read_provider_metadata,
+    read_run_summary,
+    summary_rows,
+    write_run_summary,
+)
+from astatine_os.data.io_vector import (
+    GeoJSONStreamWriter,
+    GeoParquetStreamWriter,
+    encode_geometries,
+    write_geoparquet,
+)
+from astatine_os.data.io_zarr import TileZarrWriter, append_time_slices, tile_cube_encoding
+from astatine_os.graph.schemas import TILE_FEATURE_COLUMNS, GraphPrediction, TileFeatureTable
+
+
+def _feature(idx: int) -> dict[str, object]:
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [float(idx), 0.0]},
+        "properties": {"tile_id": f"t{idx}"},
+    }
+
+
+def test_geojson_stream_writes_valid_collections(tmp_path: Path) -> None:
+    with GeoJSONStreamWriter(tmp_path / "a.geojson") as writer:
+        for idx in range(3):
+            writer.write(_feature(idx))
+    collection = json.loads((tmp_path / "a.geojson").read_text(encoding="utf-8"))
+    assert collection["type"] == "FeatureCollection"
+    assert [f["properties"]["tile_id"] for f in collection["features"]] == ["t0", "t1", "t2"]
+
+    with GeoJSONStreamWriter(tmp_path / "empty.geojson"):
+        pass
+    assert json.loads((tmp_path / "empty.geojson").read_text(encoding="utf-8"))["features"] == []
+
+    with GeoJSONStreamWriter(tmp_path / "a.ndjson", newline_delimited=True) as writer:
+        writer.write(_feature(0))
+        writer.write(_feature(1))
+    lines = (tmp_path / "a.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["properties"]["tile_id"] for line in lines] == ["t0", "t1"]
+
+
+def test_encoded_geometries_are_rounded_and_reused(tmp_path: Path) -> None:
+    encoded = encode_geometries([box(0.123456, 1.0, 2.0, 3.987654)], precision=2)
+    with GeoJSONStreamWriter(tmp_path / "layer.geojson") as writer:
+        writer.write_encoded(encoded[0], {"tile_id": "t0", "value": np.float64(1.5)})
+        writer.write_encoded(None, {"tile_id": "t1", "value": float("nan")})
+    features = json.loads((tmp_path / "layer.geojson").read_text(encoding="utf-8"))["features"]
+    assert features[0]["geometry"]["coordinates"][0][0] == [2.0, 1.0]
+    assert max(c[1] for c in features[0]["geometry"]["coordinates"][0]) == 3.99
+    assert features[0]["properties"]["value"] == 1.5
+    assert features[1]["geometry"] is None
+    assert features[1]["properties"]["value"] is None
+
+
+def test_geoparquet_stream_writes_row_groups(tmp_path: Path) -> None:
+    schema = pa.schema([("tile_id", pa.string()), ("value", pa.float64())])
+    with GeoParquetStreamWriter(tmp_path / "p.parquet", schema, row_group_size=4) as writer:
+        for idx in (np.arange(0, 3), np.arange(3, 6), np.arange(6, 10)):
+            writer.write_batch(
+                [box(i, 0, i + 1, 1) for i in idx],
+                {"tile_id": [f"t{i}" for i in idx], "value": idx.astype("float64")},
+            )
+    parquet = pq.ParquetFile(tmp_path / "p.parquet")
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("value").to_pylist() == [float(i) for i in range(10)]
+    assert shapely.from_wkb(table.column("geometry").to_pylist()[2]).equals(box(2, 0, 3, 1))
+    geo = json.loads(table.schema.metadata[b"geo"])
+    column = geo["columns"]["geometry"]
+    assert geo["version"] == "1.1.0"
+    assert column["encoding"] == "WKB"
+    assert column["geometry_types"] == ["Polygon"]
+    assert column["bbox"] == [0.0, 0.0, 10.0, 1.0]
+    assert column["covering"]["bbox"]["xmin"] == ["bbox", "xmin"]
+
+
+def test_geoparquet_rows_follow_hilbert_curve(tmp_path: Path) -> None:
+    cells = [box(x, y, x + 1, y + 1) for y in range(16) for x in range(16)]
+    order = np.random.default_rng(0).permutation(len(cells))
+    write_geoparquet(
+        tmp_path / "h.parquet",
+        [cells[i] for i in order],
+        {"cell": order},
+        row_group_size=64,
+    )
+    parquet = pq.ParquetFile(tmp_path / "h.parquet")
+    assert parquet.metadata.num_row_groups == 4
+    for group in range(4):
+        stats = parquet.metadata.row_group(group)
+        xmin = stats.column(2).statistics
+        ymin = stats.column(3).statistics
+        # Each row group of a 16x16 lattice is one 8x8 quadrant.
+        assert xmin.max - xmin.min == 7
+        assert ymin.max - ymin.min == 7
+
+
+def test_tile_zarr_writer_appends_regions(tmp_path: Path) -> None:
+    import xarray as xr
+
+    with TileZarrWriter(
+        tmp_path / "tiles.zarr",
+        ["a", "b", "c"],
+        ["v"],
+        time=date(2025, 7, 1),
+        time_end=date(2025, 7, 3),
+        coords={"lon": np.array([1.0, 2.0, 3.0])},
+        tile_chunk=2,
+    ) as writer:
+        writer.append(["a", "b"], {"v": np.array([1.0, 2.0])})
+        writer.append(["c"], {"v": np.array([3.0])})
+        with pytest.raises(ValueError):
+            writer.append(["a"], {"v": np.array([0.0])})
+    ds = xr.open_zarr(tmp_path / "tiles.zarr", consolidated=True)
+    assert ds["tile"].values.tolist() == ["a", "b", "c"]
+    assert ds["v"].dims == ("time", "tile")
+    assert ds["v"].encoding["chunks"] == (1, 2)
+    np.testing.assert_array_equal(ds["v"].values, [[1.0, 2.0, 3.0]])
+    np.testing.assert_array_equal(ds["lon"].values, [1.0, 2.0, 3.0])
+
+
+def test_append_time_slices_extends_one_store(tmp_path: Path) -> None:
+    import xarray as xr
+
+    def run(day: int, value: float, end: int | None = None) -> Path:
+        path = tmp_path / f"run{day}-{end}.zarr"
+        time_end = date(2025, 7, end) if end is not None else None
+        with TileZarrWriter(
+            path, ["a", "b"], ["v"], time=date(2025, 7, day), time_end=time_end
+        ) as writer:
+            writer.append(["a", "b"], {"v": np.array([value, value])})
+        return path
+
+    store = tmp_path / "store.zarr"
+    append_time_slices(store, run(1, 1.0))
+    append_time_slices(store, run(8, 2.0))
+    append_time_slices(store, run(1, 3.0))
+    ds = xr.open_zarr(store, consolidated=True)
+    assert ds["time"].values.astype("datetime64[D]").tolist() == [
+        date(2025, 7, 1),
+        date(2025, 7, 8),
+    ]
+    np.testing.assert_array_equal(ds["v"].values, [[3.0, 3.0], [2.0, 2.0]])
+    with pytest.raises(ValueError, match="another end date"):
+        append_time_slices(store, run(1, 4.0, end=31))
+    np.testing.assert_array_equal(xr.open_zarr(store)["v"].values[0], [3.0, 3.0])
+
+    other = tmp_path / "other.zarr"
+    with TileZarrWriter(other, ["x"], ["v"], time=date(2025, 7, 15)) as writer:
+        writer.append(["x"], {"v": np.array([0.0])})
+    with pytest.raises(ValueError):
+        append_time_slices(store, other)
+
+
+def test_tile_cube_encoding_matches_zarr_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    import xarray as xr
+
+    from astatine_os.data import io_zarr
+
+    ds = xr.Dataset({"v": (("time", "tile"), np.zeros((1, 4))), "lon": ("tile", np.zeros(4))})
+    monkeypatch.setattr(io_zarr, "_zarr_major", lambda: 2)
+    legacy = tile_cube_encoding(ds, 2)
+    monkeypatch.setattr(io_zarr, "_zarr_major", lambda: 3)
+    current = tile_cube_encoding(ds, 2)
+    assert list(legacy) == list(current) == ["v"]
+    assert legacy["v"]["compressor"].cname == "zstd"
+    assert current["v"]["compressors"][0].cname.value == "zstd"
+
+
+def test_run_summary_dedups_provider_metadata(tmp_path: Path) -> None:
+    tile_ids = [f"t{idx}" for idx in range(4)]
+    table = TileFeatureTable.from_columns(
+        tile_ids, {name: np.arange(4.0) for name in TILE_FEATURE_COLUMNS}
+    )
+    predictions = [GraphPrediction(tile_id, 0.5 * idx, 0.1) for idx, tile_id in enumerate(tile_ids)]
+    metadata = [
+        {
+            "tile_id": tile_id,
+            "thermal_mean_k": 300.0 + idx,
+            "provider_metadata": {
+                "meteo": {"source": "era5"},
+                "street": {"seed": 2**64 - 1 - idx, "footprint_count": idx},
+                "sentinel": {"bands": ["B04"], "shape": [idx + 16, 16]},
+            },
+        }
+        for idx, tile_id in enumerate(tile_ids)
+    ]
+    paths = write_run_summary(tmp_path, {"place": "x"}, table, predictions[::-1], metadata)
+    assert [path.name for path in paths] == [
+        "predictions_summary.json",
+        "summary_tiles.arrow",
+        "provider_metadata.parquet",
+    ]
+    assert b"\n" not in paths[0].read_bytes()
+
+    manifest, tiles = read_run_summary(tmp_path)
+    assert manifest["place"] == "x"
+    assert manifest["provider_metadata"]["rows"] == 3 < len(tile_ids) * 3
+    assert tiles.column("thermal_mean_k").to_pylist() == [300.0, 301.0, 302.0, 303.0]
+    assert len(set(tiles.column("meteo_metadata_id").to_pylist())) == 1
+    assert tiles.column("street_seed")[3].as_py() == 2**64 - 4
+    assert tiles.column("street_footprint_count").to_pylist() == [0, 1, 2, 3]
+    assert tiles.column("sentinel_shape")[2].as_py() == [18, 16]
+    side = read_provider_metadata(tmp_path)
+    assert side[tiles.column("street_metadata_id")[3].as_py()] == {}
+    assert side[tiles.column("sentinel_metadata_id")[0].as_py()] == {"bands": ["B04"]}
+
+    features, rows = summary_rows(tiles)
+    assert features == table.to_features()
+    assert rows == predictions
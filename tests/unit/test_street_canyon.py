@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for street canyon geometry."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from shapely.geometry import LineString, box, mapping
+
+from astatine_os.features.street_canyon import (
+    DEFAULT_STREET_WIDTH_M,
+    canyon_geometry,
+    canyon_geometry_by_tile,
+)
+
+_DEG_PER_M = 1.0 / 111_320.0
+
+
+def _building(minx_m: float, width_m: float, height_m: float) -> dict[str, Any]:
+    geom = box(minx_m * _DEG_PER_M, 0.0, (minx_m + width_m) * _DEG_PER_M, 20.0 * _DEG_PER_M)
+    return {"type": "Feature", "geometry": mapping(geom), "properties": {"height_m": height_m}}
+
+
+def test_canyon_width_matches_footprint_gap() -> None:
+    buildings = [_building(0.0, 20.0, 12.0), _building(32.0, 20.0, 12.0)]
+    canyon = canyon_geometry(buildings)
+    assert abs(canyon.street_width_m - 12.0) < 0.1
+    assert abs(canyon.canyon_aspect_ratio - 1.0) < 0.05
+    assert canyon.sample_count == 2
+
+
+def test_canyon_ignores_party_walls_and_falls_back() -> None:
+    terrace = [_building(0.0, 10.0, 9.0), _building(10.0, 10.0, 9.0)]
+    canyon = canyon_geometry(terrace)
+    assert canyon.street_width_m == DEFAULT_STREET_WIDTH_M
+    assert canyon.sample_count == 0
+
+
+def test_canyon_by_tile_assigns_buildings_by_centroid() -> None:
+    buildings = [_building(0.0, 20.0, 12.0), _building(32.0, 20.0, 12.0)]
+    tiles = [
+        box(-1.0 * _DEG_PER_M, -1.0, 26.0 * _DEG_PER_M, 1.0),
+        box(26.0 * _DEG_PER_M, -1.0, 100.0 * _DEG_PER_M, 1.0),
+        box(200.0 * _DEG_PER_M, -1.0, 300.0 * _DEG_PER_M, 1.0),
+    ]
+    result = canyon_geometry_by_tile(tiles, buildings)
+    assert abs(result[0].street_width_m - 12.0) < 0.1
+    assert abs(result[1].street_width_m - 12.0) < 0.1
+    assert result[2].sample_count == 0
+
+
+def test_canyon_by_tile_uses_centrelines_like_canyon_geometry() -> None:
+    buildings = [_building(0.0, 20.0, 12.0), _building(32.0, 20.0, 12.0)]
+    centreline = {
+        "type": "Feature",
+        "geometry": mapping(
+            LineString(
+                [(26.0 * _DEG_PER_M, -5.0 * _DEG_PER_M), (26.0 * _DEG_PER_M, 25.0 * _DEG_PER_M)]
+            )
+        ),
+        "properties": {},
+    }
+    tile = box(-1.0 * _DEG_PER_M, -1.0, 60.0 * _DEG_PER_M, 1.0)
+    (by_tile,) = canyon_geometry_by_tile([tile], buildings, [centreline])
+    assert by_tile == canyon_geometry(buildings, [centreline])
+    assert by_tile.sample_count == 3
@@ -5,10 +5,12 @@
 
 from __future__ import annotations
 
+import numpy as np
 from shapely.geometry import box
 
 from astatine_os.data.aoi import AOI
-from astatine_os.features.tiling import tile_aoi
+from astatine_os.data.grid import hilbert_index
+from astatine_os.features.tiling import snapped_tiles, spatial_batches, tile_aoi
 
 
 def test_tiling_produces_multiple_tiles() -> None:
@@ -16,3 +18,33 @@ def test_tiling_produces_multiple_tiles() -> None:
     tiles = tile_aoi(aoi, tile_size_m=300)
     assert len(tiles) >= 4
     assert all(tile.geometry.area > 0 for tile in tiles)
+
+
+def test_snapped_tiles_are_shared_by_overlapping_aois() -> None:
+    west = snapped_tiles(AOI(name="west", geometry=box(29.0, 41.0, 29.02, 41.02)), 300)
+    east = snapped_tiles(AOI(name="east", geometry=box(29.01, 41.0, 29.03, 41.02)), 300)
+    west_ids = {tile.tile_id: tile for tile in west}
+    shared = [tile for tile in east if tile.tile_id in west_ids]
+    assert shared
+    assert all(tile.geometry.equals(west_ids[tile.tile_id].geometry) for tile in shared)
+    assert len(west_ids) == len(west)
+
+
+def test_hilbert_order_visits_neighbouring_cells() -> None:
+    rows, cols = np.mgrid[0:8, 0:8]
+    index = hilbert_index(cols.ravel() + 0.5, rows.ravel() + 0.5, (0.0, 0.0, 8.0, 8.0), order=3)
+    assert sorted(index.tolist()) == list(range(64))
+    order = np.argsort(index)
+    path = np.stack([cols.ravel()[order], rows.ravel()[order]], axis=1)
+    assert np.abs(np.diff(path, axis=0)).sum(axis=1).max() == 1
+
+
+def test_spatial_batches_cover_tiles_once_in_compact_groups() -> None:
+    aoi = AOI(name="test", geometry=box(29.0, 41.0, 29.02, 41.02))
+    tiles = tile_aoi(aoi, tile_size_m=300)
+    batches = spatial_batches(tiles, batch_size=4)
+    assert sorted(idx for batch in batches for idx in batch) == list(range(len(tiles)))
+    assert all(len(batch) <= 4 for batch in batches)
+    first = [tiles[idx].geometry for idx in batches[0]]
+    span = max(g.bounds[2] for g in first) - min(g.bounds[0] for g in first)
+    assert span < 0.01
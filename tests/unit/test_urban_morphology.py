@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for urban morphology features."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from shapely.geometry import box, mapping
+
+from astatine_os.data.aoi import AOI
+from astatine_os.features.urban_morphology import (
+    morphology_features,
+    morphology_features_by_tile,
+)
+
+
+def _building(minx: float, miny: float, size: float, height_m: float) -> dict[str, Any]:
+    geom = box(minx, miny, minx + size, miny + 0.5 * size)
+    return {"type": "Feature", "geometry": mapping(geom), "properties": {"height_m": height_m}}
+
+
+def test_morphology_by_tile_matches_per_tile_features() -> None:
+    tiles = [box(0.0, 0.0, 1.0, 1.0), box(1.0, 0.0, 2.0, 1.0), box(2.0, 0.0, 3.0, 1.0)]
+    buildings = [
+        [_building(0.1, 0.1, 0.3, 9.0), _building(0.5, 0.6, 0.2, 15.0)],
+        [_building(1.2, 0.2, 0.4, 21.0)],
+        [],
+    ]
+    pooled = [feature for group in buildings for feature in group]
+    by_tile = morphology_features_by_tile(tiles, pooled)
+    for idx, tile in enumerate(tiles):
+        expected = morphology_features(AOI(name=str(idx), geometry=tile), buildings[idx])
+        assert by_tile[idx] == pytest.approx(expected)
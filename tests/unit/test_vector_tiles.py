@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for vector tile encoding and PMTiles archives."""
+
+from __future__ import annotations
+
+import gzip
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from shapely.geometry import box
+
+from astatine_os.data.io_tiles import (
+    VectorTilePyramid,
+    encode_mvt_layer,
+    read_pmtiles_tile,
+    write_pmtiles,
+    zxy_to_tileid,
+)
+
+
+def _fields(payload: bytes) -> list[tuple[int, Any]]:
+    """Decode one protobuf message into ``(field, value)`` pairs."""
+    out: list[tuple[int, Any]] = []
+    pos = 0
+
+    def varint() -> int:
+        nonlocal pos
+        value = shift = 0
+        while True:
+            byte = payload[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    while pos < len(payload):
+        key = varint()
+        wire = key & 7
+        if wire == 0:
+            out.append((key >> 3, varint()))
+        elif wire == 1:
+            out.append((key >> 3, struct.unpack("<d", payload[pos : pos + 8])[0]))
+            pos += 8
+        else:
+            size = varint()
+            out.append((key >> 3, payload[pos : pos + size]))
+            pos += size
+    return out
+
+
+def _packed(payload: bytes) -> list[int]:
+    values, value, shift = [], 0, 0
+    for byte in payload:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def _layer(tile: bytes) -> dict[int, list[Any]]:
+    ((number, layer),) = _fields(gzip.decompress(tile) if tile[:2] == b"\x1f\x8b" else tile)
+    assert number == 3
+    grouped: dict[int, list[Any]] = {}
+    for field, value in _fields(layer):
+        grouped.setdefault(field, []).append(value)
+    return grouped
+
+
+def test_tile_ids_follow_pmtiles_hilbert_order() -> None:
+    assert zxy_to_tileid(0, 0, 0) == 0
+    assert [zxy_to_tileid(1, x, y) for x, y in ((0, 0), (0, 1), (1, 1), (1, 0))] == [1, 2, 3, 4]
+    assert sorted(zxy_to_tileid(3, x, y) for x in range(8) for y in range(8)) == list(range(21, 85))
+
+
+def test_mvt_layer_encodes_tables_and_winding() -> None:
+    tile = encode_mvt_layer(
+        "predictions",
+        [box(0, 0, 10, 10), box(0, 0, 0.2, 0.2), box(20, 0, 30, 10)],
+        {"tile_id": ["a", "b", "c"], "score": [0.5, 0.1, 0.5]},
+    )
+    layer = _layer(tile)
+    assert layer[1] == [b"predictions"]
+    assert layer[3] == [b"tile_id", b"score"]
+    assert layer[15] == [2] and layer[5] == [4096]
+    # The collapsed middle feature is dropped and the shared 0.5 is stored once.
+    assert len(layer[2]) == 2 and len(layer[4]) == 3
+    feature = dict(_fields(layer[2][0]))
+    commands = _packed(feature[4])
+    assert commands[0] == (1 << 3) | 1 and commands[3] == (3 << 3) | 2 and commands[-1] == 15
+    deltas = [(v >> 1) ^ -(v & 1) for v in commands[1:3] + commands[4:10]]
+    xs = np.cumsum(deltas[0::2])
+    ys = np.cumsum(deltas[1::2])
+    area = np.dot(xs, np.roll(ys, -1)) - np.dot(np.roll(xs, -1), ys)
+    assert area > 0
+
+
+def test_pyramid_rolls_up_cells_and_round_trips_pmtiles(tmp_path: Path) -> None:
+    step = 300.0 / 111_320.0
+    geoms = [
+        box(
+            28.9 + col * step * 1.33,
+            41.0 + row * step,
+            28.9 + (col + 1) * step * 1.33,
+            41.0 + (row + 1) * step,
+        )
+        for row in range(10)
+        for col in range(10)
+    ]
+    values = np.linspace(0.0, 1.0, len(geoms))
+    pyramid = VectorTilePyramid(
+        geoms, [f"t{idx}" for idx in range(len(geoms))], {"score": values}, 6, 13
+    )
+    assert 6 < pyramid.detail_zoom <= 13
+    for zoom in range(6, pyramid.detail_zoom):
+        cells = pyramid._cells[zoom]
+        assert cells.count.sum() == len(geoms)
+        assert np.isclose(cells.sums["score"].sum(), values.sum())
+
+    coords = pyramid.tile_coords()
+    assert {z for z, _, _ in coords} == set(range(6, 14))
+    low = _layer(pyramid.encode(*next(c for c in coords if c[0] == 6)))
+    assert b"tile_count" in low[3]
+    high = _layer(pyramid.encode(*coords[-1]))
+    assert b"tile_id" in high[3]
+
+    encoded = pyramid.encode_batch(coords)
+    path = write_pmtiles(
+        tmp_path / "layer.pmtiles",
+        encoded + [(zxy_to_tileid(1, 0, 0), encoded[0][1])],
+        6,
+        13,
+        pyramid.lonlat_bounds,
+        pyramid.metadata(),
+    )
+    header = path.read_bytes()[:127]
+    assert header[:7] == b"PMTiles" and header[7] == 3
+    addressed, entries, contents = struct.unpack("<QQQ", header[72:96])
+    assert addressed == len(encoded) + 1 and contents == len({data for _, data in encoded})
+    assert entries <= addressed
+    for z, x, y in coords[::7]:
+        assert read_pmtiles_tile(path, z, x, y) == pyramid.encode(z, x, y)
+    assert read_pmtiles_tile(path, 1, 0, 0) == encoded[0][1]
+    assert read_pmtiles_tile(path, 2, 0, 0) is None
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (c) 2026 Astatine OS Contributors
+
+"""Unit tests for zonal statistics."""
+
+from __future__ import annotations
+
+import dask.array as da
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from astatine_os.data.grid import RasterGrid
+from astatine_os.features.zonal import (
+    NO_ZONE,
+    _label_block,
+    tile_label_raster,
+    zonal_statistics,
+)
+
+
+def test_label_raster_covers_tiles() -> None:
+    grid = RasterGrid(0.0, 0.0, 4.0, 2.0, width=8, height=4)
+    labels = tile_label_raster([box(0.0, 0.0, 2.0, 2.0), box(2.0, 0.0, 3.0, 2.0)], grid)
+    assert (labels[:, :4] == 0).all()
+    assert (labels[:, 4:6] == 1).all()
+    assert (labels[:, 6:] == NO_ZONE).all()
+
+
+def test_label_block_needs_block_info() -> None:
+    grid = RasterGrid(0.0, 0.0, 4.0, 2.0, width=8, height=4)
+    with pytest.raises(ValueError, match="block_info"):
+        _label_block(np.empty((4, 8), "int32"), np.asarray([box(0, 0, 1, 1)]), None, grid)
+
+
+def test_zonal_statistics_match_masked_numpy() -> None:
+    rng = np.random.default_rng(5)
+    values = rng.normal(size=(30, 40))
+    labels = rng.integers(-1, 4, size=(30, 40)).astype("int32")
+    stats = zonal_statistics(values, labels, 5, quantiles=(25.0, 50.0))
+    for zone in range(4):
+        members = values[labels == zone]
+        assert np.isclose(stats["mean"][zone], members.mean())
+        assert np.isclose(stats["std"][zone], members.std())
+        assert np.isclose(stats["p25"][zone], np.percentile(members, 25.0))
+        assert stats["count"][zone] == members.size
+    assert stats["count"][4] == 0
+    assert np.isnan(stats["mean"][4])
+
+
+def test_zonal_statistics_dask_matches_numpy() -> None:
+    rng = np.random.default_rng(6)
+    values = rng.uniform(size=(50, 50))
+    labels = rng.integers(0, 3, size=(50, 50)).astype("int32")
+    eager = zonal_statistics(values, labels, 3, quantiles=(50.0,))
+    lazy = zonal_statistics(da.from_array(values, chunks=20), labels, 3, quantiles=(50.0,))
+    assert np.allclose(eager["mean"], lazy["mean"])
+    assert np.allclose(eager["p50"], lazy["p50"], atol=1.0 / 256)